@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Benchmarks for jina_ops.
+
+Subcommands:
+- startup: cold-start cost of `import jina_ops` (via `python -X importtime`)
+  and of a `jina_ops.py --help` run, checked against a budget
+- network: throughput and p50/p95/p99 latency of read-url, parallel-read-url
+  and search-bibtex, run in-process against mock_upstream.py (started as a
+  subprocess so its CPU time does not share this process's GIL)
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+JINA_OPS = SCRIPTS_DIR / "jina_ops.py"
+MOCK_UPSTREAM = SCRIPTS_DIR / "mock_upstream.py"
+NETWORK_BENCHMARKS = ("read-url", "parallel-read-url", "search-bibtex")
+STARTUP_BUDGET_MS = 60.0
+# Modules that only specific subcommands need; importing jina_ops must not pull them in.
+HEAVY_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "dataclasses",
+    "http.client",
+    "http.server",
+    "jina_transport",
+    "sqlite3",
+    "ssl",
+    "urllib.request",
+)
+
+
+def _bench_env(pycache_prefix: str) -> dict[str, str]:
+    env = dict(os.environ)
+    # Measure the steady state agents see: bytecode cached, not recompiled.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SCRIPTS_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Map module name -> cumulative import time in microseconds."""
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        cumulative[parts[2].strip()] = int(parts[1].strip())
+    return cumulative
+
+
+def _import_once(env: dict[str, str]) -> dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import jina_ops"],
+        cwd=SCRIPTS_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def measure_startup(runs: int = 5) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        env = _bench_env(pycache_prefix)
+        _import_once(env)  # warm-up writes the bytecode cache
+
+        import_ms: list[float] = []
+        heavy: set[str] = set()
+        for _ in range(runs):
+            modules = _import_once(env)
+            import_ms.append(modules.get("jina_ops", 0) / 1000)
+            heavy.update(name for name in HEAVY_MODULES if name in modules)
+
+        cli_ms: list[float] = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, str(JINA_OPS), "--help"],
+                env=env,
+                capture_output=True,
+                check=True,
+            )
+            cli_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "runs": runs,
+        "importMs": {"min": round(min(import_ms), 2), "median": round(statistics.median(import_ms), 2)},
+        "cliHelpMs": {"min": round(min(cli_ms), 2), "median": round(statistics.median(cli_ms), 2)},
+        "heavyModules": sorted(heavy),
+    }
+
+
+def _cmd_startup(args: argparse.Namespace) -> int:
+    report = measure_startup(args.runs)
+    report["budgetMs"] = args.budget_ms
+    over_budget = report["importMs"]["min"] > args.budget_ms
+    report["ok"] = not over_budget and not report["heavyModules"]
+    print(json.dumps(report, indent=2))
+    return 0 if report["ok"] else 1
+
+
+def latency_summary(samples_ms: list[float]) -> dict[str, float]:
+    """Nearest-rank p50/p95/p99 and max, in milliseconds."""
+    if not samples_ms:
+        return {}
+    ordered = sorted(samples_ms)
+
+    def rank(fraction: float) -> float:
+        index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+        return round(ordered[index], 2)
+
+    return {"p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99), "max": round(ordered[-1], 2)}
+
+
+def run_load(call: Callable[[int], Any], requests: int, concurrency: int) -> dict[str, Any]:
+    """Run call(0..requests-1) on `concurrency` threads; failed calls count as errors."""
+    import concurrent.futures
+
+    def timed(index: int) -> float:
+        start = time.perf_counter()
+        call(index)
+        return (time.perf_counter() - start) * 1000
+
+    latencies: list[float] = []
+    errors = 0
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(timed, index) for index in range(requests)]:
+            try:
+                latencies.append(future.result())
+            except Exception:  # noqa: BLE001 - any failure is one errored request
+                errors += 1
+    wall = time.perf_counter() - start
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "wallSec": round(wall, 3),
+        "throughputPerSec": round(len(latencies) / wall, 2) if wall > 0 else 0.0,
+        "latencyMs": latency_summary(latencies),
+    }
+
+
+@contextlib.contextmanager
+def mock_upstream(args: argparse.Namespace) -> Iterator[dict[str, str]]:
+    """Start mock_upstream.py and yield the JINA_OPS_* overrides pointing at it."""
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(MOCK_UPSTREAM),
+            "--latency-ms", str(args.latency_ms),
+            "--jitter-ms", str(args.jitter_ms),
+            "--error-rate", str(args.error_rate),
+            "--page-bytes", str(args.page_bytes),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        ready = proc.stdout.readline() if proc.stdout else ""
+        if not ready:
+            raise RuntimeError("mock_upstream.py exited before it was ready")
+        yield json.loads(ready)["env"]
+    finally:
+        proc.terminate()
+        proc.wait(timeout=5)
+
+
+def _import_jina_ops(env: dict[str, str]) -> Any:
+    """jina_ops with its endpoints read from `env` (they are resolved at import)."""
+    import importlib
+
+    os.environ.update(env)
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    if "jina_ops" in sys.modules:
+        return importlib.reload(sys.modules["jina_ops"])
+    return importlib.import_module("jina_ops")
+
+
+def measure_network(args: argparse.Namespace) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "mock": {
+            "latencyMs": args.latency_ms,
+            "jitterMs": args.jitter_ms,
+            "errorRate": args.error_rate,
+            "pageBytes": args.page_bytes,
+        },
+        "benchmarks": {},
+    }
+    with mock_upstream(args) as env:
+        jina_ops = _import_jina_ops(env)
+        calls: dict[str, Callable[[Any, int], Any]] = {
+            "read-url": lambda client, index: client.read_url(f"https://bench.example/{index}"),
+            "parallel-read-url": lambda client, index: client.parallel_read_url(
+                [f"https://bench.example/{index}/{item}" for item in range(args.batch_size)]
+            ),
+            "search-bibtex": lambda client, index: client.search_bibtex(f"bench query {index}", num=args.num),
+        }
+        for name in args.benchmark or NETWORK_BENCHMARKS:
+            # A fresh client per benchmark, caches off, so every call reaches the mock.
+            with jina_ops.JinaClient(cache=False, timeout=args.timeout) as client:
+                call = calls[name]
+                call(client, -1)  # warm-up: connection setup is not what is measured here
+                result = run_load(lambda index: call(client, index), args.requests, args.concurrency)
+            if name == "parallel-read-url":
+                result["urlsPerSec"] = round(result["throughputPerSec"] * args.batch_size, 2)
+            report["benchmarks"][name] = result
+    return report
+
+
+def _cmd_network(args: argparse.Namespace) -> int:
+    print(json.dumps(measure_network(args), indent=2))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="jina_ops benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    startup = subparsers.add_parser("startup", help="Measure import and CLI cold-start time")
+    startup.add_argument("--runs", type=int, default=5)
+    startup.add_argument(
+        "--budget-ms",
+        type=float,
+        default=STARTUP_BUDGET_MS,
+        help=f"Fail when the fastest `import jina_ops` exceeds this (default: {STARTUP_BUDGET_MS:g})",
+    )
+    startup.set_defaults(handler=_cmd_startup)
+
+    network = subparsers.add_parser(
+        "network",
+        help="Throughput and p50/p95/p99 latency against the local mock upstream",
+    )
+    network.add_argument(
+        "--benchmark",
+        action="append",
+        choices=NETWORK_BENCHMARKS,
+        help="Benchmark to run (repeatable; default: all)",
+    )
+    network.add_argument("--requests", type=int, default=200, help="Calls per benchmark (default: 200)")
+    network.add_argument("--concurrency", type=int, default=8, help="Calls in flight (default: 8)")
+    network.add_argument("--batch-size", type=int, default=10, help="URLs per parallel-read-url call")
+    network.add_argument("--num", type=int, default=50, help="search-bibtex --num (default: 50)")
+    network.add_argument("--latency-ms", type=float, default=20.0, help="Mock response delay (default: 20)")
+    network.add_argument("--jitter-ms", type=float, default=10.0, help="Mock random extra delay (default: 10)")
+    network.add_argument("--error-rate", type=float, default=0.0, help="Fraction of mock 503s (default: 0)")
+    network.add_argument("--page-bytes", type=int, default=16 * 1024, help="Mock page content size")
+    network.add_argument("--timeout", type=float, default=30.0)
+    network.set_defaults(handler=_cmd_network)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,40 +7,668 @@ Supported operations:
 - search-arxiv
 - search-ssrn
 - search-bibtex
+- crawl
+
+The same operations are available in-process through `JinaClient`.
 """
 
 from __future__ import annotations
 
-import argparse
-import concurrent.futures
+import contextlib
+import fnmatch
+import functools
+import itertools
 import json
+import math
 import os
 import re
+import string
 import sys
-from dataclasses import dataclass
-from typing import Any
-from urllib import error as urlerror
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 from urllib import parse as urlparse
-from urllib import request as urlrequest
 
-R_JINA_API = "https://r.jina.ai/"
-SVIP_JINA_API = "https://svip.jina.ai/"
-DBLP_API = "https://dblp.org/search/publ/api"
-SEMANTIC_SCHOLAR_API = "https://api.semanticscholar.org/graph/v1/paper/search"
+# Everything below is imported on first use instead: agents run this script
+# hundreds of times per session, mostly for work that needs only part of it.
+# bench_jina_ops.py startup measures the cost; the tests enforce a budget.
+if TYPE_CHECKING:
+    import argparse
+    import concurrent.futures
+    import http.server
+    from urllib import request as urlrequest
+
+    from jina_transport import RateLimiter, Transport
+
+# Upstream endpoints; the JINA_OPS_* variables point them elsewhere (e.g. at mock_upstream.py).
+R_JINA_API = os.environ.get("JINA_OPS_R_JINA_API") or "https://r.jina.ai/"
+SVIP_JINA_API = os.environ.get("JINA_OPS_SVIP_JINA_API") or "https://svip.jina.ai/"
+DBLP_API = os.environ.get("JINA_OPS_DBLP_API") or "https://dblp.org/search/publ/api"
+SEMANTIC_SCHOLAR_PAPER_API = (
+    os.environ.get("JINA_OPS_SEMANTIC_SCHOLAR_API") or "https://api.semanticscholar.org/graph/v1/paper/"
+).rstrip("/") + "/"
+SEMANTIC_SCHOLAR_API = f"{SEMANTIC_SCHOLAR_PAPER_API}search"
+SEMANTIC_SCHOLAR_BATCH_API = f"{SEMANTIC_SCHOLAR_PAPER_API}batch"
+SEMANTIC_SCHOLAR_FIELDS = "title,authors,year,venue,externalIds,abstract,citationCount,url"
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500  # /paper/batch accepts at most 500 ids per request
+SEMANTIC_SCHOLAR_LINKS_LIMIT = 1000  # /paper/{id}/references|citations page size cap
+CITATION_DIRECTIONS = ("references", "citations")
+DEFAULT_ENDPOINT_RATE = 1.0
 DEFAULT_USER_AGENT = "ok-jina-skill/0.1"
 USER_AGENT_ENV = "JINA_USER_AGENT"
+CACHE_DIR_ENV = "JINA_OPS_CACHE_DIR"
+CACHE_DB_NAME = "cache.sqlite3"
+DEFAULT_NEGATIVE_TTL = 600.0
+DEFAULT_READ_CACHE_MAX_ENTRIES = 20000
+DEFAULT_READ_CACHE_MAX_AGE = 30 * 86400.0
+DEFAULT_SEARCH_CACHE_TTL = 86400.0
+DEFAULT_SEARCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_CHUNK_TTL = 7 * 86400.0
+ACCEPT_ENCODING = "gzip, deflate"
+READ_CHUNK_SIZE = 64 * 1024
+ERROR_BODY_LIMIT = 4096
+SERVER_FILE_NAME = "server.json"
+SERVER_CONNECT_TIMEOUT = 1.0
+RPC_METHODS = frozenset(
+    {
+        "read_url",
+        "parallel_read_url",
+        "search_arxiv",
+        "search_ssrn",
+        "search_many",
+        "search_bibtex",
+        "enrich_bibtex",
+        "citation_graph",
+        "read_chunk",
+    }
+)
+MAX_SEARCH_WORKERS = 4
+# search-bibtex backends: one page holds up to SEARCH_PAGE_SIZE hits; larger
+# --num values fetch further pages concurrently (at most MAX_PAGE_WORKERS in flight).
+SEARCH_PAGE_SIZE = 100
+MAX_PAGE_WORKERS = 4
+DBLP_MAX_RESULTS = 10000
+SEMANTIC_SCHOLAR_MAX_RESULTS = 1000  # /paper/search rejects offset + limit > 1000
+DOI_PATTERN = re.compile(r"^10\.\d{4,9}/\S+$")
+BARE_ARXIV_ID_PATTERN = re.compile(r"^(?:\d{4}\.\d{4,5}|[a-z][a-z.-]*/\d{7})(?:v\d+)?$", re.IGNORECASE)
+BIB_ENTRY_HEADER = re.compile(r"^\s*@(\w+)\s*[{(]\s*([^,\s]+)\s*,")
+BIB_ID_FIELD = re.compile(r"^\s*(doi|eprint)\s*=\s*[{\"]\s*([^}\"]+?)\s*[}\"]", re.IGNORECASE)
+ARXIV_ID_PATTERN = re.compile(r"arxiv\.org/(?:abs|pdf)/([^?#]+?)(?:v\d+)?(?:\.pdf)?/?(?:[?#]|$)", re.IGNORECASE)
+# Query parameters that only track the click and never change the page.
+TRACKING_PARAMS = frozenset(
+    {
+        "dclid",
+        "fbclid",
+        "gclid",
+        "gclsrc",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "mkt_tok",
+        "msclkid",
+        "ref_src",
+        "yclid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+    }
+)
+TRACKING_PARAM_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+MARKDOWN_HEADING = re.compile(r"^#{1,6}[ \t]+(.+?)[ \t#]*$")
+METRICS_FILE_ENV = "JINA_OPS_METRICS_FILE"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_HELP = {
+    "jina_ops_requests_total": ("counter", "HTTP requests sent, by upstream endpoint."),
+    "jina_ops_request_errors_total": ("counter", "Failed HTTP requests, by endpoint and HTTP status."),
+    "jina_ops_bytes_received_total": ("counter", "Response bytes read off the wire (before decompression)."),
+    "jina_ops_bytes_decoded_total": ("counter", "Response bytes after decompression."),
+    "jina_ops_cache_lookups_total": ("counter", "Cache lookups, by cache and result (hit/revalidated/miss/negative)."),
+    "jina_ops_operation_duration_seconds": ("histogram", "Latency of jina_ops operations in seconds."),
+}
+NEGATIVE_CACHE_THRESHOLD = 2
+# Auth/quota failures say nothing about the URL itself.
+NON_URL_FAILURE_STATUSES = {401, 403, 429}
+# Hedged reads: wait for this many completions before trusting the p95,
+# never hedge sooner than HEDGE_MIN_DELAY, and hedge at most this share of a batch.
+HEDGE_MIN_SAMPLES = 5
+HEDGE_MIN_DELAY = 0.25
+HEDGE_MAX_FRACTION = 0.1
+DEADLINE_POLL_INTERVAL = 0.05
+
+T = TypeVar("T")
 
 
 class JinaOpsError(Exception):
     """Expected operational error."""
 
+    def __init__(self, message: str, *, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
 
-@dataclass(frozen=True)
-class CliResult:
-    payload: dict[str, Any]
+class HttpResponse(NamedTuple):
+    status: int
+    headers: dict[str, str]
+    data: dict[str, Any]
+
+
+class CliResult(NamedTuple):
+    payload: dict[str, Any] | None  # None: the handler already wrote its output
     exit_code: int = 0
 
 
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait and receive the same result (or exception). Results are
+    mutable, so waiters get `clone(result)` when given, never the leader's
+    object. Keys must name everything that changes the result (including the
+    transport and cache the call goes through); the timeout is deliberately
+    left out, so waiters share the leader's deadline.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T], clone: Callable[[T], T] | None = None) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if clone is None else clone(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+
+_INFLIGHT = _SingleFlight()
+
+
+def _default_cache_dir() -> Path:
+    configured = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", "").strip()
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "ok-jina"
+
+
+class _CacheStore:
+    """SQLite-backed store shared by the jina_ops caches.
+
+    One connection is shared across worker threads behind a lock; WAL mode
+    lets concurrent agent sessions use the same file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        import sqlite3
+
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, "
+                "etag TEXT, last_modified TEXT, body TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS failures ("
+                "key TEXT PRIMARY KEY, count INTEGER NOT NULL, "
+                "last_failure REAL NOT NULL, last_error TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS pages_stored_at ON pages (stored_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS failures_last_failure ON failures (last_failure)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, "
+                "size INTEGER NOT NULL, body BLOB NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS searches_stored_at ON searches (stored_at)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "doc TEXT NOT NULL, idx INTEGER NOT NULL, count INTEGER NOT NULL, "
+                "stored_at REAL NOT NULL, url TEXT, heading TEXT, body TEXT NOT NULL, "
+                "PRIMARY KEY (doc, idx))"
+            )
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params).fetchall()
+
+    def executemany(self, sql: str, rows: Iterable[tuple[Any, ...]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SearchPage(NamedTuple):
+    entries: list[BibEntry]
+    hits: int  # raw hits on the page, before the --year filter
+    total: int | None
+
+
+class SearchResults(NamedTuple):
+    entries: list[BibEntry]
+    complete: bool  # False when a later page failed and the entries are a prefix
+
+
+class CachedPage(NamedTuple):
+    stored_at: float
+    etag: str | None
+    last_modified: str | None
+    result: dict[str, Any]
+
+
+class _ReadCache:
+    """read-url cache with conditional revalidation and negative caching.
+
+    Entries younger than `ttl` are served directly. Older entries are
+    revalidated with If-None-Match / If-Modified-Since and reused on 304.
+    URLs that failed `NEGATIVE_CACHE_THRESHOLD` times in a row are skipped
+    for `negative_ttl` seconds. On every write, pages and failure records
+    older than `max_age` are dropped and only the newest `max_entries` of
+    each are kept.
+    """
+
+    def __init__(
+        self,
+        store: _CacheStore,
+        *,
+        ttl: float = 0.0,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        max_entries: int = DEFAULT_READ_CACHE_MAX_ENTRIES,
+        max_age: float = DEFAULT_READ_CACHE_MAX_AGE,
+    ) -> None:
+        self.store = store
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+    def _prune(self, table: str, time_column: str) -> None:
+        self.store.execute(f"DELETE FROM {table} WHERE {time_column} < ?", (time.time() - self.max_age,))
+        self.store.execute(
+            f"DELETE FROM {table} WHERE key IN ("
+            f"SELECT key FROM (SELECT key, ROW_NUMBER() OVER (ORDER BY {time_column} DESC, key) AS n "
+            f"FROM {table}) WHERE n > ?)",
+            (self.max_entries,),
+        )
+
+    def get(self, key: str) -> CachedPage | None:
+        rows = self.store.execute(
+            "SELECT stored_at, etag, last_modified, body FROM pages WHERE key = ?",
+            (key,),
+        )
+        if not rows:
+            return None
+        stored_at, etag, last_modified, body = rows[0]
+        try:
+            result = json.loads(body)
+        except json.JSONDecodeError:
+            return None
+        return CachedPage(stored_at, etag, last_modified, result)
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return self.ttl > 0 and time.time() - page.stored_at < self.ttl
+
+    def put(self, key: str, result: dict[str, Any], headers: dict[str, str]) -> None:
+        self.store.execute(
+            "INSERT OR REPLACE INTO pages (key, stored_at, etag, last_modified, body) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                time.time(),
+                headers.get("etag"),
+                headers.get("last-modified"),
+                json.dumps(result, ensure_ascii=False),
+            ),
+        )
+        self.store.execute("DELETE FROM failures WHERE key = ?", (key,))
+        self._prune("pages", "stored_at")
+
+    def touch(self, key: str) -> None:
+        self.store.execute("UPDATE pages SET stored_at = ? WHERE key = ?", (time.time(), key))
+        self.store.execute("DELETE FROM failures WHERE key = ?", (key,))
+
+    def check_negative(self, key: str) -> None:
+        rows = self.store.execute(
+            "SELECT count, last_failure, last_error FROM failures WHERE key = ?",
+            (key,),
+        )
+        if not rows:
+            return
+        count, last_failure, last_error = rows[0]
+        remaining = self.negative_ttl - (time.time() - last_failure)
+        if count >= NEGATIVE_CACHE_THRESHOLD and remaining > 0:
+            raise JinaOpsError(
+                f"Skipped after {count} consecutive failures "
+                f"(negative cache, retry in {int(remaining) + 1}s): {last_error}"
+            )
+
+    def record_failure(self, key: str, exc: JinaOpsError) -> None:
+        """Count an upstream HTTP error against `key`.
+
+        Errors without a status (network errors, timeouts, --max-bytes aborts,
+        undecodable bodies) say nothing about the URL and are not recorded.
+        """
+        if exc.status is None or exc.status in NON_URL_FAILURE_STATUSES:
+            return
+        self.store.execute(
+            "INSERT INTO failures (key, count, last_failure, last_error) VALUES (?, 1, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET count = count + 1, "
+            "last_failure = excluded.last_failure, last_error = excluded.last_error",
+            (key, time.time(), str(exc)),
+        )
+        self._prune("failures", "last_failure")
+
+
+def _is_relative_tbs(tbs: str | None) -> bool:
+    """Whether `tbs` is a window relative to now (`qdr:d` = past day), not a fixed range."""
+    return bool(tbs) and tbs.strip().lower().startswith("qdr:")
+
+
+class _SearchCache:
+    """Search responses keyed on their normalized request parameters.
+
+    Bodies are stored as zlib-compressed JSON. Entries older than `ttl` are
+    ignored (there is nothing to revalidate a search against), and once the
+    stored bodies exceed `max_bytes` the oldest entries are evicted.
+    """
+
+    def __init__(self, store: _CacheStore, *, ttl: float, max_bytes: int) -> None:
+        self.store = store
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(kind: str, **params: Any) -> str:
+        normalized = {
+            name: " ".join(value.split()).casefold() if isinstance(value, str) else value
+            for name, value in params.items()
+            if value is not None
+        }
+        return json.dumps([kind, normalized], sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+    def get(self, key: str) -> Any:
+        rows = self.store.execute(
+            "SELECT body FROM searches WHERE key = ? AND stored_at > ?",
+            (key, time.time() - self.ttl),
+        )
+        if not rows:
+            return None
+        try:
+            return json.loads(zlib.decompress(rows[0][0]))
+        except (zlib.error, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+    def put(self, key: str, result: Any) -> None:
+        body = zlib.compress(json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        self.store.execute(
+            "INSERT OR REPLACE INTO searches (key, stored_at, size, body) VALUES (?, ?, ?, ?)",
+            (key, time.time(), len(body), body),
+        )
+        self.store.execute(
+            "DELETE FROM searches WHERE key IN ("
+            "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY stored_at DESC, key) AS total "
+            "FROM searches) WHERE total > ?)",
+            (self.max_bytes,),
+        )
+
+
+class _ChunkStore:
+    """Chunks of large pages, so callers can read them one at a time.
+
+    Chunk ids are `<doc>:<index>`, where `doc` hashes the page URL and
+    content: rereading an unchanged page yields the same ids. Documents
+    older than `ttl` are dropped whenever a new one is stored.
+    """
+
+    def __init__(self, store: _CacheStore, *, ttl: float = DEFAULT_CHUNK_TTL) -> None:
+        self.store = store
+        self.ttl = ttl
+
+    @staticmethod
+    def doc_id(url: str, content: str) -> str:
+        import hashlib
+
+        return hashlib.sha256(f"{url}\n{content}".encode("utf-8")).hexdigest()[:16]
+
+    def put(self, doc: str, url: str | None, chunks: list[tuple[str | None, str]]) -> None:
+        now = time.time()
+        self.store.execute("DELETE FROM chunks WHERE stored_at < ?", (now - self.ttl,))
+        self.store.executemany(
+            "INSERT OR REPLACE INTO chunks (doc, idx, count, stored_at, url, heading, body) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (doc, index, len(chunks), now, url, heading, body)
+                for index, (heading, body) in enumerate(chunks)
+            ),
+        )
+
+    def get(self, chunk_id: str) -> dict[str, Any]:
+        doc, sep, index_text = chunk_id.strip().rpartition(":")
+        if not sep or not doc or not index_text.isdigit():
+            raise JinaOpsError(f"Invalid chunk id: {chunk_id}")
+        index = int(index_text)
+        rows = self.store.execute(
+            "SELECT count, url, heading, body FROM chunks WHERE doc = ? AND idx = ?",
+            (doc, index),
+        )
+        if not rows:
+            raise JinaOpsError(f"Unknown or expired chunk: {chunk_id} (read the page again)")
+        count, url, heading, body = rows[0]
+        return {
+            "id": f"{doc}:{index}",
+            "url": url,
+            "index": index,
+            "count": count,
+            "heading": heading,
+            "content": body,
+            "next": f"{doc}:{index + 1}" if index + 1 < count else None,
+        }
+
+
+def _open_cache_store() -> _CacheStore | None:
+    import sqlite3
+
+    try:
+        return _CacheStore(_default_cache_dir() / CACHE_DB_NAME)
+    except (OSError, sqlite3.Error):
+        # A cache that cannot be opened must never fail the request itself.
+        return None
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels:
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class _Metrics:
+    """In-process counters and latency histograms for one jina_ops run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        # (name, labels) -> [per-bucket counts..., sum, count]
+        self.histograms: dict[tuple[str, tuple[tuple[str, str], ...]], list[float]] = {}
+
+    def inc(self, name: str, labels: dict[str, str], value: float = 1) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            state = self.histograms.setdefault(key, [0.0] * (len(LATENCY_BUCKETS) + 2))
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def cache_hit_ratio(self) -> float | None:
+        hits = lookups = 0.0
+        with self._lock:
+            for (name, labels), value in self.counters.items():
+                if name != "jina_ops_cache_lookups_total":
+                    continue
+                lookups += value
+                if dict(labels).get("result") in {"hit", "revalidated"}:
+                    hits += value
+        return hits / lookups if lookups else None
+
+    def render_prometheus(self) -> str:
+        """Render in the text exposition format (node_exporter textfile collector)."""
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items())
+        lines: list[str] = []
+        described: set[str] = set()
+
+        def describe(name: str) -> None:
+            if name in described:
+                return
+            described.add(name)
+            kind, help_text = METRIC_HELP.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            describe(name)
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        for (name, labels), state in histograms:
+            describe(name)
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                bucket_labels = labels + (("le", f"{bound:g}"),)
+                lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {state[index]:g}")
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {state[-1]:g}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {state[-2]:.6f}")
+            lines.append(f"{name}_count{_format_labels(labels)} {state[-1]:g}")
+        ratio = self.cache_hit_ratio()
+        if ratio is not None:
+            lines.append("# HELP jina_ops_cache_hit_ratio Share of cache lookups served from cache.")
+            lines.append("# TYPE jina_ops_cache_hit_ratio gauge")
+            lines.append(f"jina_ops_cache_hit_ratio {ratio:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> dict[str, Any]:
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items())
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in counters
+            ],
+            "histograms": [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "buckets": {f"{bound:g}": state[i] for i, bound in enumerate(LATENCY_BUCKETS)},
+                    "sum": round(state[-2], 6),
+                    "count": state[-1],
+                }
+                for (name, labels), state in histograms
+            ],
+            "cacheHitRatio": self.cache_hit_ratio(),
+        }
+
+
+_METRICS: _Metrics | None = None
+
+
+def _timed(operation: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Record the wrapped call's latency in the operation histogram."""
+
+    def decorate(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            metrics = _METRICS
+            if metrics is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = fn(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                metrics.observe(
+                    "jina_ops_operation_duration_seconds",
+                    {"operation": operation, "outcome": outcome},
+                    time.perf_counter() - start,
+                )
+
+        return wrapper
+
+    return decorate
+
+
+def _count_cache_lookup(cache_name: str, result: str) -> None:
+    if _METRICS is not None:
+        _METRICS.inc("jina_ops_cache_lookups_total", {"cache": cache_name, "result": result})
+
+
+def _write_metrics(path: str | None, as_json: bool) -> None:
+    if _METRICS is None:
+        return
+    if as_json:
+        print(json.dumps({"metrics": _METRICS.to_json()}, ensure_ascii=False), file=sys.stderr)
+    if not path:
+        return
+    # Write-then-rename so a textfile collector never scrapes a partial file.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(_METRICS.render_prometheus())
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        print(json.dumps({"error": f"failed to write metrics file: {exc}"}, ensure_ascii=False), file=sys.stderr)
+
+
 def _read_api_key(required: bool) -> str | None:
     token = os.environ.get("JINA_API_KEY")
     token = token.strip() if token else ""
@@ -62,6 +690,133 @@ def _with_default_headers(headers: dict[str, str] | None = None) -> dict[str, st
     return resolved
 
 
+class _RequestTrace:
+    """Phase timings of one HTTP request (perf_counter seconds)."""
+
+    def __init__(self, method: str, url: str) -> None:
+        self.method = method
+        self.url = url
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end: float | None = None
+        self.cursor = self.start
+        self.status: int | None = None
+        self.phases: list[tuple[str, float, float]] = []
+
+    def add_phase(self, name: str, start: float, end: float) -> None:
+        self.phases.append((name, start, end))
+        self.cursor = max(self.cursor, end)
+
+    def mark(self, name: str) -> None:
+        """Record a phase running from the end of the previous one until now."""
+        self.add_phase(name, self.cursor, time.perf_counter())
+
+
+class _Tracer:
+    """Collects request phases and local spans for --trace / --trace-file."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.requests: list[_RequestTrace] = []
+        self.spans: list[tuple[str, int, float, float]] = []
+
+    def add_request(self, trace: _RequestTrace) -> None:
+        with self._lock:
+            self.requests.append(trace)
+
+    def add_span(self, name: str, start: float, end: float) -> None:
+        with self._lock:
+            self.spans.append((name, threading.get_ident(), start, end))
+
+    def _ms(self, start: float, end: float) -> float:
+        return round((end - start) * 1000, 3)
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            requests = list(self.requests)
+            spans = list(self.spans)
+        return {
+            "requests": [
+                {
+                    "method": trace.method,
+                    "url": trace.url,
+                    "status": trace.status,
+                    "totalMs": self._ms(trace.start, trace.end or trace.cursor),
+                    "phasesMs": {name: self._ms(start, end) for name, start, end in trace.phases},
+                }
+                for trace in requests
+            ],
+            "local": [
+                {"name": name, "ms": self._ms(start, end)} for name, _tid, start, end in spans
+            ],
+        }
+
+    def chrome_events(self) -> dict[str, Any]:
+        """Render as Chrome trace-event JSON (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+
+        def event(name: str, cat: str, tid: int, start: float, end: float, args: dict[str, Any]) -> dict[str, Any]:
+            return {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": round((start - self.origin) * 1_000_000, 1),
+                "dur": round((end - start) * 1_000_000, 1),
+                "args": args,
+            }
+
+        with self._lock:
+            requests = list(self.requests)
+            spans = list(self.spans)
+        events: list[dict[str, Any]] = []
+        for trace in requests:
+            args = {"url": trace.url, "status": trace.status}
+            events.append(
+                event(f"{trace.method} {urlparse.urlsplit(trace.url).netloc}", "http", trace.thread_id,
+                      trace.start, trace.end or trace.cursor, args)
+            )
+            for name, start, end in trace.phases:
+                events.append(event(name, "http.phase", trace.thread_id, start, end, args))
+        for name, tid, start, end in spans:
+            events.append(event(name, "local", tid, start, end, {}))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+_TRACER: _Tracer | None = None
+
+
+@contextlib.contextmanager
+def _trace_span(name: str) -> Iterator[None]:
+    """Time a local post-processing step when tracing is enabled."""
+    tracer = _TRACER
+    if tracer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.add_span(name, start, time.perf_counter())
+
+
+_DEFAULT_TRANSPORT: Transport | None = None
+_DEFAULT_TRANSPORT_LOCK = threading.Lock()
+
+
+def _default_transport() -> Transport:
+    """Transport for calls made outside a JinaClient, built on first use."""
+    global _DEFAULT_TRANSPORT
+    with _DEFAULT_TRANSPORT_LOCK:
+        if _DEFAULT_TRANSPORT is None:
+            from jina_transport import Transport
+
+            _DEFAULT_TRANSPORT = Transport()
+        return _DEFAULT_TRANSPORT
+
+
 def _http_json(
     url: str,
     *,
@@ -69,38 +824,190 @@ def _http_json(
     headers: dict[str, str] | None = None,
     payload: dict[str, Any] | None = None,
     timeout: float = 30.0,
+    max_bytes: int | None = None,
+    transport: Transport | None = None,
 ) -> dict[str, Any]:
+    return _http_json_response(
+        url,
+        method=method,
+        headers=headers,
+        payload=payload,
+        timeout=timeout,
+        max_bytes=max_bytes,
+        transport=transport,
+    ).data
+
+
+def _make_decompressor(content_encoding: str) -> Any:
+    encoding = content_encoding.strip().lower()
+    if encoding in {"", "identity"}:
+        return None
+    if encoding in {"gzip", "x-gzip"}:
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        # Auto-detect the zlib (or gzip) wrapper.
+        return zlib.decompressobj(32 + zlib.MAX_WBITS)
+    raise JinaOpsError(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+def _read_body(stream: Any, content_encoding: str, max_bytes: int | None) -> tuple[bytearray, int]:
+    """Read and decompress a response body chunk by chunk.
+
+    Returns the decoded body and the number of bytes read off the wire.
+    Aborts as soon as the decoded size exceeds max_bytes, so oversized or
+    highly compressed bodies are never fully buffered.
+    """
+    decompressor = _make_decompressor(content_encoding)
+    body = bytearray()
+    wire_bytes = 0
+
+    def append(data: bytes) -> None:
+        body.extend(data)
+        if max_bytes is not None and len(body) > max_bytes:
+            raise JinaOpsError(f"Response exceeds --max-bytes limit ({max_bytes} bytes)")
+
+    while True:
+        chunk = stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        wire_bytes += len(chunk)
+        if decompressor is None:
+            append(chunk)
+            continue
+        data = chunk
+        while data:
+            limit = 0 if max_bytes is None else max_bytes - len(body) + 1
+            append(decompressor.decompress(data, limit))
+            data = decompressor.unconsumed_tail
+    if decompressor is not None:
+        try:
+            append(decompressor.flush())
+        except zlib.error as exc:
+            raise JinaOpsError(f"Failed to decompress response: {exc}") from exc
+    return body, wire_bytes
+
+
+def _http_json_response(
+    url: str,
+    *,
+    method: str = "POST",
+    headers: dict[str, str] | None = None,
+    payload: dict[str, Any] | None = None,
+    timeout: float = 30.0,
+    max_bytes: int | None = None,
+    transport: Transport | None = None,
+) -> HttpResponse:
+    """Like _http_json, but keeps status and headers.
+
+    A 304 Not Modified answer (to a conditional request) is returned with
+    empty data instead of being raised.
+    """
     encoded_payload = None
     if payload is not None:
         encoded_payload = json.dumps(payload).encode("utf-8")
+    request_headers = _with_default_headers(headers)
+    if not any(key.lower() == "accept-encoding" for key in request_headers):
+        request_headers["Accept-Encoding"] = ACCEPT_ENCODING
+    from urllib import request as urlrequest
+
     req = urlrequest.Request(
         url=url,
         data=encoded_payload,
-        headers=_with_default_headers(headers),
+        headers=request_headers,
         method=method,
     )
+    trace = _RequestTrace(method, url) if _TRACER is not None else None
+    endpoint = urlparse.urlsplit(url).netloc
+    if _METRICS is not None:
+        _METRICS.inc("jina_ops_requests_total", {"endpoint": endpoint})
+    try:
+        return _perform_request(
+            req,
+            endpoint,
+            trace,
+            transport=transport or _default_transport(),
+            timeout=timeout,
+            max_bytes=max_bytes,
+        )
+    except JinaOpsError as exc:
+        if _METRICS is not None:
+            _METRICS.inc(
+                "jina_ops_request_errors_total",
+                {"endpoint": endpoint, "status": str(exc.status or "error")},
+            )
+        raise
+    finally:
+        if trace is not None and _TRACER is not None:
+            trace.end = time.perf_counter()
+            _TRACER.add_request(trace)
+
+
+def _perform_request(
+    req: urlrequest.Request,
+    endpoint: str,
+    trace: _RequestTrace | None,
+    *,
+    transport: Transport,
+    timeout: float,
+    max_bytes: int | None,
+) -> HttpResponse:
+    from urllib import error as urlerror
+
     try:
-        with urlrequest.urlopen(req, timeout=timeout) as resp:
-            raw = resp.read()
-            body = raw.decode("utf-8")
-            return json.loads(body) if body else {}
+        with transport.open(req, timeout, trace) as resp:
+            if trace is not None:
+                trace.status = resp.status
+                trace.mark("ttfb")
+            response_headers = {key.lower(): value for key, value in resp.headers.items()}
+            content_encoding = response_headers.get("content-encoding", "")
+            declared_length = response_headers.get("content-length", "")
+            if (
+                max_bytes is not None
+                and declared_length.isdigit()
+                and int(declared_length) > max_bytes
+            ):
+                raise JinaOpsError(f"Response exceeds --max-bytes limit ({max_bytes} bytes)")
+            body, wire_bytes = _read_body(resp, content_encoding, max_bytes)
+            if _METRICS is not None:
+                _METRICS.inc("jina_ops_bytes_received_total", {"endpoint": endpoint}, wire_bytes)
+                _METRICS.inc("jina_ops_bytes_decoded_total", {"endpoint": endpoint}, len(body))
+            if trace is not None:
+                trace.mark("body")
+            # isspace() checks for an empty body without copying it (strip() would).
+            data = json.loads(body) if body and not body.isspace() else {}
+            if trace is not None:
+                trace.mark("json_decode")
+            return HttpResponse(status=resp.status, headers=response_headers, data=data)
     except urlerror.HTTPError as exc:
-        details = ""
-        try:
-            raw = exc.read().decode("utf-8")
-            details = raw.strip()
-        except Exception:  # noqa: BLE001
+        if trace is not None:
+            trace.status = exc.code
+            trace.mark("ttfb")
+        with exc:
+            if exc.code == 304:
+                exc.read()
+                return HttpResponse(
+                    status=304,
+                    headers={key.lower(): value for key, value in exc.headers.items()},
+                    data={},
+                )
             details = ""
+            try:
+                raw, _wire_bytes = _read_body(exc, exc.headers.get("Content-Encoding", ""), None)
+                details = bytes(raw[:ERROR_BODY_LIMIT]).decode("utf-8", errors="replace").strip()
+            except Exception:  # noqa: BLE001
+                details = ""
         message = f"HTTP {exc.code} {exc.reason}"
         if details:
             message = f"{message}: {details}"
-        raise JinaOpsError(message) from exc
+        raise JinaOpsError(message, status=exc.code) from exc
     except urlerror.URLError as exc:
         raise JinaOpsError(f"Network error: {exc.reason}") from exc
     except TimeoutError as exc:
         raise JinaOpsError("Request timeout") from exc
-    except json.JSONDecodeError as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise JinaOpsError("Failed to parse JSON response") from exc
+    except zlib.error as exc:
+        raise JinaOpsError(f"Failed to decompress response: {exc}") from exc
 
 
 def _normalize_url(text: str) -> str:
@@ -115,14 +1022,192 @@ def _normalize_url(text: str) -> str:
     return candidate
 
 
+def _is_tracking_param(pair: str) -> bool:
+    name = urlparse.unquote_plus(pair.partition("=")[0]).lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def _canonical_url(text: str) -> str:
+    """URL to fetch: host lowercased, default port, fragment and tracking params dropped."""
+    normalized = _normalize_url(text)
+    parts = urlparse.urlsplit(normalized)
+    scheme = parts.scheme.lower()
+    try:
+        port = parts.port
+    except ValueError as exc:
+        raise JinaOpsError(f"Invalid URL: {text}") from exc
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    userinfo, at, _ = parts.netloc.rpartition("@")
+    # The path is kept as is: `//` can be meaningful (e.g. /web/2020/https://example.com/).
+    query = "&".join(pair for pair in parts.query.split("&") if pair and not _is_tracking_param(pair))
+    return urlparse.urlunsplit((scheme, f"{userinfo}{at}{host}", parts.path or "/", query, ""))
+
+
+def _mirror_key(canonical: str) -> str:
+    """Key shared by http/https, www./bare host, trailing-slash, duplicate-slash and param-order variants.
+
+    Only used to group URLs; the URL that is fetched keeps its path.
+    """
+    parts = urlparse.urlsplit(canonical)
+    host = parts.netloc.removeprefix("www.")
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+    return f"{host}{path}?{query}"
+
+
+def _collapse_mirrors(outcomes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge successful outcomes whose content is identical; the first keeps all `urls`."""
+    import hashlib
+
+    collapsed: list[dict[str, Any]] = []
+    by_digest: dict[str, dict[str, Any]] = {}
+    for outcome in outcomes:
+        result = outcome.get("result") if outcome["success"] else None
+        content = result.get("content") if isinstance(result, dict) else None
+        if not isinstance(content, str) or not content.strip():
+            collapsed.append(outcome)
+            continue
+        digest = hashlib.sha256(content.strip().encode("utf-8")).hexdigest()
+        first = by_digest.get(digest)
+        if first is None:
+            by_digest[digest] = outcome
+            collapsed.append(outcome)
+        else:
+            first["urls"].extend(url for url in outcome["urls"] if url not in first["urls"])
+    return collapsed
+
+
+def _split_sections(content: str) -> list[tuple[str | None, str]]:
+    """Split markdown at headings outside code fences into (heading, text) pairs."""
+    sections: list[tuple[str | None, str]] = []
+    heading: str | None = None
+    lines: list[str] = []
+    in_fence = False
+    for line in content.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped.startswith(("```", "~~~")):
+            in_fence = not in_fence
+        elif not in_fence and (match := MARKDOWN_HEADING.match(stripped)):
+            if lines:
+                sections.append((heading, "".join(lines)))
+                lines = []
+            heading = match.group(1)
+        lines.append(line)
+    if lines:
+        sections.append((heading, "".join(lines)))
+    return sections
+
+
+def _split_text(text: str, max_chars: int, separators: tuple[str, ...] = ("\n\n", "\n", " ")) -> list[str]:
+    """Pieces of at most `max_chars`, cut at the coarsest separator that fits."""
+    if len(text) <= max_chars:
+        return [text]
+    if not separators:
+        return [text[start:start + max_chars] for start in range(0, len(text), max_chars)]
+    separator, finer = separators[0], separators[1:]
+    parts = text.split(separator)
+    pieces = [part + separator for part in parts[:-1]]
+    if parts[-1]:
+        pieces.append(parts[-1])
+    chunks: list[str] = []
+    current = ""
+    for piece in pieces:
+        for part in _split_text(piece, max_chars, finer):
+            if current and len(current) + len(part) > max_chars:
+                chunks.append(current)
+                current = ""
+            current += part
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _chunk_markdown(content: str, max_chars: int) -> list[tuple[str | None, str]]:
+    """Pack heading sections into (heading, text) chunks of at most `max_chars`.
+
+    A chunk starts at a heading whenever the next section does not fit, and
+    oversized sections are cut at paragraphs, then lines, then words. The
+    chunks concatenate back to `content`; `heading` is that of the section
+    the chunk starts in.
+    """
+    chunks: list[tuple[str | None, str]] = []
+    heading: str | None = None
+    current = ""
+    for section_heading, text in _split_sections(content):
+        for piece in _split_text(text, max_chars):
+            if current and len(current) + len(piece) > max_chars:
+                chunks.append((heading, current))
+                current = ""
+            if not current:
+                heading = section_heading
+            current += piece
+    if current:
+        chunks.append((heading, current))
+    return chunks
+
+
+@_timed("read_url")
 def _read_url(
     url: str,
     *,
     with_all_links: bool,
     with_all_images: bool,
     timeout: float,
+    cache: _ReadCache | None = None,
+    max_bytes: int | None = None,
+    transport: Transport | None = None,
 ) -> dict[str, Any]:
     normalized_url = _normalize_url(url)
+    return _INFLIGHT.do(
+        ("read-url", normalized_url, with_all_links, with_all_images, max_bytes, cache, transport),
+        lambda: _fetch_read_url(
+            normalized_url,
+            with_all_links=with_all_links,
+            with_all_images=with_all_images,
+            timeout=timeout,
+            cache=cache,
+            max_bytes=max_bytes,
+            transport=transport,
+        ),
+        dict,
+    )
+
+
+def _read_cache_key(normalized_url: str, *, with_all_links: bool, with_all_images: bool) -> str:
+    return f"{normalized_url}|links={int(with_all_links)}|images={int(with_all_images)}"
+
+
+def _fetch_read_url(
+    normalized_url: str,
+    *,
+    with_all_links: bool,
+    with_all_images: bool,
+    timeout: float,
+    cache: _ReadCache | None = None,
+    max_bytes: int | None = None,
+    transport: Transport | None = None,
+) -> dict[str, Any]:
+    cache_key = _read_cache_key(
+        normalized_url,
+        with_all_links=with_all_links,
+        with_all_images=with_all_images,
+    )
+    cached: CachedPage | None = None
+    if cache is not None:
+        try:
+            cache.check_negative(cache_key)
+        except JinaOpsError:
+            _count_cache_lookup("read", "negative")
+            raise
+        cached = cache.get(cache_key)
+        if cached is not None and cache.is_fresh(cached):
+            _count_cache_lookup("read", "hit")
+            return cached.result
+
     token = _read_api_key(required=False)
     headers = {
         "Accept": "application/json",
@@ -137,14 +1222,55 @@ def _read_url(
         headers["X-With-Images-Summary"] = "true"
     else:
         headers["X-Retain-Images"] = "none"
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
 
-    data = _http_json(
-        R_JINA_API,
-        method="POST",
-        headers=headers,
-        payload={"url": normalized_url},
-        timeout=timeout,
-    )
+    try:
+        response = _http_json_response(
+            R_JINA_API,
+            method="POST",
+            headers=headers,
+            payload={"url": normalized_url},
+            timeout=timeout,
+            max_bytes=max_bytes,
+            transport=transport,
+        )
+    except JinaOpsError as exc:
+        if cache is not None:
+            cache.record_failure(cache_key, exc)
+        raise
+
+    if response.status == 304:
+        if cached is None:
+            raise JinaOpsError("Unexpected 304 Not Modified without a cached page", status=304)
+        if cache is not None:
+            cache.touch(cache_key)
+        _count_cache_lookup("read", "revalidated")
+        return cached.result
+
+    with _trace_span("structure_read_result"):
+        structured = _structure_read_result(
+            response.data,
+            normalized_url,
+            with_all_links=with_all_links,
+            with_all_images=with_all_images,
+        )
+    if cache is not None:
+        cache.put(cache_key, structured, response.headers)
+        _count_cache_lookup("read", "miss")
+    return structured
+
+
+def _structure_read_result(
+    data: dict[str, Any],
+    normalized_url: str,
+    *,
+    with_all_links: bool,
+    with_all_images: bool,
+) -> dict[str, Any]:
     blob = data.get("data")
     if not isinstance(blob, dict):
         raise JinaOpsError("Unexpected response format: missing data object")
@@ -170,51 +1296,364 @@ def _read_url(
     return structured
 
 
-def _cmd_read_url(args: argparse.Namespace) -> CliResult:
-    result = _read_url(
+def _cmd_read_url(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    result = client.read_url(
         args.url,
         with_all_links=args.with_all_links,
         with_all_images=args.with_all_images,
         timeout=args.timeout,
+        max_bytes=args.max_bytes,
+        max_chars=args.max_chars,
     )
     return CliResult(payload={"result": result})
 
 
-def _cmd_parallel_read_url(args: argparse.Namespace) -> CliResult:
-    unique_urls: list[str] = []
-    seen: set[str] = set()
-    for raw in args.url:
-        normalized = _normalize_url(raw)
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        unique_urls.append(normalized)
-    if not unique_urls:
-        raise JinaOpsError("At least one URL is required")
+def _cmd_read_chunk(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    return CliResult(payload={"result": client.read_chunk(args.id)})
 
-    results: list[dict[str, Any]] = []
-    max_workers = min(len(unique_urls), 5)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_map = {
-            executor.submit(
-                _read_url,
-                url,
-                with_all_links=args.with_all_links,
-                with_all_images=args.with_all_images,
-                timeout=args.timeout,
-            ): url
-            for url in unique_urls
-        }
-        for future in concurrent.futures.as_completed(future_map, timeout=args.timeout):
-            url = future_map[future]
+
+class _ReadAttempt:
+    __slots__ = ("url", "hedge", "started")
+
+    def __init__(self, url: str, hedge: bool) -> None:
+        self.url = url
+        self.hedge = hedge
+        self.started: float | None = None
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _hedge_after_arg(text: str) -> float | str:
+    import argparse
+
+    if text.strip().lower() == "p95":
+        return "p95"
+    try:
+        value = float(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("must be a number of seconds or 'p95'") from exc
+    if value <= 0:
+        raise argparse.ArgumentTypeError("must be positive")
+    return value
+
+
+class _DaemonPool:
+    """Bare executor whose workers are daemon threads.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so a fetch
+    that outlives the batch deadline would keep the CLI from exiting until
+    it returned. Workers here are abandoned instead; their sockets time out
+    on their own.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        import queue
+
+        self.max_workers = max_workers
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> concurrent.futures.Future[T]:
+        import concurrent.futures
+
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        self._queue.put((future, fn, args))
+        with self._lock:
+            if self._threads < self.max_workers:
+                self._threads += 1
+                threading.Thread(target=self._work, daemon=True).start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:  # noqa: BLE001 - handed to the waiter
+                future.set_exception(exc)
+
+    def shutdown(self) -> None:
+        """Cancel queued work and let idle workers exit; running ones are not waited for."""
+        import queue
+
+        while True:
             try:
-                results.append({"url": url, "success": True, "result": future.result()})
-            except Exception as exc:  # noqa: BLE001
-                results.append({"url": url, "success": False, "error": str(exc)})
-    results.sort(key=lambda item: item["url"])
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        for _ in range(self._threads):
+            self._queue.put(None)
+
+
+def _read_urls_with_deadlines(
+    urls: list[str],
+    fetch: Callable[[str, bool], dict[str, Any]],
+    *,
+    url_timeout: float,
+    batch_timeout: float | None,
+    hedge_after: float | str | None,
+    max_workers: int,
+) -> list[dict[str, Any]]:
+    """Read `urls` concurrently, returning whatever finished by the deadlines.
+
+    Each URL gets `url_timeout` seconds from the moment its fetch starts; the
+    whole batch stops at `batch_timeout`. Stragglers are reported with
+    `timedOut: true` instead of failing the batch. With `hedge_after`, a URL
+    still running after that many seconds (or after the batch's observed p95
+    latency) gets one duplicate request and the first answer wins.
+    """
+    import concurrent.futures
+
+    batch_start = time.monotonic()
+    batch_deadline = batch_start + batch_timeout if batch_timeout is not None else None
+    hedge_budget = max(1, math.ceil(len(urls) * HEDGE_MAX_FRACTION)) if hedge_after is not None else 0
+    latencies: list[float] = []
+    outcomes: dict[str, dict[str, Any]] = {}
+    running: dict[concurrent.futures.Future[dict[str, Any]], _ReadAttempt] = {}
+    attempts: dict[str, list[_ReadAttempt]] = {url: [] for url in urls}
+
+    def run(attempt: _ReadAttempt) -> dict[str, Any]:
+        attempt.started = time.monotonic()
+        return fetch(attempt.url, attempt.hedge)
+
+    def submit(executor: _DaemonPool, url: str, hedge: bool) -> None:
+        attempt = _ReadAttempt(url, hedge)
+        attempts[url].append(attempt)
+        running[executor.submit(run, attempt)] = attempt
+
+    def hedge_delay() -> float | None:
+        if hedge_after is None or hedge_budget <= 0:
+            return None
+        if hedge_after != "p95":
+            return float(hedge_after)
+        if len(latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        return max(HEDGE_MIN_DELAY, _percentile(latencies, 0.95))
+
+    primary = _DaemonPool(max_workers)
+    hedges = _DaemonPool(max_workers)
+    try:
+        for url in urls:
+            submit(primary, url, hedge=False)
+
+        while len(outcomes) < len(urls):
+            now = time.monotonic()
+            if batch_deadline is not None and now >= batch_deadline:
+                for url in urls:
+                    if url not in outcomes:
+                        outcomes[url] = {
+                            "url": url,
+                            "success": False,
+                            "timedOut": True,
+                            "error": f"batch deadline of {batch_timeout:g}s exceeded",
+                        }
+                break
+
+            delay = hedge_delay()
+            wake_at = [batch_deadline] if batch_deadline is not None else []
+            for url, url_attempts in attempts.items():
+                if url in outcomes:
+                    continue
+                started = [a.started for a in url_attempts if a.started is not None]
+                if not started:
+                    continue
+                first_start = min(started)
+                if now - first_start >= url_timeout:
+                    outcomes[url] = {
+                        "url": url,
+                        "success": False,
+                        "timedOut": True,
+                        "error": f"deadline of {url_timeout:g}s exceeded",
+                    }
+                    continue
+                wake_at.append(first_start + url_timeout)
+                if delay is not None and len(url_attempts) == 1:
+                    if now - first_start >= delay:
+                        submit(hedges, url, hedge=True)
+                        hedge_budget -= 1
+                        delay = hedge_delay()
+                    else:
+                        wake_at.append(first_start + delay)
+            if len(outcomes) == len(urls):
+                break
+
+            pending = [f for f, a in running.items() if a.url not in outcomes]
+            if not pending:
+                continue
+            # Queued fetches have no start time yet; poll so their deadlines start on time.
+            timeout = min(wake_at, default=now + DEADLINE_POLL_INTERVAL) - now
+            done, _ = concurrent.futures.wait(
+                pending,
+                timeout=max(0.0, min(timeout, DEADLINE_POLL_INTERVAL)),
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                attempt = running.pop(future)
+                if attempt.url in outcomes:
+                    continue
+                hedged = len(attempts[attempt.url]) > 1
+                try:
+                    result = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    siblings = [f for f, a in running.items() if a.url == attempt.url]
+                    if siblings:
+                        continue
+                    outcome: dict[str, Any] = {"url": attempt.url, "success": False, "error": str(exc)}
+                else:
+                    if attempt.started is not None:
+                        latencies.append(time.monotonic() - attempt.started)
+                    outcome = {"url": attempt.url, "success": True, "result": result}
+                if hedged:
+                    outcome["hedged"] = True
+                    outcome["hedgeWon"] = attempt.hedge
+                outcomes[attempt.url] = outcome
+    finally:
+        # Do not wait for stragglers, here or at interpreter exit.
+        primary.shutdown()
+        hedges.shutdown()
+
+    return [outcomes[url] for url in urls]
+
+
+def _cmd_parallel_read_url(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    results = client.parallel_read_url(
+        args.url,
+        with_all_links=args.with_all_links,
+        with_all_images=args.with_all_images,
+        timeout=args.timeout,
+        batch_timeout=args.batch_timeout,
+        hedge_after=args.hedge_after,
+        max_bytes=args.max_bytes,
+        max_chars=args.max_chars,
+        keep_duplicates=args.keep_duplicates,
+    )
     return CliResult(payload={"results": results})
 
 
+def _origin(url: str) -> str:
+    parts = urlparse.urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _frontier_url(url: str) -> str:
+    """Frontier key: normalized, without fragment, `https://host` -> `https://host/`."""
+    parts = urlparse.urlsplit(urlparse.urldefrag(_normalize_url(url))[0])
+    return urlparse.urlunsplit(parts._replace(path=parts.path or "/"))
+
+
+def _crawl_candidate(base_url: str, link: Any) -> str | None:
+    """Frontier URL for an http(s) link, or None to skip it."""
+    if not isinstance(link, str) or not link.strip():
+        return None
+    absolute = urlparse.urljoin(base_url, link.strip())
+    if urlparse.urlsplit(absolute).scheme.lower() not in {"http", "https"}:
+        return None
+    try:
+        return _frontier_url(absolute)
+    except JinaOpsError:
+        return None
+
+
+def _crawl(
+    seeds: Iterable[str],
+    fetch: Callable[[str], dict[str, Any]],
+    *,
+    max_depth: int,
+    max_pages: int,
+    same_origin: bool,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    concurrency: int = 5,
+) -> Iterator[dict[str, Any]]:
+    """Breadth-first crawl over read-url link summaries, yielding pages as they finish.
+
+    Pages are fetched as soon as they are discovered rather than one depth
+    level at a time, so a slow page never holds up the rest of the frontier.
+    Seeds are always fetched; discovered links must pass the origin and
+    include/exclude glob scope. At most `max_pages` URLs are ever queued.
+    """
+    import concurrent.futures
+
+    frontier: deque[tuple[str, int, str | None]] = deque()
+    seen: set[str] = set()
+    for raw in seeds:
+        url = _frontier_url(raw)
+        if url not in seen and len(seen) < max_pages:
+            seen.add(url)
+            frontier.append((url, 0, None))
+    if not frontier:
+        raise JinaOpsError("At least one seed URL is required")
+    origins = {_origin(url) for url, _depth, _parent in frontier}
+
+    def in_scope(url: str) -> bool:
+        if same_origin and _origin(url) not in origins:
+            return False
+        if include and not any(fnmatch.fnmatchcase(url, pattern) for pattern in include):
+            return False
+        return not (exclude and any(fnmatch.fnmatchcase(url, pattern) for pattern in exclude))
+
+    fetched = failed = 0
+    running: dict[concurrent.futures.Future[dict[str, Any]], tuple[str, int, str | None]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while frontier or running:
+            while frontier and len(running) < concurrency:
+                item = frontier.popleft()
+                running[executor.submit(fetch, item[0])] = item
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                url, depth, parent = running.pop(future)
+                record: dict[str, Any] = {"type": "page", "url": url, "depth": depth, "parent": parent}
+                try:
+                    result = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    failed += 1
+                    yield {**record, "success": False, "error": str(exc)}
+                    continue
+                fetched += 1
+                if depth < max_depth:
+                    for link in result.get("links") or []:
+                        if len(seen) >= max_pages:
+                            break
+                        candidate = _crawl_candidate(url, link.get("url") if isinstance(link, dict) else None)
+                        if candidate is None or candidate in seen or not in_scope(candidate):
+                            continue
+                        seen.add(candidate)
+                        frontier.append((candidate, depth + 1, url))
+                yield {**record, "success": True, "result": result}
+
+    yield {"type": "summary", "pages": fetched + failed, "succeeded": fetched, "failed": failed}
+
+
+def _cmd_crawl(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    # NDJSON: one line per page as soon as it is read, then a summary line.
+    for record in client.crawl(
+        args.url,
+        max_depth=args.max_depth,
+        max_pages=args.max_pages,
+        same_origin=args.scope == "same-origin",
+        include=args.include,
+        exclude=args.exclude,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        max_bytes=args.max_bytes,
+    ):
+        print(json.dumps(record, ensure_ascii=False), flush=True)
+    return CliResult(payload=None)
+
+
+@_timed("search_domain")
 def _search_domain(
     *,
     query: str,
@@ -222,6 +1661,30 @@ def _search_domain(
     num: int,
     tbs: str | None,
     timeout: float,
+    transport: Transport | None = None,
+) -> dict[str, Any]:
+    return _INFLIGHT.do(
+        ("search-domain", query, domain, num, tbs, transport),
+        lambda: _fetch_search_domain(
+            query=query,
+            domain=domain,
+            num=num,
+            tbs=tbs,
+            timeout=timeout,
+            transport=transport,
+        ),
+        dict,
+    )
+
+
+def _fetch_search_domain(
+    *,
+    query: str,
+    domain: str,
+    num: int,
+    tbs: str | None,
+    timeout: float,
+    transport: Transport | None = None,
 ) -> dict[str, Any]:
     token = _read_api_key(required=True)
     headers = {
@@ -242,6 +1705,7 @@ def _search_domain(
         headers=headers,
         payload=payload,
         timeout=timeout,
+        transport=transport,
     )
     return {
         "query": query,
@@ -250,28 +1714,85 @@ def _search_domain(
     }
 
 
-def _cmd_search_arxiv(args: argparse.Namespace) -> CliResult:
-    return CliResult(
-        payload=_search_domain(
-            query=args.query,
-            domain="arxiv",
-            num=args.num,
-            tbs=args.tbs,
-            timeout=args.timeout,
-        )
-    )
+def _search_result_key(item: Any) -> str:
+    """Identity of a search hit across queries: arXiv id, else URL, else title."""
+    if not isinstance(item, dict):
+        return json.dumps(item, sort_keys=True, ensure_ascii=False)
+    url = str(item.get("url") or item.get("link") or "").strip()
+    match = ARXIV_ID_PATTERN.search(url)
+    if match:
+        return f"arxiv:{match.group(1).lower()}"
+    if url:
+        parts = urlparse.urlsplit(url)
+        return f"url:{parts.netloc.lower()}{parts.path.rstrip('/')}" + (f"?{parts.query}" if parts.query else "")
+    return f"title:{str(item.get('title') or '').strip().lower()}"
 
 
-def _cmd_search_ssrn(args: argparse.Namespace) -> CliResult:
-    return CliResult(
-        payload=_search_domain(
-            query=args.query,
-            domain="ssrn",
-            num=args.num,
-            tbs=args.tbs,
-            timeout=args.timeout,
-        )
-    )
+def _merge_search_results(domain: str, outcomes: list[tuple[str, dict[str, Any] | Exception]]) -> dict[str, Any]:
+    """Combine per-query results; a hit found by several queries appears once."""
+    results: list[dict[str, Any]] = []
+    positions: dict[str, int] = {}
+    queries: dict[str, dict[str, Any]] = {}
+    for query, outcome in outcomes:
+        if isinstance(outcome, Exception):
+            queries[query] = {"error": str(outcome)}
+            continue
+        indices: list[int] = []
+        for item in outcome.get("results", []):
+            key = _search_result_key(item)
+            position = positions.get(key)
+            if position is None:
+                position = len(results)
+                positions[key] = position
+                merged = dict(item) if isinstance(item, dict) else {"value": item}
+                merged["matchedQueries"] = []
+                results.append(merged)
+            if query not in results[position]["matchedQueries"]:
+                results[position]["matchedQueries"].append(query)
+            indices.append(position)
+        queries[query] = {"count": len(indices), "results": indices}
+    return {"domain": domain, "queries": queries, "results": results}
+
+
+def _read_list_file(path: str, option: str) -> list[str]:
+    """Non-empty, non-comment lines of `path` ('-' reads stdin)."""
+    try:
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = Path(path).expanduser().read_text(encoding="utf-8").splitlines()
+    except OSError as exc:
+        raise JinaOpsError(f"Failed to read {option}: {exc}") from exc
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _read_queries(args: argparse.Namespace) -> list[str]:
+    queries: list[str] = list(args.query or [])
+    if args.query_file:
+        queries.extend(_read_list_file(args.query_file, "--query-file"))
+    unique = list(dict.fromkeys(query.strip() for query in queries if query.strip()))
+    if not unique:
+        raise JinaOpsError("At least one --query or a non-empty --query-file is required")
+    return unique
+
+
+def _cmd_search_domain(client: JinaClient, args: argparse.Namespace, domain: str) -> CliResult:
+    queries = _read_queries(args)
+    if len(queries) == 1:
+        # One query keeps the original single-search payload.
+        search = client.search_arxiv if domain == "arxiv" else client.search_ssrn
+        return CliResult(payload=search(queries[0], num=args.num, tbs=args.tbs, timeout=args.timeout))
+    payload = client.search_many(queries, domain=domain, num=args.num, tbs=args.tbs, timeout=args.timeout)
+    failed = sum(1 for entry in payload["queries"].values() if "error" in entry)
+    return CliResult(payload=payload, exit_code=1 if failed == len(queries) else 0)
+
+
+def _cmd_search_arxiv(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    return _cmd_search_domain(client, args, "arxiv")
+
+
+def _cmd_search_ssrn(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    return _cmd_search_domain(client, args, "ssrn")
 
 
 def _generate_key(title: str, year: int | None) -> str:
@@ -294,7 +1815,7 @@ def _format_authors(authors: list[str]) -> str:
     return " and ".join(authors)
 
 
-def _make_bibtex(entry: dict[str, Any]) -> str:
+def _make_bibtex(entry: dict[str, Any] | BibEntry) -> str:
     fields: list[str] = []
     if entry.get("title"):
         fields.append(f"  title = {{{_escape_bibtex(entry['title'])}}}")
@@ -323,202 +1844,1729 @@ def _make_bibtex(entry: dict[str, Any]) -> str:
     return f"@{ref_type}{{{ref_key},\n" + ",\n".join(fields) + "\n}"
 
 
+class BibEntry:
+    """One bibliography record from a search backend.
+
+    Slotted instead of a ~15-key dict, and the BibTeX text is only rendered
+    when `bibtex` is read (normally once, by `to_dict` at output time) rather
+    than after every parse and merge. Supports the read-only dict access
+    (`entry["title"]`, `entry.get("doi")`) that callers of the old dict
+    entries used.
+    """
+
+    __slots__ = (
+        "type",
+        "title",
+        "authors",
+        "year",
+        "venue",
+        "volume",
+        "number",
+        "pages",
+        "doi",
+        "arxiv_id",
+        "url",
+        "abstract",
+        "citations",
+        "source",
+        "key",
+        "_bibtex",
+    )
+    FIELDS = __slots__[:-1]
+
+    def __init__(
+        self,
+        *,
+        type: str = "misc",  # noqa: A002 - the BibTeX entry type
+        title: str = "",
+        authors: list[str] | None = None,
+        year: int | None = None,
+        venue: str | None = None,
+        volume: str | None = None,
+        number: str | None = None,
+        pages: str | None = None,
+        doi: str | None = None,
+        arxiv_id: str | None = None,
+        url: str | None = None,
+        abstract: str | None = None,
+        citations: int | None = None,
+        source: str | None = None,
+        key: str | None = None,
+    ) -> None:
+        self.type = type
+        self.title = title
+        self.authors = authors or []
+        self.year = year
+        self.venue = venue
+        self.volume = volume
+        self.number = number
+        self.pages = pages
+        self.doi = doi
+        self.arxiv_id = arxiv_id
+        self.url = url
+        self.abstract = abstract
+        self.citations = citations
+        self.source = source
+        self.key = key or _generate_key(title, year)
+        self._bibtex: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BibEntry:
+        return cls(**{name: data[name] for name in cls.FIELDS if name in data})
+
+    @property
+    def bibtex(self) -> str:
+        if self._bibtex is None:
+            self._bibtex = _make_bibtex(self)
+        return self._bibtex
+
+    def invalidate(self) -> None:
+        """Drop the rendered BibTeX after a field changed."""
+        self._bibtex = None
+
+    def copy(self) -> BibEntry:
+        clone = BibEntry.__new__(BibEntry)
+        for name in self.FIELDS:
+            setattr(clone, name, getattr(self, name))
+        clone.authors = list(self.authors)
+        clone._bibtex = self._bibtex
+        return clone
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name == "bibtex":
+            return self.bibtex
+        if name not in self.FIELDS:
+            return default
+        value = getattr(self, name)
+        return default if value is None else value
+
+    def __getitem__(self, name: str) -> Any:
+        if name == "bibtex":
+            return self.bibtex
+        if name not in self.FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __contains__(self, name: object) -> bool:
+        return name == "bibtex" or name in self.FIELDS
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BibEntry):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    __hash__ = None  # type: ignore[assignment] - mutable
+
+    def __repr__(self) -> str:
+        return f"BibEntry(key={self.key!r}, title={self.title!r}, year={self.year!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready dict of the fields that are set, with the rendered BibTeX."""
+        data = {name: value for name in self.FIELDS if (value := getattr(self, name)) is not None}
+        data["bibtex"] = self.bibtex
+        return data
+
+
+def _copy_results(results: SearchResults) -> SearchResults:
+    return SearchResults([entry.copy() for entry in results.entries], results.complete)
+
+
 def _normalize_doi(doi: str) -> str:
     return re.sub(r"^doi:", "", re.sub(r"^https?://doi.org/", "", doi.lower())).strip()
 
 
-def _similarity(a: str, b: str) -> float:
-    words_a = {w for w in re.split(r"\s+", a.lower()) if len(w) > 2}
-    words_b = {w for w in re.split(r"\s+", b.lower()) if len(w) > 2}
+def _title_words(text: str) -> frozenset[str]:
+    return frozenset(w for w in re.split(r"\s+", text.lower()) if len(w) > 2)
+
+
+def _word_overlap(words_a: frozenset[str], words_b: frozenset[str]) -> float:
     if not words_a or not words_b:
         return 0.0
     inter = len(words_a.intersection(words_b))
     return inter / max(len(words_a), len(words_b))
 
 
-def _merge_entries(target: dict[str, Any], source: dict[str, Any]) -> None:
-    if source.get("abstract") and (
-        not target.get("abstract") or len(source["abstract"]) > len(target["abstract"])
-    ):
-        target["abstract"] = source["abstract"]
-    if source.get("citations") and (
-        not target.get("citations") or source["citations"] > target["citations"]
-    ):
-        target["citations"] = source["citations"]
+def _similarity(a: str, b: str) -> float:
+    return _word_overlap(_title_words(a), _title_words(b))
+
+
+def _merge_entries(target: BibEntry, source: BibEntry) -> None:
+    if source.abstract and (not target.abstract or len(source.abstract) > len(target.abstract)):
+        target.abstract = source.abstract
+    if source.citations and (not target.citations or source.citations > target.citations):
+        target.citations = source.citations
     for field in ("doi", "arxiv_id", "url", "volume", "pages", "number"):
-        if not target.get(field) and source.get(field):
-            target[field] = source[field]
-    target["bibtex"] = _make_bibtex(target)
+        if not getattr(target, field) and getattr(source, field):
+            setattr(target, field, getattr(source, field))
+    target.invalidate()
 
 
-def _search_dblp(query: str, *, num: int, year: int | None, author: str | None, timeout: float) -> list[dict[str, Any]]:
-    full_query = f"{query} {author}".strip() if author else query
-    params = urlparse.urlencode(
-        {
-            "q": full_query,
-            "format": "json",
-            "h": str(min(num * 2, 100)),
-        }
+@_timed("search_dblp")
+def _search_dblp(
+    query: str,
+    *,
+    num: int,
+    year: int | None,
+    author: str | None,
+    timeout: float,
+    transport: Transport | None = None,
+) -> SearchResults:
+    return _INFLIGHT.do(
+        ("dblp", query, num, year, author, transport),
+        lambda: _fetch_dblp(query, num=num, year=year, author=author, timeout=timeout, transport=transport),
+        _copy_results,
     )
-    data = _http_json(f"{DBLP_API}?{params}", method="GET", timeout=timeout)
-    hits = (((data.get("result") or {}).get("hits") or {}).get("hit")) or []
-    results: list[dict[str, Any]] = []
+
+
+def _fetch_dblp(
+    query: str,
+    *,
+    num: int,
+    year: int | None,
+    author: str | None,
+    timeout: float,
+    transport: Transport | None = None,
+) -> SearchResults:
+    def fetch_page(offset: int, limit: int) -> SearchPage:
+        return _fetch_dblp_page(
+            query,
+            offset=offset,
+            limit=limit,
+            year=year,
+            author=author,
+            timeout=timeout,
+            transport=transport,
+        )
+
+    return _collect_pages(fetch_page, num=num, max_results=DBLP_MAX_RESULTS)
+
+
+def _fetch_dblp_page(
+    query: str,
+    *,
+    offset: int,
+    limit: int,
+    year: int | None,
+    author: str | None,
+    timeout: float,
+    transport: Transport | None = None,
+) -> SearchPage:
+    full_query = f"{query} {author}".strip() if author else query
+    fields = {
+        "q": full_query,
+        "format": "json",
+        "h": str(limit),
+    }
+    if offset:
+        fields["f"] = str(offset)
+    params = urlparse.urlencode(fields)
+    data = _http_json(f"{DBLP_API}?{params}", method="GET", timeout=timeout, transport=transport)
+    hits_block = (data.get("result") or {}).get("hits") or {}
+    hits = hits_block.get("hit") or []
+    try:
+        total: int | None = int(hits_block.get("@total"))
+    except (TypeError, ValueError):
+        total = None
+    results: list[BibEntry] = []
     for hit in hits:
-        info = hit.get("info") if isinstance(hit, dict) else None
-        if not isinstance(info, dict):
-            continue
-        pub_year = None
-        if info.get("year"):
-            try:
-                pub_year = int(str(info["year"]))
-            except ValueError:
-                pub_year = None
-        if year and pub_year and pub_year < year:
-            continue
-        raw_authors = ((info.get("authors") or {}).get("author")) if isinstance(info.get("authors"), dict) else None
-        authors: list[str] = []
-        if isinstance(raw_authors, list):
-            for a in raw_authors:
-                if isinstance(a, str):
-                    authors.append(a)
-                elif isinstance(a, dict):
-                    authors.append(str(a.get("text") or a.get("_") or "").strip())
-        elif isinstance(raw_authors, str):
-            authors.append(raw_authors)
-        entry_type = "misc"
-        if info.get("type") == "Conference and Workshop Papers":
-            entry_type = "inproceedings"
-        elif info.get("type") == "Journal Articles":
-            entry_type = "article"
-        elif info.get("type") == "Books and Theses":
-            entry_type = "book"
-        entry = {
-            "type": entry_type,
-            "title": str(info.get("title", "")).rstrip("."),
-            "authors": [a for a in authors if a],
-            "year": pub_year,
-            "venue": info.get("venue"),
-            "volume": info.get("volume"),
-            "number": info.get("number"),
-            "pages": info.get("pages"),
-            "doi": info.get("doi"),
-            "url": info.get("ee") or info.get("url"),
-            "source": "dblp",
-        }
-        entry["key"] = _generate_key(entry["title"], entry["year"])
-        entry["bibtex"] = _make_bibtex(entry)
-        results.append(entry)
-        if len(results) >= num:
-            break
-    return results
+        entry = _parse_dblp_hit(hit, year)
+        if entry is not None:
+            results.append(entry)
+    return SearchPage(results, len(hits), total)
+
+
+def _parse_dblp_hit(hit: Any, year: int | None) -> BibEntry | None:
+    info = hit.get("info") if isinstance(hit, dict) else None
+    if not isinstance(info, dict):
+        return None
+    pub_year = None
+    if info.get("year"):
+        try:
+            pub_year = int(str(info["year"]))
+        except ValueError:
+            pub_year = None
+    if year and pub_year and pub_year < year:
+        return None
+    raw_authors = ((info.get("authors") or {}).get("author")) if isinstance(info.get("authors"), dict) else None
+    authors: list[str] = []
+    if isinstance(raw_authors, list):
+        for a in raw_authors:
+            if isinstance(a, str):
+                authors.append(a)
+            elif isinstance(a, dict):
+                authors.append(str(a.get("text") or a.get("_") or "").strip())
+    elif isinstance(raw_authors, str):
+        authors.append(raw_authors)
+    entry_type = "misc"
+    if info.get("type") == "Conference and Workshop Papers":
+        entry_type = "inproceedings"
+    elif info.get("type") == "Journal Articles":
+        entry_type = "article"
+    elif info.get("type") == "Books and Theses":
+        entry_type = "book"
+    return BibEntry(
+        type=entry_type,
+        title=str(info.get("title", "")).rstrip("."),
+        authors=[a for a in authors if a],
+        year=pub_year,
+        venue=info.get("venue"),
+        volume=info.get("volume"),
+        number=info.get("number"),
+        pages=info.get("pages"),
+        doi=info.get("doi"),
+        url=info.get("ee") or info.get("url"),
+        source="dblp",
+    )
+
 
+def _collect_pages(
+    fetch_page: Callable[[int, int], SearchPage],
+    *,
+    num: int,
+    max_results: int,
+) -> SearchResults:
+    """Gather about `num * 2` candidates from a paginated backend.
+
+    Small requests are a single page, as before. Larger ones learn the hit
+    total from the first page, then fetch the remaining pages concurrently
+    (a bounded window, consumed in order) and stop as soon as `num` entries
+    survive deduplication, so unneeded pages are never requested. The end
+    of the results is judged from raw hit counts, not from entries left
+    after the --year filter: a fully filtered page does not stop the search.
+    A later page that fails ends the search with what was merged so far,
+    marked incomplete so it is not cached.
+    """
+    want = max(1, min(num * 2, max_results))
+    first, first_hits, total = fetch_page(0, min(want, SEARCH_PAGE_SIZE))
+    if want <= SEARCH_PAGE_SIZE:
+        return SearchResults(first[:num], True)
+
+    import concurrent.futures
+
+    deduper = _BibtexDeduper()
+    collected: list[BibEntry] = []
+
+    def take(page: list[BibEntry]) -> None:
+        for entry in page:
+            if len(deduper) >= num:
+                return
+            collected.append(entry)
+            deduper.add(entry.copy())  # copy: merging must not touch the returned entries
+
+    take(first)
+    if first_hits < min(want, SEARCH_PAGE_SIZE):
+        return SearchResults(collected, True)  # a short first page is the whole result set
+    available = min(want, total) if total is not None else want
+    offsets = iter(range(SEARCH_PAGE_SIZE, available, SEARCH_PAGE_SIZE))
+    pending: deque[concurrent.futures.Future[SearchPage]] = deque()
+    complete = True
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS)
+
+    def submit_next() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            pending.append(executor.submit(fetch_page, offset, min(SEARCH_PAGE_SIZE, available - offset)))
 
+    try:
+        for _ in range(MAX_PAGE_WORKERS):
+            submit_next()
+        while pending and len(deduper) < num:
+            try:
+                page, hits, _total = pending.popleft().result()
+            except JinaOpsError:
+                complete = False
+                break  # keep the pages already merged rather than failing the search
+            take(page)
+            if hits < SEARCH_PAGE_SIZE:
+                break  # past the last hit, whatever the total claimed
+            submit_next()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return SearchResults(collected, complete)
+
+
+@_timed("search_semantic_scholar")
 def _search_semantic_scholar(
     query: str,
     *,
     num: int,
     year: int | None,
     timeout: float,
-) -> list[dict[str, Any]]:
+    transport: Transport | None = None,
+) -> SearchResults:
+    return _INFLIGHT.do(
+        ("semanticscholar", query, num, year, transport),
+        lambda: _fetch_semantic_scholar(query, num=num, year=year, timeout=timeout, transport=transport),
+        _copy_results,
+    )
+
+
+def _fetch_semantic_scholar(
+    query: str,
+    *,
+    num: int,
+    year: int | None,
+    timeout: float,
+    transport: Transport | None = None,
+) -> SearchResults:
+    def fetch_page(offset: int, limit: int) -> SearchPage:
+        return _fetch_semantic_scholar_page(
+            query,
+            offset=offset,
+            limit=limit,
+            year=year,
+            timeout=timeout,
+            transport=transport,
+        )
+
+    return _collect_pages(fetch_page, num=num, max_results=SEMANTIC_SCHOLAR_MAX_RESULTS)
+
+
+def _fetch_semantic_scholar_page(
+    query: str,
+    *,
+    offset: int,
+    limit: int,
+    year: int | None,
+    timeout: float,
+    transport: Transport | None = None,
+) -> SearchPage:
     params = {
         "query": query,
-        "limit": str(min(num * 2, 100)),
-        "fields": "title,authors,year,venue,externalIds,abstract,citationCount,url",
+        "limit": str(limit),
+        "fields": SEMANTIC_SCHOLAR_FIELDS,
     }
+    if offset:
+        params["offset"] = str(offset)
     if year:
         params["year"] = f"{year}-"
     data = _http_json(
         f"{SEMANTIC_SCHOLAR_API}?{urlparse.urlencode(params)}",
         method="GET",
         timeout=timeout,
+        transport=transport,
+    )
+    total = data.get("total")
+    results: list[BibEntry] = []
+    for paper in data.get("data") or []:
+        entry = _parse_semantic_scholar_paper(paper)
+        if entry is not None:
+            results.append(entry)
+    return SearchPage(results, len(data.get("data") or []), total if isinstance(total, int) else None)
+
+
+def _parse_semantic_scholar_paper(paper: Any) -> BibEntry | None:
+    if not isinstance(paper, dict) or not paper.get("title"):
+        return None
+    authors = [a.get("name") for a in paper.get("authors", []) if isinstance(a, dict) and a.get("name")]
+    external = paper.get("externalIds", {}) if isinstance(paper.get("externalIds"), dict) else {}
+    venue_text = str(paper.get("venue") or "")
+    entry_type = "inproceedings" if "conference" in venue_text.lower() else "article"
+    return BibEntry(
+        type=entry_type,
+        title=paper["title"],
+        authors=authors,
+        year=paper.get("year"),
+        venue=paper.get("venue"),
+        doi=external.get("DOI"),
+        arxiv_id=external.get("ArXiv"),
+        url=paper.get("url"),
+        abstract=paper.get("abstract"),
+        citations=paper.get("citationCount"),
+        source="semanticscholar",
     )
-    papers = data.get("data", [])
+
+
+def _semantic_scholar_paper_id(text: str) -> str | None:
+    """Map a DOI or arXiv id (bare, prefixed, or as a URL) to a /paper/batch id."""
+    candidate = text.strip()
+    arxiv_url = ARXIV_ID_PATTERN.search(candidate)
+    if arxiv_url:
+        return f"ARXIV:{arxiv_url.group(1)}"
+    lowered = candidate.lower()
+    if lowered.startswith("arxiv:"):
+        candidate = candidate[len("arxiv:"):]
+        lowered = candidate.lower()
+    if BARE_ARXIV_ID_PATTERN.match(candidate):
+        return "ARXIV:" + re.sub(r"v\d+$", "", candidate)
+    doi = re.sub(r"^https?://(?:dx\.)?doi\.org/", "", lowered)
+    doi = _normalize_doi(doi)
+    if DOI_PATTERN.match(doi):
+        return f"DOI:{doi}"
+    return None
+
+
+def _fetch_paper_batch(
+    paper_ids: list[str],
+    *,
+    timeout: float,
+    transport: Transport | None = None,
+    batch_size: int = SEMANTIC_SCHOLAR_BATCH_SIZE,
+    limiter: RateLimiter | None = None,
+) -> Iterator[tuple[str, Any]]:
+    """Yield (paper id, paper or None) from /paper/batch, `batch_size` ids per request."""
+    url = f"{SEMANTIC_SCHOLAR_BATCH_API}?{urlparse.urlencode({'fields': SEMANTIC_SCHOLAR_FIELDS})}"
+    for start in range(0, len(paper_ids), batch_size):
+        chunk = paper_ids[start : start + batch_size]
+        if limiter is not None:
+            limiter.acquire("batch")
+        papers = _http_json_response(url, payload={"ids": chunk}, timeout=timeout, transport=transport).data
+        if not isinstance(papers, list) or len(papers) != len(chunk):
+            raise JinaOpsError("Unexpected response from Semantic Scholar paper batch API")
+        yield from zip(chunk, papers)
+
+
+@_timed("enrich_bibtex")
+def _enrich_bibtex(
+    ids: list[str],
+    *,
+    timeout: float,
+    transport: Transport | None = None,
+    batch_size: int = SEMANTIC_SCHOLAR_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Resolve DOIs / arXiv ids to BibTeX entries with Semantic Scholar's batch endpoint.
+
+    Ids are sent `batch_size` at a time instead of one lookup per id.
+    Returns entries in input order (a paper named by several ids appears
+    once), plus the ids Semantic Scholar did not know and the ones that are
+    neither a DOI nor an arXiv id.
+    """
+    paper_ids: dict[str, str] = {}
+    invalid: list[str] = []
+    for raw in ids:
+        paper_id = _semantic_scholar_paper_id(raw)
+        if paper_id is None:
+            invalid.append(raw)
+        else:
+            paper_ids.setdefault(paper_id, raw)
+
     results: list[dict[str, Any]] = []
-    for paper in papers:
-        if not isinstance(paper, dict) or not paper.get("title"):
+    not_found: list[str] = []
+    seen_papers: set[str] = set()
+    batches = _fetch_paper_batch(list(paper_ids), timeout=timeout, transport=transport, batch_size=batch_size)
+    for paper_id, paper in batches:
+        entry = _parse_semantic_scholar_paper(paper)
+        if entry is None:
+            not_found.append(paper_ids[paper_id])
             continue
-        authors = [a.get("name") for a in paper.get("authors", []) if isinstance(a, dict) and a.get("name")]
-        external = paper.get("externalIds", {}) if isinstance(paper.get("externalIds"), dict) else {}
-        venue_text = str(paper.get("venue") or "")
-        entry_type = "inproceedings" if "conference" in venue_text.lower() else "article"
-        entry = {
-            "type": entry_type,
-            "title": paper["title"],
-            "authors": authors,
-            "year": paper.get("year"),
-            "venue": paper.get("venue"),
-            "doi": external.get("DOI"),
-            "arxiv_id": external.get("ArXiv"),
-            "url": paper.get("url"),
-            "abstract": paper.get("abstract"),
-            "citations": paper.get("citationCount"),
-            "source": "semanticscholar",
-        }
-        entry["key"] = _generate_key(entry["title"], entry.get("year"))
-        entry["bibtex"] = _make_bibtex(entry)
-        results.append(entry)
-        if len(results) >= num:
-            break
-    return results
+        s2_id = paper.get("paperId")
+        if s2_id in seen_papers:
+            continue
+        if s2_id:
+            seen_papers.add(s2_id)
+        record = entry.to_dict()
+        record["id"] = paper_ids[paper_id]
+        results.append(record)
+    return {"count": len(results), "results": results, "notFound": not_found, "invalid": invalid}
 
 
-def _deduplicate_bibtex(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    seen: dict[str, dict[str, Any]] = {}
-    seen_doi: dict[str, str] = {}
-    seen_arxiv: dict[str, str] = {}
-    for entry in entries:
-        doi = entry.get("doi")
-        if isinstance(doi, str) and doi.strip():
-            normalized = _normalize_doi(doi)
-            if normalized in seen_doi:
-                _merge_entries(seen[seen_doi[normalized]], entry)
-                continue
-            seen_doi[normalized] = entry["key"]
-        arxiv_id = entry.get("arxiv_id")
-        if isinstance(arxiv_id, str) and arxiv_id.strip():
-            normalized = re.sub(r"v\d+$", "", arxiv_id)
-            if normalized in seen_arxiv:
-                _merge_entries(seen[seen_arxiv[normalized]], entry)
-                continue
-            seen_arxiv[normalized] = entry["key"]
-        duplicate_key = None
-        for key, existing in seen.items():
-            if entry.get("year") == existing.get("year") and _similarity(
-                str(entry.get("title", "")),
-                str(existing.get("title", "")),
-            ) > 0.85:
-                duplicate_key = key
+def _fetch_paper_links(
+    paper_id: str,
+    direction: str,
+    *,
+    limit: int,
+    timeout: float,
+    transport: Transport | None = None,
+    limiter: RateLimiter | None = None,
+) -> list[Any]:
+    """Papers this paper cites (`references`) or that cite it (`citations`)."""
+    params = urlparse.urlencode({"fields": f"paperId,{SEMANTIC_SCHOLAR_FIELDS}", "limit": str(limit)})
+    url = f"{SEMANTIC_SCHOLAR_PAPER_API}{urlparse.quote(paper_id, safe='')}/{direction}?{params}"
+    if limiter is not None:
+        limiter.acquire(direction)
+    data = _http_json(url, method="GET", timeout=timeout, transport=transport)
+    field = "citedPaper" if direction == "references" else "citingPaper"
+    return [item.get(field) for item in data.get("data") or [] if isinstance(item, dict)]
+
+
+def _paper_aliases(paper: dict[str, Any], entry: BibEntry) -> list[str]:
+    """Identity keys of a paper, normalized as in _BibtexDeduper."""
+    aliases = [f"s2:{paper['paperId']}"]
+    if isinstance(entry.doi, str) and entry.doi.strip():
+        aliases.append(f"doi:{_normalize_doi(entry.doi)}")
+    if isinstance(entry.arxiv_id, str) and entry.arxiv_id.strip():
+        aliases.append("arxiv:" + re.sub(r"v\d+$", "", entry.arxiv_id))
+    return aliases
+
+
+def _expand_citation_graph(
+    seeds: Iterable[Any],
+    fetch: Callable[[str, str], list[Any]],
+    *,
+    max_depth: int,
+    max_nodes: int,
+    directions: tuple[str, ...] = CITATION_DIRECTIONS,
+    concurrency: int = 4,
+) -> dict[str, Any]:
+    """Breadth-first expansion over Semantic Scholar references / citations.
+
+    Like _crawl, a node's links are fetched as soon as the node is
+    discovered instead of one depth level at a time. Papers are merged
+    when they share a paperId, DOI or arXiv id; at most `max_nodes` nodes
+    are admitted (seeds always are), and edges always run citing -> cited.
+    """
+    import concurrent.futures
+
+    nodes: dict[str, tuple[BibEntry, int]] = {}
+    aliases: dict[str, str] = {}
+    edges: set[tuple[str, str]] = set()
+    errors: list[dict[str, Any]] = []
+    frontier: deque[tuple[str, str, int]] = deque()
+    truncated = False
+
+    def admit(paper: Any, depth: int, force: bool = False) -> tuple[str | None, bool]:
+        """Return (node id, newly added) for a paper, or (None, False) if it is not admitted."""
+        entry = _parse_semantic_scholar_paper(paper)
+        if entry is None or not paper.get("paperId"):
+            return None, False
+        keys = _paper_aliases(paper, entry)
+        node_id = next((aliases[key] for key in keys if key in aliases), None)
+        added = node_id is None
+        if added:
+            if len(nodes) >= max_nodes and not force:
+                return None, False
+            node_id = paper["paperId"]
+            nodes[node_id] = (entry, depth)
+            if depth < max_depth:
+                frontier.extend((node_id, direction, depth) for direction in directions)
+        for key in keys:
+            aliases.setdefault(key, node_id)
+        return node_id, added
+
+    for seed in seeds:
+        admit(seed, 0, force=True)
+    if not nodes:
+        raise JinaOpsError("None of the seeds could be resolved")
+
+    running: dict[concurrent.futures.Future[list[Any]], tuple[str, str, int]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while frontier or running:
+            while frontier and len(running) < concurrency:
+                item = frontier.popleft()
+                running[executor.submit(fetch, item[0], item[1])] = item
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                node_id, direction, depth = running.pop(future)
+                try:
+                    papers = future.result()
+                except JinaOpsError as exc:
+                    errors.append({"paperId": node_id, "direction": direction, "error": str(exc)})
+                    continue
+                for paper in papers:
+                    linked_id, _added = admit(paper, depth + 1)
+                    if linked_id is None:
+                        truncated = truncated or len(nodes) >= max_nodes
+                        continue
+                    if linked_id != node_id:
+                        edges.add((node_id, linked_id) if direction == "references" else (linked_id, node_id))
+
+    taken: set[str] = set()
+    records: list[dict[str, Any]] = []
+    for node_id, (entry, depth) in sorted(nodes.items(), key=lambda item: (item[1][1], item[1][0].key, item[0])):
+        key = _unique_bib_key(entry.key, taken)
+        taken.add(key.lower())
+        if key != entry.key:
+            entry.key = key
+            entry.invalidate()
+        records.append({"id": node_id, "depth": depth, **entry.to_dict()})
+    return {
+        "nodes": records,
+        "edges": [{"citing": citing, "cited": cited} for citing, cited in sorted(edges)],
+        "errors": errors,
+        "truncated": truncated,
+    }
+
+
+@_timed("citation_graph")
+def _citation_graph(
+    ids: list[str],
+    *,
+    max_depth: int,
+    max_nodes: int,
+    directions: tuple[str, ...],
+    limit: int,
+    endpoint_rate: float | None,
+    concurrency: int,
+    timeout: float,
+    transport: Transport | None = None,
+) -> dict[str, Any]:
+    from jina_transport import RateLimiter
+
+    paper_ids: dict[str, str] = {}
+    invalid: list[str] = []
+    for raw in ids:
+        paper_id = _semantic_scholar_paper_id(raw)
+        if paper_id is None:
+            invalid.append(raw)
+        else:
+            paper_ids.setdefault(paper_id, raw)
+    if not paper_ids:
+        raise JinaOpsError("At least one seed DOI or arXiv id is required")
+
+    # One bucket per endpoint (batch / references / citations), on top of
+    # any per-host limit of the transport.
+    limiter = RateLimiter(endpoint_rate) if endpoint_rate else None
+    seeds: list[Any] = []
+    not_found: list[str] = []
+    batches = _fetch_paper_batch(list(paper_ids), timeout=timeout, transport=transport, limiter=limiter)
+    for paper_id, paper in batches:
+        if isinstance(paper, dict) and paper.get("paperId"):
+            seeds.append(paper)
+        else:
+            not_found.append(paper_ids[paper_id])
+
+    def fetch(paper_id: str, direction: str) -> list[Any]:
+        return _fetch_paper_links(
+            paper_id,
+            direction,
+            limit=limit,
+            timeout=timeout,
+            transport=transport,
+            limiter=limiter,
+        )
+
+    graph = _expand_citation_graph(
+        seeds,
+        fetch,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+        directions=directions,
+        concurrency=concurrency,
+    )
+    return {**graph, "notFound": not_found, "invalid": invalid}
+
+
+class _BibtexDeduper:
+    """Incremental form of _deduplicate_bibtex.
+
+    Entries can be added as they arrive (e.g. page by page) and the number
+    of unique entries read at any point. Title similarity is only compared
+    within the same year, which is what the year check required anyway, so
+    large result sets avoid comparing every pair.
+    """
+
+    def __init__(self) -> None:
+        self.seen: dict[str, BibEntry] = {}
+        self.seen_doi: dict[str, str] = {}
+        self.seen_arxiv: dict[str, str] = {}
+        # year -> [(key, title words)] of the kept entries, words split once per entry
+        self.titles_by_year: dict[Any, list[tuple[str, frozenset[str]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.seen)
+
+    def add(self, entry: BibEntry | dict[str, Any]) -> None:
+        if not isinstance(entry, BibEntry):
+            entry = BibEntry.from_dict(entry)
+        seen = self.seen
+        doi_key = None
+        if isinstance(entry.doi, str) and entry.doi.strip():
+            doi_key = _normalize_doi(entry.doi)
+            if doi_key in self.seen_doi:
+                _merge_entries(seen[self.seen_doi[doi_key]], entry)
+                return
+        arxiv_key = None
+        if isinstance(entry.arxiv_id, str) and entry.arxiv_id.strip():
+            arxiv_key = re.sub(r"v\d+$", "", entry.arxiv_id)
+            if arxiv_key in self.seen_arxiv:
+                if doi_key is not None:
+                    self.seen_doi[doi_key] = self.seen_arxiv[arxiv_key]
+                _merge_entries(seen[self.seen_arxiv[arxiv_key]], entry)
+                return
+
+        target_key = entry.key
+        words = _title_words(str(entry.title or ""))
+        same_year = self.titles_by_year.setdefault(entry.year, [])
+        for key, existing_words in same_year:
+            if _word_overlap(words, existing_words) > 0.85:
+                target_key = key
+                _merge_entries(seen[key], entry)
                 break
-        if duplicate_key:
-            _merge_entries(seen[duplicate_key], entry)
-            continue
-        seen[entry["key"]] = entry
-    result = list(seen.values())
-    result.sort(key=lambda x: (-(int(x.get("year") or 0)), str(x.get("title") or "")))
-    return result
+        else:
+            previous = seen.get(target_key)
+            if previous is None or previous.year != entry.year:
+                same_year.append((target_key, words))
+            else:
+                # Same generated key: the new entry replaces the old one.
+                for index, (key, _words) in enumerate(same_year):
+                    if key == target_key:
+                        same_year[index] = (key, words)
+                        break
+            seen[target_key] = entry
+        # Point the identifiers at the entry they were merged into, so a later
+        # duplicate always finds an entry that exists.
+        if doi_key is not None:
+            self.seen_doi[doi_key] = target_key
+        if arxiv_key is not None:
+            self.seen_arxiv[arxiv_key] = target_key
+
+    def result(self) -> list[BibEntry]:
+        result = list(self.seen.values())
+        result.sort(key=lambda x: (-(int(x.year or 0)), str(x.title or "")))
+        return result
+
+
+def _deduplicate_bibtex(entries: list[BibEntry]) -> list[BibEntry]:
+    deduper = _BibtexDeduper()
+    for entry in entries:
+        deduper.add(entry)
+    return deduper.result()
+
+
+def _unique_bib_key(key: str, taken: set[str]) -> str:
+    """`key`, or `key` plus a letter suffix (a, b, ..., aa, ...) if it is in `taken` (lowercased)."""
+    if key.lower() not in taken:
+        return key
+    for length in range(1, 4):
+        for letters in itertools.product(string.ascii_lowercase, repeat=length):
+            candidate = key + "".join(letters)
+            if candidate.lower() not in taken:
+                return candidate
+    raise JinaOpsError(f"Too many entries share the BibTeX key {key}")
+
+
+class _BibExporter:
+    """Stream entries into a .bib file with collision-free keys.
+
+    Keys that are already taken get a letter suffix (`attention2017a`,
+    `attention2017b`, ...) and entries whose DOI or arXiv id is already in
+    the file are skipped. In append mode the existing file is scanned once,
+    line by line, for its keys and ids; after that every check is a set
+    lookup and each entry is written as soon as it is added.
+    """
+
+    def __init__(self, path: Path, *, append: bool = False) -> None:
+        self.path = path
+        self.keys: set[str] = set()
+        self.ids: set[str] = set()
+        self.written: list[str] = []
+        self.skipped: list[str] = []
+        needs_separator = False
+        if append and path.exists():
+            needs_separator = self._index_existing()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = path.open("a" if append else "w", encoding="utf-8")
+        if needs_separator:
+            self.handle.write("\n")
+
+    def __enter__(self) -> _BibExporter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.handle.close()
+
+    def _index_existing(self) -> bool:
+        """Index keys and ids of the current file; True if it lacks a trailing newline."""
+        last_line = ""
+        with self.path.open(encoding="utf-8") as handle:
+            for line in handle:
+                last_line = line
+                header = BIB_ENTRY_HEADER.match(line)
+                if header:
+                    if header.group(1).lower() not in {"string", "preamble", "comment"}:
+                        self.keys.add(header.group(2).lower())
+                    continue
+                field = BIB_ID_FIELD.match(line)
+                if field:
+                    self.ids.add(self._id_key(field.group(1), field.group(2)))
+        return bool(last_line) and not last_line.endswith("\n")
+
+    @staticmethod
+    def _id_key(field: str, value: str) -> str:
+        if field.lower() == "doi":
+            return "doi:" + _normalize_doi(value)
+        return "arxiv:" + re.sub(r"v\d+$", "", value.strip().lower())
+
+    def add(self, entry: BibEntry | dict[str, Any]) -> bool:
+        """Write one entry; returns False if its DOI / arXiv id is already in the file."""
+        if not isinstance(entry, BibEntry):
+            entry = BibEntry.from_dict(entry)
+        ids = []
+        if entry.doi:
+            ids.append(self._id_key("doi", entry.doi))
+        if entry.arxiv_id:
+            ids.append(self._id_key("eprint", entry.arxiv_id))
+        if any(item in self.ids for item in ids):
+            self.skipped.append(entry.key)
+            return False
+        key = _unique_bib_key(entry.key, self.keys)
+        if key != entry.key:
+            entry = entry.copy()
+            entry.key = key
+            entry.invalidate()
+        self.handle.write(entry.bibtex)
+        self.handle.write("\n\n")
+        self.keys.add(key.lower())
+        self.ids.update(ids)
+        self.written.append(key)
+        return True
+
+    def summary(self) -> dict[str, Any]:
+        return {"bibFile": str(self.path), "written": self.written, "skipped": self.skipped}
+
+
+class JinaClient:
+    """Importable jina_ops API for long-running callers.
+
+    A client owns a keep-alive connection pool, the read-url and search
+    caches and an optional per-host rate limiter for its lifetime, so repeated calls skip
+    process startup and connection setup. Every method has an `a`-prefixed
+    async variant that runs it in a worker thread.
+
+        with JinaClient(rate_limit=5) as client:
+            page = client.read_url("https://example.com")
+            entries = client.search_bibtex("attention is all you need", num=5)
+
+    Methods raise JinaOpsError on failure, like the CLI.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 30.0,
+        cache: bool = True,
+        cache_ttl: float = 0.0,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        cache_max_entries: int = DEFAULT_READ_CACHE_MAX_ENTRIES,
+        cache_max_age: float = DEFAULT_READ_CACHE_MAX_AGE,
+        search_cache_ttl: float = DEFAULT_SEARCH_CACHE_TTL,
+        search_cache_max_bytes: int = DEFAULT_SEARCH_CACHE_MAX_BYTES,
+        rate_limit: float | None = None,
+        burst: int = 1,
+    ) -> None:
+        self.timeout = timeout
+        self._lock = threading.Lock()  # a `serve` daemon shares one client across handler threads
+        from jina_transport import Transport
+
+        self.transport = Transport(rate_limit=rate_limit, burst=burst)
+        self.cache_store = _open_cache_store() if cache else None
+        self.read_cache: _ReadCache | None = None
+        self.search_cache: _SearchCache | None = None
+        self.chunk_store: _ChunkStore | None = None
+        if self.cache_store is not None:
+            self.read_cache = _ReadCache(
+                self.cache_store,
+                ttl=cache_ttl,
+                negative_ttl=negative_ttl,
+                max_entries=cache_max_entries,
+                max_age=cache_max_age,
+            )
+            if search_cache_ttl > 0:
+                self.search_cache = _SearchCache(
+                    self.cache_store,
+                    ttl=search_cache_ttl,
+                    max_bytes=search_cache_max_bytes,
+                )
+
+    def __enter__(self) -> JinaClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.transport.close()
+        if self.chunk_store is not None and self.chunk_store.store is not self.cache_store:
+            self.chunk_store.store.close()
+        if self.cache_store is not None:
+            self.cache_store.close()
+        self.cache_store = self.read_cache = self.search_cache = self.chunk_store = None
+
+    def _chunks(self) -> _ChunkStore:
+        # The chunk store lives in the cache database even when caching is off.
+        with self._lock:
+            if self.chunk_store is None:
+                store = self.cache_store or _open_cache_store()
+                if store is None:
+                    raise JinaOpsError(
+                        f"Chunk store unavailable: cannot open {_default_cache_dir() / CACHE_DB_NAME}"
+                    )
+                self.chunk_store = _ChunkStore(store)
+            return self.chunk_store
+
+    def _chunked(self, result: dict[str, Any], max_chars: int | None) -> dict[str, Any]:
+        """`result` with content cut to its first chunk when it exceeds `max_chars`."""
+        content = result.get("content")
+        if max_chars is None or not isinstance(content, str) or len(content) <= max_chars:
+            return result
+        chunks = _chunk_markdown(content, max_chars)
+        url = result.get("url")
+        doc = _ChunkStore.doc_id(str(url or ""), content)
+        self._chunks().put(doc, url, chunks)
+        return {
+            **result,
+            "content": chunks[0][1],
+            "contentChars": len(content),
+            "chunks": [
+                {"id": f"{doc}:{index}", "heading": heading, "chars": len(body)}
+                for index, (heading, body) in enumerate(chunks)
+            ],
+        }
+
+    def _cached_search(self, key: str, search: Callable[[], tuple[T, bool]]) -> T:
+        """Serve `key` from the search cache; `search` returns `(result, complete)`
+        and only complete results are stored.
+        """
+        if self.search_cache is None:
+            return search()[0]
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            _count_cache_lookup("search", "hit")
+            return cached
+        _count_cache_lookup("search", "miss")
+        result, complete = search()
+        if complete:
+            self.search_cache.put(key, result)
+        return result
+
+    def _search_domain(
+        self,
+        query: str,
+        domain: str,
+        num: int,
+        tbs: str | None,
+        timeout: float | None,
+    ) -> dict[str, Any]:
+        def search() -> dict[str, Any]:
+            return _search_domain(
+                query=query,
+                domain=domain,
+                num=num,
+                tbs=tbs,
+                timeout=timeout or self.timeout,
+                transport=self.transport,
+            )
+
+        if _is_relative_tbs(tbs):
+            return search()  # "past day" etc. means something else tomorrow
+        return self._cached_search(_SearchCache.key(domain, query=query, num=num, tbs=tbs), lambda: (search(), True))
+
+    def read_url(
+        self,
+        url: str,
+        *,
+        with_all_links: bool = False,
+        with_all_images: bool = False,
+        timeout: float | None = None,
+        max_bytes: int | None = None,
+        max_chars: int | None = None,
+    ) -> dict[str, Any]:
+        """Read one URL. With `max_chars`, a longer page is split into
+        heading-aware chunks: `content` holds the first one and `chunks`
+        lists the ids to pass to `read_chunk` for the rest.
+        """
+        result = _read_url(
+            url,
+            with_all_links=with_all_links,
+            with_all_images=with_all_images,
+            timeout=timeout or self.timeout,
+            cache=self.read_cache,
+            max_bytes=max_bytes,
+            transport=self.transport,
+        )
+        return self._chunked(result, max_chars)
+
+    def read_chunk(self, chunk_id: str) -> dict[str, Any]:
+        """One stored chunk of a page read with `max_chars`, without refetching."""
+        return self._chunks().get(chunk_id)
+
+    def parallel_read_url(
+        self,
+        urls: list[str],
+        *,
+        with_all_links: bool = False,
+        with_all_images: bool = False,
+        timeout: float | None = None,
+        batch_timeout: float | None = None,
+        hedge_after: float | str | None = None,
+        max_bytes: int | None = None,
+        max_workers: int = 5,
+        keep_duplicates: bool = False,
+        max_chars: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read URLs concurrently; per-URL failures are reported, not raised.
+
+        URLs are canonicalized before fetching, and unless `keep_duplicates`
+        is set, mirror variants (http/https, www., trailing slash) are fetched
+        once and pages with identical content are returned as one result.
+        Every result lists the input URLs it stands for under `urls`.
+        `max_chars` chunks each page as in `read_url`.
+        """
+        fetch_urls: dict[str, str] = {}
+        members: dict[str, list[str]] = {}
+        for raw in urls:
+            normalized = _normalize_url(raw)
+            canonical = _canonical_url(normalized)
+            key = canonical if keep_duplicates else _mirror_key(canonical)
+            current = fetch_urls.get(key)
+            if current is None or (canonical.startswith("https:") and not current.startswith("https:")):
+                fetch_urls[key] = canonical
+            group = members.setdefault(key, [])
+            if normalized not in group:
+                group.append(normalized)
+        if not fetch_urls:
+            raise JinaOpsError("At least one URL is required")
+        unique_urls = list(fetch_urls.values())
+
+        url_timeout = timeout or self.timeout
+
+        def fetch(url: str, hedge: bool) -> dict[str, Any]:
+            # A hedge must not join the in-flight call it is racing against.
+            read = _fetch_read_url if hedge else _read_url
+            return read(
+                url,
+                with_all_links=with_all_links,
+                with_all_images=with_all_images,
+                timeout=url_timeout,
+                cache=self.read_cache,
+                max_bytes=max_bytes,
+                transport=self.transport,
+            )
+
+        results = _read_urls_with_deadlines(
+            unique_urls,
+            fetch,
+            url_timeout=url_timeout,
+            batch_timeout=batch_timeout,
+            hedge_after=hedge_after,
+            max_workers=min(len(unique_urls), max_workers),
+        )
+        for key, outcome in zip(fetch_urls, results):
+            outcome["urls"] = members[key]
+        if not keep_duplicates:
+            results = _collapse_mirrors(results)
+        for outcome in results:
+            if outcome["success"]:
+                outcome["result"] = self._chunked(outcome["result"], max_chars)
+        results.sort(key=lambda item: item["url"])
+        return results
+
+    def crawl(
+        self,
+        seeds: list[str],
+        *,
+        max_depth: int = 1,
+        max_pages: int = 20,
+        same_origin: bool = True,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        concurrency: int = 5,
+        timeout: float | None = None,
+        max_bytes: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield crawl records (`type: page`, then one `type: summary`) as pages finish."""
+
+        def fetch(url: str) -> dict[str, Any]:
+            return self.read_url(url, with_all_links=True, timeout=timeout, max_bytes=max_bytes)
+
+        return _crawl(
+            seeds,
+            fetch,
+            max_depth=max_depth,
+            max_pages=max_pages,
+            same_origin=same_origin,
+            include=include,
+            exclude=exclude,
+            concurrency=concurrency,
+        )
+
+    def search_arxiv(
+        self,
+        query: str,
+        *,
+        num: int = 30,
+        tbs: str | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        return self._search_domain(query, "arxiv", num, tbs, timeout)
+
+    def search_ssrn(
+        self,
+        query: str,
+        *,
+        num: int = 30,
+        tbs: str | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        return self._search_domain(query, "ssrn", num, tbs, timeout)
+
+    def search_many(
+        self,
+        queries: list[str],
+        *,
+        domain: str,
+        num: int = 30,
+        tbs: str | None = None,
+        timeout: float | None = None,
+        max_workers: int = MAX_SEARCH_WORKERS,
+    ) -> dict[str, Any]:
+        """Run several arxiv/ssrn searches concurrently and merge their hits.
+
+        Returns `{"domain", "queries", "results"}`: `results` holds each hit
+        once with the `matchedQueries` that found it, and `queries` maps each
+        query to the indices of its hits in `results` (or to an `error`).
+        Requests go through this client's rate limiter.
+        """
+        import concurrent.futures
+
+        if domain not in {"arxiv", "ssrn"}:
+            raise JinaOpsError(f"Unsupported search domain: {domain}")
+        unique = list(dict.fromkeys(queries))
+        if not unique:
+            raise JinaOpsError("At least one query is required")
+
+        def run(query: str) -> dict[str, Any]:
+            return self._search_domain(query, domain, num, tbs, timeout)
+
+        outcomes: list[tuple[str, dict[str, Any] | Exception]] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(unique), max_workers)) as executor:
+            futures = [executor.submit(run, query) for query in unique]
+            for query, future in zip(unique, futures):
+                try:
+                    outcomes.append((query, future.result()))
+                except JinaOpsError as exc:
+                    outcomes.append((query, exc))
+        with _trace_span("merge_search_results"):
+            return _merge_search_results(domain, outcomes)
+
+    def search_bibtex(
+        self,
+        query: str,
+        *,
+        num: int = 10,
+        year: int | None = None,
+        author: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """DBLP + Semantic Scholar search, deduplicated by DOI / arXiv id / title."""
+        return self._cached_search(
+            _SearchCache.key("bibtex", query=query, num=num, year=year, author=author),
+            lambda: self._search_bibtex(query, num=num, year=year, author=author, timeout=timeout),
+        )
+
+    def _search_bibtex(
+        self,
+        query: str,
+        *,
+        num: int,
+        year: int | None,
+        author: str | None,
+        timeout: float | None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        effective_timeout = timeout or self.timeout
+        dblp = _search_dblp(
+            query,
+            num=num,
+            year=year,
+            author=author,
+            timeout=effective_timeout,
+            transport=self.transport,
+        )
+        s2 = _search_semantic_scholar(
+            query,
+            num=num,
+            year=year,
+            timeout=effective_timeout,
+            transport=self.transport,
+        )
+        with _trace_span("deduplicate_bibtex"):
+            merged = _deduplicate_bibtex(dblp.entries + s2.entries)[:num]
+        return [entry.to_dict() for entry in merged], dblp.complete and s2.complete
+
+    def enrich_bibtex(self, ids: list[str], *, timeout: float | None = None) -> dict[str, Any]:
+        """BibTeX entries for known DOIs / arXiv ids via Semantic Scholar's batch endpoint."""
+        return _enrich_bibtex(list(ids), timeout=timeout or self.timeout, transport=self.transport)
+
+    def citation_graph(
+        self,
+        ids: list[str],
+        *,
+        depth: int = 1,
+        max_nodes: int = 200,
+        directions: Iterable[str] = CITATION_DIRECTIONS,
+        limit: int = 100,
+        endpoint_rate: float | None = DEFAULT_ENDPOINT_RATE,
+        concurrency: int = 4,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Expand references / citations of seed DOIs or arXiv ids via Semantic Scholar.
+
+        Returns `{"nodes", "edges", "errors", "truncated", "notFound", "invalid"}`:
+        one BibTeX entry per node (keys made unique) and citing -> cited edges
+        between node paperIds. `endpoint_rate` limits requests per second to
+        each Semantic Scholar endpoint.
+        """
+        directions = tuple(directions)
+        unknown = set(directions) - set(CITATION_DIRECTIONS)
+        if unknown or not directions:
+            raise JinaOpsError(f"directions must be a subset of {CITATION_DIRECTIONS}")
+        return _citation_graph(
+            list(ids),
+            max_depth=depth,
+            max_nodes=max_nodes,
+            directions=directions,
+            limit=min(limit, SEMANTIC_SCHOLAR_LINKS_LIMIT),
+            endpoint_rate=endpoint_rate,
+            concurrency=concurrency,
+            timeout=timeout or self.timeout,
+            transport=self.transport,
+        )
+
+    async def aread_url(self, url: str, **kwargs: Any) -> dict[str, Any]:
+        return await _to_thread(self.read_url, url, **kwargs)
+
+    async def aread_chunk(self, chunk_id: str) -> dict[str, Any]:
+        return await _to_thread(self.read_chunk, chunk_id)
+
+    async def aparallel_read_url(self, urls: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+        return await _to_thread(self.parallel_read_url, urls, **kwargs)
+
+    async def asearch_arxiv(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        return await _to_thread(self.search_arxiv, query, **kwargs)
+
+    async def asearch_ssrn(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        return await _to_thread(self.search_ssrn, query, **kwargs)
+
+    async def asearch_bibtex(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:
+        return await _to_thread(self.search_bibtex, query, **kwargs)
+
+    async def aenrich_bibtex(self, ids: list[str], **kwargs: Any) -> dict[str, Any]:
+        return await _to_thread(self.enrich_bibtex, ids, **kwargs)
+
+    async def acitation_graph(self, ids: list[str], **kwargs: Any) -> dict[str, Any]:
+        return await _to_thread(self.citation_graph, ids, **kwargs)
+
+
+async def _to_thread(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    import asyncio
+
+    return await asyncio.to_thread(fn, *args, **kwargs)
 
 
-def _cmd_search_bibtex(args: argparse.Namespace) -> CliResult:
-    dblp = _search_dblp(
+def _client_from_args(args: argparse.Namespace) -> JinaClient:
+    return JinaClient(
+        timeout=getattr(args, "timeout", 30.0),
+        cache=not getattr(args, "no_cache", True),
+        cache_ttl=getattr(args, "cache_ttl", 0.0),
+        negative_ttl=getattr(args, "negative_ttl", DEFAULT_NEGATIVE_TTL),
+        cache_max_entries=getattr(args, "cache_max_entries", DEFAULT_READ_CACHE_MAX_ENTRIES),
+        cache_max_age=getattr(args, "cache_max_age", DEFAULT_READ_CACHE_MAX_AGE),
+        search_cache_ttl=getattr(args, "search_cache_ttl", DEFAULT_SEARCH_CACHE_TTL),
+        search_cache_max_bytes=int(
+            getattr(args, "search_cache_max_mb", DEFAULT_SEARCH_CACHE_MAX_BYTES / 2**20) * 2**20
+        ),
+        rate_limit=args.rate_limit,
+    )
+
+
+def _server_file() -> Path:
+    return _default_cache_dir() / SERVER_FILE_NAME
+
+
+class _RemoteClient:
+    """JinaClient stand-in that forwards each call to a running `serve` daemon."""
+
+    def __init__(self, host: str, port: int, token: str, pid: int | None = None) -> None:
+        import http.client
+
+        self.token = token
+        self.conn = http.client.HTTPConnection(host, port, timeout=SERVER_CONNECT_TIMEOUT)
+        self._next_id = 0
+        self.conn.connect()
+        if pid is not None:
+            # A stale server.json can name a live, reused pid and a port that some
+            # other service now owns; only trust the daemon that answers as `pid`.
+            info = self.call("ping", {})
+            if not isinstance(info, dict) or info.get("pid") != pid:
+                self.close()
+                raise JinaOpsError(f"jina_ops server on {host}:{port} is not pid {pid}")
+        # Calls may legitimately run for as long as the upstream requests do.
+        self.conn.sock.settimeout(None)
+
+    def __enter__(self) -> _RemoteClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def call(self, method: str, params: dict[str, Any]) -> Any:
+        import http.client
+
+        self._next_id += 1
+        body = json.dumps({"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params})
+        try:
+            self.conn.request(
+                "POST",
+                "/",
+                body=body.encode("utf-8"),
+                headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.token}"},
+            )
+            resp = self.conn.getresponse()
+            reply = json.loads(resp.read())
+        except (OSError, http.client.HTTPException, json.JSONDecodeError) as exc:
+            raise JinaOpsError(f"jina_ops server connection failed: {exc}") from exc
+        if not isinstance(reply, dict):
+            raise JinaOpsError("jina_ops server connection failed: reply is not a JSON-RPC object")
+        error = reply.get("error")
+        if error:
+            status = (error.get("data") or {}).get("status")
+            raise JinaOpsError(str(error.get("message")), status=status)
+        return reply.get("result")
+
+    def read_url(self, url: str, **kwargs: Any) -> dict[str, Any]:
+        return self.call("read_url", {"url": url, **kwargs})
+
+    def read_chunk(self, chunk_id: str) -> dict[str, Any]:
+        return self.call("read_chunk", {"chunk_id": chunk_id})
+
+    def parallel_read_url(self, urls: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+        return self.call("parallel_read_url", {"urls": list(urls), **kwargs})
+
+    def search_arxiv(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        return self.call("search_arxiv", {"query": query, **kwargs})
+
+    def search_ssrn(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        return self.call("search_ssrn", {"query": query, **kwargs})
+
+    def search_many(self, queries: list[str], **kwargs: Any) -> dict[str, Any]:
+        return self.call("search_many", {"queries": list(queries), **kwargs})
+
+    def search_bibtex(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:
+        return self.call("search_bibtex", {"query": query, **kwargs})
+
+    def enrich_bibtex(self, ids: list[str], **kwargs: Any) -> dict[str, Any]:
+        return self.call("enrich_bibtex", {"ids": list(ids), **kwargs})
+
+    def citation_graph(self, ids: list[str], **kwargs: Any) -> dict[str, Any]:
+        return self.call("citation_graph", {"ids": list(ids), **kwargs})
+
+
+def _connect_server() -> _RemoteClient | None:
+    """Return a client for the daemon described by server.json, if it is up."""
+    try:
+        info = json.loads(_server_file().read_text(encoding="utf-8"))
+        pid = int(info["pid"])
+        os.kill(pid, 0)
+        return _RemoteClient(str(info["host"]), int(info["port"]), str(info["token"]), pid=pid)
+    except (OSError, ValueError, KeyError, TypeError, JinaOpsError):
+        return None
+
+
+# Client settings the daemon fixes at startup; a call that asks for anything else runs locally.
+_LOCAL_CLIENT_DEFAULTS: dict[str, Any] = {
+    "cache_ttl": 0.0,
+    "negative_ttl": DEFAULT_NEGATIVE_TTL,
+    "cache_max_entries": DEFAULT_READ_CACHE_MAX_ENTRIES,
+    "cache_max_age": DEFAULT_READ_CACHE_MAX_AGE,
+    "search_cache_ttl": DEFAULT_SEARCH_CACHE_TTL,
+    "search_cache_max_mb": DEFAULT_SEARCH_CACHE_MAX_BYTES / 2**20,
+    "rate_limit": None,
+}
+
+
+def _should_forward(args: argparse.Namespace) -> bool:
+    """Local-only options (tracing, metrics, cache and rate settings) keep the call in-process."""
+    if args.command.replace("-", "_") not in RPC_METHODS or args.no_server:
+        return False
+    if args.trace or args.trace_file or args.metrics_file or args.metrics_json:
+        return False
+    if any(getattr(args, name, default) != default for name, default in _LOCAL_CLIENT_DEFAULTS.items()):
+        return False
+    return not getattr(args, "no_cache", False)
+
+
+def _rpc_error(request_id: Any, code: int, message: str, status: int | None = None) -> dict[str, Any]:
+    error: dict[str, Any] = {"code": code, "message": message}
+    if status is not None:
+        error["data"] = {"status": status}
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+
+def _dispatch_rpc(client: JinaClient, request: Any) -> dict[str, Any]:
+    if not isinstance(request, dict):
+        return _rpc_error(None, -32600, "Invalid request")
+    request_id = request.get("id")
+    method = request.get("method")
+    params = request.get("params") or {}
+    if method == "ping":
+        return {"jsonrpc": "2.0", "id": request_id, "result": {"pid": os.getpid()}}
+    if method not in RPC_METHODS:
+        return _rpc_error(request_id, -32601, f"Method not found: {method}")
+    if not isinstance(params, dict):
+        return _rpc_error(request_id, -32602, "params must be an object")
+    import inspect
+
+    function = getattr(client, method)
+    try:
+        inspect.signature(function).bind(**params)
+    except TypeError as exc:
+        return _rpc_error(request_id, -32602, f"Invalid params: {exc}")
+    try:
+        result = function(**params)
+    except JinaOpsError as exc:
+        return _rpc_error(request_id, -32000, str(exc), exc.status)
+    except Exception as exc:  # noqa: BLE001
+        return _rpc_error(request_id, -32603, f"unexpected error: {exc}")
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _make_rpc_server(client: JinaClient, host: str, port: int, token: str) -> http.server.ThreadingHTTPServer:
+    import hmac
+    import http.server
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            supplied = self.headers.get("Authorization", "").removeprefix("Bearer ")
+            if not hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8")):
+                self._reply(401, _rpc_error(None, -32001, "Unauthorized"))
+                return
+            try:
+                request = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self._reply(200, _rpc_error(None, -32700, "Parse error"))
+                return
+            self._reply(200, _dispatch_rpc(client, request))
+
+        def _reply(self, status: int, reply: dict[str, Any]) -> None:
+            body = json.dumps(reply, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            return
+
+    server = http.server.ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def _write_server_file(path: Path, info: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        json.dump(info, handle)
+    os.replace(tmp_path, path)
+
+
+def _remove_server_file(path: Path) -> None:
+    try:
+        info = json.loads(path.read_text(encoding="utf-8"))
+        if info.get("pid") == os.getpid():
+            path.unlink()
+    except (OSError, ValueError):
+        pass
+
+
+def _cmd_serve(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    import secrets
+    import signal
+
+    token = secrets.token_urlsafe(32)
+    server = _make_rpc_server(client, args.host, args.port, token)
+    host, port = server.server_address[:2]
+    path = _server_file()
+    _write_server_file(path, {"host": host, "port": port, "pid": os.getpid(), "token": token})
+    print(json.dumps({"serving": f"http://{host}:{port}/", "serverFile": str(path)}), file=sys.stderr)
+
+    def stop(signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        _remove_server_file(path)
+    return CliResult(payload={"stopped": True})
+
+
+def _cmd_search_bibtex(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    merged = client.search_bibtex(
         args.query,
         num=args.num,
         year=args.year,
         author=args.author,
         timeout=args.timeout,
     )
-    s2 = _search_semantic_scholar(
-        args.query,
-        num=args.num,
-        year=args.year,
+    if args.bib_out:
+        return CliResult(payload={"query": args.query, **_export_bib(merged, args)})
+    return CliResult(payload={"query": args.query, "results": merged})
+
+
+def _export_bib(entries: list[dict[str, Any]], args: argparse.Namespace) -> dict[str, Any]:
+    try:
+        with _BibExporter(Path(args.bib_out).expanduser(), append=args.append) as exporter:
+            for entry in entries:
+                exporter.add(entry)
+    except OSError as exc:
+        raise JinaOpsError(f"Failed to write --bib-out: {exc}") from exc
+    return exporter.summary()
+
+
+def _read_ids(args: argparse.Namespace) -> list[str]:
+    ids: list[str] = list(args.id or [])
+    if args.id_file:
+        ids.extend(_read_list_file(args.id_file, "--id-file"))
+    ids = list(dict.fromkeys(item.strip() for item in ids if item.strip()))
+    if not ids:
+        raise JinaOpsError("At least one --id or a non-empty --id-file is required")
+    return ids
+
+
+def _cmd_citation_graph(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    payload = client.citation_graph(
+        _read_ids(args),
+        depth=args.depth,
+        max_nodes=args.max_nodes,
+        directions=CITATION_DIRECTIONS if args.direction == "both" else (args.direction,),
+        limit=args.limit,
+        endpoint_rate=args.endpoint_rate or None,
+        concurrency=args.concurrency,
         timeout=args.timeout,
     )
-    merged = _deduplicate_bibtex(dblp + s2)[: args.num]
-    return CliResult(payload={"query": args.query, "results": merged})
+    if args.bib_out:
+        payload = {**payload, **_export_bib(payload["nodes"], args)}
+    return CliResult(payload=payload)
+
+
+def _cmd_enrich_bibtex(client: JinaClient, args: argparse.Namespace) -> CliResult:
+    ids = _read_ids(args)
+    payload = client.enrich_bibtex(ids, timeout=args.timeout)
+    exit_code = 0 if payload["results"] else 1
+    if args.bib_out:
+        export = _export_bib(payload.pop("results"), args)
+        payload = {**payload, **export}
+    return CliResult(payload=payload, exit_code=exit_code)
+
+
+def _positive_int(text: str) -> int:
+    import argparse
+
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def _add_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0.0,
+        help="Serve cached pages younger than this many seconds; older ones are revalidated (default: 0)",
+    )
+    parser.add_argument(
+        "--negative-ttl",
+        type=float,
+        default=DEFAULT_NEGATIVE_TTL,
+        help="Skip URLs that failed repeatedly for this many seconds (default: 600)",
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=_positive_int,
+        default=DEFAULT_READ_CACHE_MAX_ENTRIES,
+        help=f"Keep at most this many cached pages, newest first (default: {DEFAULT_READ_CACHE_MAX_ENTRIES})",
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=DEFAULT_READ_CACHE_MAX_AGE,
+        help="Drop cached pages older than this many seconds (default: 30 days)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the read-url page cache")
+
+
+def _add_max_chars_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--max-chars",
+        type=_positive_int,
+        default=None,
+        help="Split longer content into heading-aware chunks; print the first and store the rest for read-chunk",
+    )
+
+
+def _add_bib_out_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--bib-out",
+        default=None,
+        help="Write the entries to this .bib file (keys made unique) and print a summary instead",
+    )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Append to --bib-out, skipping entries whose DOI / arXiv id it already has",
+    )
+
+
+def _add_search_cache_args(parser: argparse.ArgumentParser, *, no_cache_flag: bool = True) -> None:
+    parser.add_argument(
+        "--search-cache-ttl",
+        type=float,
+        default=DEFAULT_SEARCH_CACHE_TTL,
+        help="Reuse identical searches made within this many seconds; 0 disables (default: 86400)",
+    )
+    parser.add_argument(
+        "--search-cache-max-mb",
+        type=float,
+        default=DEFAULT_SEARCH_CACHE_MAX_BYTES / 2**20,
+        help="Evict the oldest cached searches beyond this many MB (default: 64)",
+    )
+    if no_cache_flag:
+        parser.add_argument("--no-cache", action="store_true", help="Disable the search cache")
 
 
 def _build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(description="Jina operations without MCP")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Add per-request phase timings (dns/connect/tls/ttfb/body/json_decode) to the JSON payload",
+    )
+    parser.add_argument(
+        "--trace-file",
+        default=None,
+        help="Write timings to this file in Chrome trace-event format",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Limit requests per second to each upstream host",
+    )
+    parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Run in-process even when a `serve` daemon is running",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=os.environ.get(METRICS_FILE_ENV) or None,
+        help=f"Write run metrics as a Prometheus textfile (.prom) on exit (default: ${METRICS_FILE_ENV})",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        action="store_true",
+        help="Print run metrics as JSON to stderr on exit",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     read = subparsers.add_parser("read-url", help="Extract readable content from one URL")
@@ -526,8 +3574,23 @@ def _build_parser() -> argparse.ArgumentParser:
     read.add_argument("--with-all-links", action="store_true")
     read.add_argument("--with-all-images", action="store_true")
     read.add_argument("--timeout", type=float, default=30.0)
+    read.add_argument(
+        "--max-bytes",
+        type=_positive_int,
+        default=None,
+        help="Abort when the decoded response body exceeds this many bytes",
+    )
+    _add_max_chars_arg(read)
+    _add_cache_args(read)
     read.set_defaults(handler=_cmd_read_url)
 
+    read_chunk = subparsers.add_parser(
+        "read-chunk",
+        help="Print one stored chunk of a page read with --max-chars",
+    )
+    read_chunk.add_argument("--id", required=True, help="Chunk id from the `chunks` list of read-url")
+    read_chunk.set_defaults(handler=_cmd_read_chunk)
+
     parallel_read = subparsers.add_parser(
         "parallel-read-url",
         help="Read multiple URLs in parallel",
@@ -535,21 +3598,50 @@ def _build_parser() -> argparse.ArgumentParser:
     parallel_read.add_argument("--url", action="append", required=True, help="Target URL (repeatable)")
     parallel_read.add_argument("--with-all-links", action="store_true")
     parallel_read.add_argument("--with-all-images", action="store_true")
-    parallel_read.add_argument("--timeout", type=float, default=30.0)
+    parallel_read.add_argument("--timeout", type=float, default=30.0, help="Per-URL deadline in seconds")
+    parallel_read.add_argument(
+        "--max-bytes",
+        type=_positive_int,
+        default=None,
+        help="Abort when the decoded response body exceeds this many bytes",
+    )
+    parallel_read.add_argument(
+        "--batch-timeout",
+        type=float,
+        default=None,
+        help="Stop the whole batch after this many seconds and return partial results",
+    )
+    parallel_read.add_argument(
+        "--hedge-after",
+        type=_hedge_after_arg,
+        default=None,
+        help="Send a duplicate request for a URL still running after SECONDS, or 'p95' of this batch",
+    )
+    parallel_read.add_argument(
+        "--keep-duplicates",
+        action="store_true",
+        help="Fetch mirror URL variants separately and do not merge pages with identical content",
+    )
+    _add_max_chars_arg(parallel_read)
+    _add_cache_args(parallel_read)
     parallel_read.set_defaults(handler=_cmd_parallel_read_url)
 
     arxiv = subparsers.add_parser("search-arxiv", help="Search arXiv papers via Jina Search API")
-    arxiv.add_argument("--query", required=True)
+    arxiv.add_argument("--query", action="append", help="Search query (repeatable)")
+    arxiv.add_argument("--query-file", default=None, help="File with one query per line ('-' for stdin)")
     arxiv.add_argument("--num", type=int, default=30)
     arxiv.add_argument("--tbs", default=None)
     arxiv.add_argument("--timeout", type=float, default=30.0)
+    _add_search_cache_args(arxiv)
     arxiv.set_defaults(handler=_cmd_search_arxiv)
 
     ssrn = subparsers.add_parser("search-ssrn", help="Search SSRN papers via Jina Search API")
-    ssrn.add_argument("--query", required=True)
+    ssrn.add_argument("--query", action="append", help="Search query (repeatable)")
+    ssrn.add_argument("--query-file", default=None, help="File with one query per line ('-' for stdin)")
     ssrn.add_argument("--num", type=int, default=30)
     ssrn.add_argument("--tbs", default=None)
     ssrn.add_argument("--timeout", type=float, default=30.0)
+    _add_search_cache_args(ssrn)
     ssrn.set_defaults(handler=_cmd_search_ssrn)
 
     bibtex = subparsers.add_parser("search-bibtex", help="Search BibTeX entries (DBLP + Semantic Scholar)")
@@ -558,30 +3650,133 @@ def _build_parser() -> argparse.ArgumentParser:
     bibtex.add_argument("--year", type=int, default=None)
     bibtex.add_argument("--author", default=None)
     bibtex.add_argument("--timeout", type=float, default=30.0)
+    _add_search_cache_args(bibtex)
+    _add_bib_out_args(bibtex)
     bibtex.set_defaults(handler=_cmd_search_bibtex)
 
+    enrich = subparsers.add_parser(
+        "enrich-bibtex",
+        help="Resolve known DOIs / arXiv ids to BibTeX entries (Semantic Scholar batch API)",
+    )
+    enrich.add_argument("--id", action="append", help="DOI or arXiv id (repeatable)")
+    enrich.add_argument("--id-file", default=None, help="File with one DOI or arXiv id per line ('-' for stdin)")
+    enrich.add_argument("--timeout", type=float, default=30.0)
+    _add_bib_out_args(enrich)
+    enrich.set_defaults(handler=_cmd_enrich_bibtex)
+
+    graph = subparsers.add_parser(
+        "citation-graph",
+        help="Expand references / citations of seed DOIs or arXiv ids (Semantic Scholar)",
+    )
+    graph.add_argument("--id", action="append", help="Seed DOI or arXiv id (repeatable)")
+    graph.add_argument("--id-file", default=None, help="File with one seed per line ('-' for stdin)")
+    graph.add_argument("--depth", type=int, default=1, help="Citation hops from the seeds (default: 1)")
+    graph.add_argument("--max-nodes", type=_positive_int, default=200, help="Node budget (default: 200)")
+    graph.add_argument(
+        "--direction",
+        choices=("references", "citations", "both"),
+        default="both",
+        help="Follow papers the node cites, papers citing it, or both (default)",
+    )
+    graph.add_argument(
+        "--limit",
+        type=_positive_int,
+        default=100,
+        help=f"References / citations fetched per paper (default: 100, max {SEMANTIC_SCHOLAR_LINKS_LIMIT})",
+    )
+    graph.add_argument(
+        "--endpoint-rate",
+        type=float,
+        default=DEFAULT_ENDPOINT_RATE,
+        help="Requests per second to each Semantic Scholar endpoint; 0 disables (default: 1)",
+    )
+    graph.add_argument("--concurrency", type=_positive_int, default=4)
+    graph.add_argument("--timeout", type=float, default=30.0)
+    _add_bib_out_args(graph)
+    graph.set_defaults(handler=_cmd_citation_graph)
+
+    crawl = subparsers.add_parser(
+        "crawl",
+        help="Breadth-first crawl from seed URLs, streaming one NDJSON line per page",
+    )
+    crawl.add_argument("--url", action="append", required=True, help="Seed URL (repeatable)")
+    crawl.add_argument("--max-depth", type=int, default=1, help="Link hops to follow from the seeds (default: 1)")
+    crawl.add_argument("--max-pages", type=_positive_int, default=20, help="Page budget (default: 20)")
+    crawl.add_argument(
+        "--scope",
+        choices=("same-origin", "any"),
+        default="same-origin",
+        help="Follow links only to the seeds' origins (default) or anywhere",
+    )
+    crawl.add_argument("--include", action="append", default=None, help="URL glob to follow (repeatable)")
+    crawl.add_argument("--exclude", action="append", default=None, help="URL glob to skip (repeatable)")
+    crawl.add_argument("--concurrency", type=_positive_int, default=5)
+    crawl.add_argument("--timeout", type=float, default=30.0)
+    crawl.add_argument(
+        "--max-bytes",
+        type=_positive_int,
+        default=None,
+        help="Abort a page when its decoded response body exceeds this many bytes",
+    )
+    _add_cache_args(crawl)
+    crawl.set_defaults(handler=_cmd_crawl)
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a local JSON-RPC daemon; other subcommands forward to it while it runs",
+    )
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+    serve.add_argument("--timeout", type=float, default=30.0, help="Default per-request timeout")
+    _add_cache_args(serve)
+    _add_search_cache_args(serve, no_cache_flag=False)
+    serve.set_defaults(handler=_cmd_serve)
+
     return parser
 
 
+def _write_trace_file(path: str | None) -> None:
+    if not path or _TRACER is None:
+        return
+    try:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(_TRACER.chrome_events(), handle)
+    except OSError as exc:
+        print(json.dumps({"error": f"failed to write trace file: {exc}"}, ensure_ascii=False), file=sys.stderr)
+
+
 def main() -> int:
     parser = _build_parser()
     args = parser.parse_args()
+    global _TRACER, _METRICS
+    if args.trace or args.trace_file:
+        _TRACER = _Tracer()
+    if args.metrics_file or args.metrics_json:
+        _METRICS = _Metrics()
     try:
-        result: CliResult = args.handler(args)
+        remote = _connect_server() if _should_forward(args) else None
+        with remote or _client_from_args(args) as client:
+            result: CliResult = args.handler(client, args)
     except JinaOpsError as exc:
         print(json.dumps({"error": str(exc)}, ensure_ascii=False, indent=2), file=sys.stderr)
         return 1
-    except concurrent.futures.TimeoutError:
-        print(json.dumps({"error": "parallel operation timeout"}, ensure_ascii=False, indent=2), file=sys.stderr)
-        return 1
     except Exception as exc:  # noqa: BLE001
         print(json.dumps({"error": f"unexpected error: {exc}"}, ensure_ascii=False, indent=2), file=sys.stderr)
         return 1
+    finally:
+        _write_trace_file(args.trace_file)
+        _write_metrics(args.metrics_file, args.metrics_json)
+
+    payload = result.payload
+    if payload is None:
+        return result.exit_code
+    if args.trace and _TRACER is not None:
+        payload = {**payload, "trace": _TRACER.summary()}
 
     if args.pretty:
-        print(json.dumps(result.payload, ensure_ascii=False, indent=2))
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
     else:
-        print(json.dumps(result.payload, ensure_ascii=False))
+        print(json.dumps(payload, ensure_ascii=False))
     return result.exit_code
 
 
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""HTTP transport for jina_ops: keep-alive pool, rate limiting, phase tracing.
+
+Kept out of jina_ops.py so that importing it (and building an opener, which
+loads the system CA bundle) only happens once a command actually talks to
+the network.
+
+Traces are duck-typed: anything with `add_phase(name, start, end)` can be
+passed to `Transport.open` to receive dns/connect/tls/rate_limit_wait
+timings.
+"""
+
+from __future__ import annotations
+
+import errno
+import http.client
+import socket
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from urllib import error as urlerror
+from urllib import request as urlrequest
+
+MAX_IDLE_CONNECTIONS_PER_HOST = 8
+
+_TRACE_LOCAL = threading.local()
+
+
+def _current_trace() -> Any:
+    return getattr(_TRACE_LOCAL, "current", None)
+
+
+def _connect_traced(conn: http.client.HTTPConnection) -> None:
+    """HTTPConnection.connect with DNS and TCP connect timed separately."""
+    trace = _current_trace()
+    start = time.perf_counter()
+    infos = socket.getaddrinfo(conn.host, conn.port, 0, socket.SOCK_STREAM)
+    resolved = time.perf_counter()
+    if trace is not None:
+        trace.add_phase("dns", start, resolved)
+
+    last_error: OSError | None = None
+    for _family, _type, _proto, _canonname, address in infos:
+        try:
+            conn.sock = socket.create_connection(address[:2], conn.timeout, conn.source_address)
+            break
+        except OSError as exc:
+            last_error = exc
+    else:
+        raise last_error or OSError(f"getaddrinfo returned no addresses for {conn.host}")
+    try:
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError as exc:
+        if exc.errno != errno.ENOPROTOOPT:
+            raise
+    if trace is not None:
+        trace.add_phase("connect", resolved, time.perf_counter())
+
+    if conn._tunnel_host:  # noqa: SLF001 - proxy CONNECT, as in http.client
+        tunnel_start = time.perf_counter()
+        conn._tunnel()  # noqa: SLF001
+        if trace is not None:
+            trace.add_phase("proxy_tunnel", tunnel_start, time.perf_counter())
+
+
+class TracedHTTPConnection(http.client.HTTPConnection):
+    def connect(self) -> None:
+        _connect_traced(self)
+
+
+class TracedHTTPSConnection(http.client.HTTPSConnection):
+    def connect(self) -> None:
+        _connect_traced(self)
+        trace = _current_trace()
+        start = time.perf_counter()
+        server_hostname = self._tunnel_host or self.host  # noqa: SLF001
+        self.sock = self._context.wrap_socket(self.sock, server_hostname=server_hostname)  # noqa: SLF001
+        if trace is not None:
+            trace.add_phase("tls", start, time.perf_counter())
+
+
+class ConnectionPool:
+    """Idle keep-alive connections, keyed by connection class and host."""
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_CONNECTIONS_PER_HOST) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._closed = False
+
+    def acquire(self, key: tuple[str, str]) -> http.client.HTTPConnection | None:
+        with self._lock:
+            stack = self._idle.get(key)
+            while stack:
+                conn = stack.pop()
+                if conn.sock is not None:
+                    return conn
+        return None
+
+    def release(self, key: tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if not self._closed:
+                stack = self._idle.setdefault(key, [])
+                if len(stack) < self.max_idle_per_host:
+                    stack.append(conn)
+                    return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = [conn for stack in self._idle.values() for conn in stack]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+
+class PooledResponse(http.client.HTTPResponse):
+    """Hands its connection back to the pool once the body was read to the end."""
+
+    pool_return: Callable[[bool], None] | None = None
+
+    def close(self) -> None:
+        # http.client drops fp only after the whole body has been consumed.
+        reusable = self.fp is None and not self.will_close
+        super().close()
+        pool_return, self.pool_return = self.pool_return, None
+        if pool_return is not None:
+            pool_return(reusable)
+
+
+def _open_pooled(
+    pool: ConnectionPool,
+    conn_class: type[http.client.HTTPConnection],
+    req: urlrequest.Request,
+    **kwargs: Any,
+) -> http.client.HTTPResponse:
+    """urllib's AbstractHTTPHandler.do_open without `Connection: close`."""
+    host = req.host
+    if not host:
+        raise urlerror.URLError("no host given")
+    headers = dict(req.unredirected_hdrs)
+    headers.update({key: value for key, value in req.headers.items() if key not in headers})
+    headers = {name.title(): value for name, value in headers.items()}
+    key = (conn_class.__name__, host)
+
+    conn = pool.acquire(key)
+    while True:
+        reused = conn is not None
+        if conn is None:
+            conn = conn_class(host, timeout=req.timeout, **kwargs)
+        else:
+            conn.timeout = req.timeout
+            conn.sock.settimeout(req.timeout)
+        conn.response_class = PooledResponse
+        try:
+            conn.request(
+                req.get_method(),
+                req.selector,
+                req.data,
+                headers,
+                encode_chunked=req.has_header("Transfer-encoding"),
+            )
+            resp = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as err:
+            conn.close()
+            if reused:
+                # The server closed an idle keep-alive connection; retry on a fresh one.
+                conn = None
+                continue
+            raise urlerror.URLError(err) from err
+        except OSError as err:
+            conn.close()
+            raise urlerror.URLError(err) from err
+        break
+
+    pooled_conn = conn
+
+    def pool_return(reusable: bool) -> None:
+        if reusable:
+            pool.release(key, pooled_conn)
+        else:
+            pooled_conn.close()
+
+    resp.pool_return = pool_return  # type: ignore[attr-defined]
+    resp.url = req.get_full_url()
+    resp.msg = resp.reason
+    return resp
+
+
+class PooledHTTPHandler(urlrequest.HTTPHandler):
+    def __init__(self, pool: ConnectionPool) -> None:
+        super().__init__()
+        self.pool = pool
+
+    def http_open(self, req: urlrequest.Request) -> http.client.HTTPResponse:
+        if req._tunnel_host:  # noqa: SLF001 - proxied requests keep urllib's one-shot path
+            return self.do_open(TracedHTTPConnection, req)
+        return _open_pooled(self.pool, TracedHTTPConnection, req)
+
+
+class PooledHTTPSHandler(urlrequest.HTTPSHandler):
+    def __init__(self, pool: ConnectionPool) -> None:
+        super().__init__()
+        self.pool = pool
+
+    def https_open(self, req: urlrequest.Request) -> http.client.HTTPResponse:
+        if req._tunnel_host:  # noqa: SLF001
+            return self.do_open(TracedHTTPSConnection, req, context=self._context)
+        return _open_pooled(self.pool, TracedHTTPSConnection, req, context=self._context)
+
+
+class RateLimiter:
+    """Token bucket per host: `rate` requests per second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def acquire(self, key: str) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(key, (float(self.burst), now))
+                tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[key] = (tokens - 1, now)
+                    return
+                self._buckets[key] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+class Transport:
+    """Opener over a keep-alive connection pool, with optional rate limiting."""
+
+    def __init__(self, *, rate_limit: float | None = None, burst: int = 1) -> None:
+        self.pool = ConnectionPool()
+        self.limiter = RateLimiter(rate_limit, burst) if rate_limit else None
+        self.opener = urlrequest.build_opener(
+            PooledHTTPHandler(self.pool),
+            PooledHTTPSHandler(self.pool),
+        )
+
+    def open(self, req: urlrequest.Request, timeout: float, trace: Any = None) -> Any:
+        """Open `req`; the response must be closed to return its connection."""
+        _TRACE_LOCAL.current = trace
+        try:
+            if self.limiter is not None:
+                start = time.perf_counter()
+                self.limiter.acquire(req.host)
+                if trace is not None:
+                    trace.add_phase("rate_limit_wait", start, time.perf_counter())
+            return self.opener.open(req, timeout=timeout)
+        finally:
+            _TRACE_LOCAL.current = None
+
+    def close(self) -> None:
+        self.pool.close()
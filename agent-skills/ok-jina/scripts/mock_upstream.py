@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Local stand-in for the upstream APIs jina_ops talks to.
+
+One server imitates all of them under path prefixes:
+- /r/     r.jina.ai         POST {"url"} -> {"data": {"url", "title", "content", "links"?}}
+- /svip/  svip.jina.ai      POST {"q", "domain", "num"} -> {"results": [...]}
+- /dblp/  DBLP              GET search/publ/api?q=&h=&f=
+- /s2/    Semantic Scholar  GET graph/v1/paper/search, POST graph/v1/paper/batch,
+                            GET graph/v1/paper/<id>/references|citations
+
+Latency, jitter, error rate and payload sizes are configurable, and
+responses are deterministic for a given seed, so network paths can be
+tested and benchmarked offline. Running it prints one JSON line with the
+base URL and the JINA_OPS_* endpoint overrides, then serves until killed:
+
+    python3 mock_upstream.py --latency-ms 40 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib import parse as urlparse
+
+DEFAULT_PAGE_BYTES = 16 * 1024
+DEFAULT_TOTAL_HITS = 1000
+DEFAULT_LINKS = 20
+WORDS = (
+    "adaptive attention bayesian caching compression contrastive convex distributed efficient "
+    "embedding federated graph hierarchical inference kernel language latent learning memory "
+    "model multimodal network neural optimization parallel probabilistic quantized reasoning "
+    "retrieval robust scalable search sparse spectral streaming structured temporal transformer "
+    "uncertainty variational vision"
+).split()
+LOREM = (
+    "Mock upstream paragraph with enough ordinary words to look like extracted page text. "
+    "It repeats deterministically so payload sizes stay exact across runs. "
+)
+PAPER_LINK_PATH = re.compile(r"^/s2/graph/v1/paper/([^/]+)/(references|citations)$")
+
+
+def _page_content(url: str, size: int) -> str:
+    """Markdown of about `size` characters, with a heading every few paragraphs."""
+    parts = [f"# {url}\n\n"]
+    length = len(parts[0])
+    section = 0
+    while length < size:
+        if section % 4 == 0:
+            heading = f"## Section {section // 4 + 1}\n\n"
+            parts.append(heading)
+            length += len(heading)
+        paragraph = LOREM * 3 + "\n\n"
+        parts.append(paragraph)
+        length += len(paragraph)
+        section += 1
+    return "".join(parts)[:size]
+
+
+def _title(number: int, query: str = "") -> str:
+    # A distinct first word keeps generated BibTeX keys (first word + year) apart.
+    words = random.Random(number).sample(WORDS, 6)
+    return " ".join([f"Mock{number}:", *([query] if query else []), *words])
+
+
+def _paper(number: int, query: str = "") -> dict[str, Any]:
+    external: dict[str, str] = {"DOI": f"10.5555/mock.{number}"}
+    if number % 3 == 0:
+        external["ArXiv"] = f"2401.{number:05d}"
+    return {
+        "paperId": f"mock{number:08d}",
+        "title": _title(number, query),
+        "authors": [{"name": "Ada Lovelace"}, {"name": f"Author {number % 97}"}],
+        "year": 2000 + number % 25,
+        "venue": "Mock Conference on Benchmarks" if number % 2 else "Journal of Mock Results",
+        "externalIds": external,
+        "abstract": LOREM,
+        "citationCount": number % 500,
+        "url": f"https://www.semanticscholar.org/paper/mock{number:08d}",
+    }
+
+
+def _dblp_hit(number: int, query: str) -> dict[str, Any]:
+    # Even-numbered hits share their DOI with the Semantic Scholar paper, as real overlap does.
+    doi = f"10.5555/mock.{number}" if number % 2 == 0 else f"10.5555/dblp.{number}"
+    return {
+        "info": {
+            "title": _title(number, query) + ".",
+            "authors": {"author": [{"text": "Ada Lovelace"}, {"text": f"Author {number % 97}"}]},
+            "venue": "MockConf",
+            "year": str(2000 + number % 25),
+            "type": "Conference and Workshop Papers" if number % 2 else "Journal Articles",
+            "doi": doi,
+            "ee": f"https://doi.org/{doi}",
+        }
+    }
+
+
+def _query_seed(query: str) -> int:
+    return sum(ord(char) for char in query) * 7919
+
+
+class MockUpstream:
+    """Threaded mock server; use as a context manager or call start()/stop()."""
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        page_bytes: int = DEFAULT_PAGE_BYTES,
+        total_hits: int = DEFAULT_TOTAL_HITS,
+        links: int = DEFAULT_LINKS,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.page_bytes = page_bytes
+        self.total_hits = total_hits
+        self.links = links
+        self.counts: dict[str, int] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body are separate writes; without this, delayed ACKs add ~40ms.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self) -> None:  # noqa: N802
+                mock._handle(self, None)
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                mock._handle(self, self.rfile.read(length))
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                return
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            # The default backlog of 5 drops SYNs under benchmark load (1s retransmits).
+            request_queue_size = 256
+
+        self.server = Server((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}/"
+        self._thread: threading.Thread | None = None
+
+    def env(self) -> dict[str, str]:
+        """Environment overrides that point jina_ops at this server."""
+        return {
+            "JINA_OPS_R_JINA_API": f"{self.url}r/",
+            "JINA_OPS_SVIP_JINA_API": f"{self.url}svip/",
+            "JINA_OPS_DBLP_API": f"{self.url}dblp/search/publ/api",
+            "JINA_OPS_SEMANTIC_SCHOLAR_API": f"{self.url}s2/graph/v1/paper/",
+        }
+
+    def start(self) -> MockUpstream:
+        self._thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> MockUpstream:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _delay_and_fail(self) -> bool:
+        with self._lock:
+            delay = self.latency + (self._rng.uniform(0.0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        return fail
+
+    def _handle(self, handler: BaseHTTPRequestHandler, body: bytes | None) -> None:
+        parts = urlparse.urlsplit(handler.path)
+        params = {key: values[-1] for key, values in urlparse.parse_qs(parts.query).items()}
+        try:
+            payload = json.loads(body) if body else {}
+        except json.JSONDecodeError:
+            self._reply(handler, 400, {"error": "invalid JSON body"})
+            return
+
+        route, status, data = self._route(handler, parts.path, params, payload)
+        with self._lock:
+            self.counts[route] = self.counts.get(route, 0) + 1
+        if status == 200 and self._delay_and_fail():
+            status, data = 503, {"error": "mock upstream error"}
+        self._reply(handler, status, data)
+
+    def _route(
+        self,
+        handler: BaseHTTPRequestHandler,
+        path: str,
+        params: dict[str, str],
+        payload: Any,
+    ) -> tuple[str, int, Any]:
+        method = handler.command
+        if method == "POST" and path == "/r/":
+            return "read", 200, self._read(str(payload.get("url") or ""), handler)
+        if method == "POST" and path == "/svip/":
+            return "svip", 200, self._svip(payload)
+        if method == "GET" and path == "/dblp/search/publ/api":
+            return "dblp", 200, self._dblp(params)
+        if method == "GET" and path == "/s2/graph/v1/paper/search":
+            return "s2_search", 200, self._s2_search(params)
+        if method == "POST" and path == "/s2/graph/v1/paper/batch":
+            ids = payload.get("ids") if isinstance(payload, dict) else None
+            if not isinstance(ids, list):
+                return "s2_batch", 400, {"error": "ids must be a list"}
+            return "s2_batch", 200, [_paper(_query_seed(str(paper_id)) % 100000) for paper_id in ids]
+        match = PAPER_LINK_PATH.match(path)
+        if method == "GET" and match:
+            return "s2_links", 200, self._s2_links(urlparse.unquote(match.group(1)), match.group(2), params)
+        return "unknown", 404, {"error": f"no mock route for {method} {path}"}
+
+    def _read(self, url: str, handler: BaseHTTPRequestHandler) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "url": url,
+            "title": f"Mock page {url}",
+            "content": _page_content(url, self.page_bytes),
+        }
+        if handler.headers.get("X-With-Links-Summary"):
+            base = url.rstrip("/")
+            data["links"] = [[f"Link {index}", f"{base}/page-{index}"] for index in range(self.links)]
+        return {"code": 200, "status": 20000, "data": data}
+
+    def _svip(self, payload: dict[str, Any]) -> dict[str, Any]:
+        query = str(payload.get("q") or "")
+        num = max(0, int(payload.get("num") or 10))
+        seed = _query_seed(query)
+        results = []
+        for index in range(num):
+            number = (seed + index) % 100000
+            results.append(
+                {
+                    "title": _title(number, query),
+                    "url": f"https://arxiv.org/abs/2401.{number:05d}",
+                    "snippet": LOREM,
+                }
+            )
+        return {"results": results}
+
+    def _window(self, params: dict[str, str], size_key: str, offset_key: str) -> range:
+        size = int(params.get(size_key) or 10)
+        offset = int(params.get(offset_key) or 0)
+        return range(offset, min(offset + size, self.total_hits))
+
+    def _dblp(self, params: dict[str, str]) -> dict[str, Any]:
+        query = params.get("q", "")
+        seed = _query_seed(query)
+        hits = [_dblp_hit(seed + index, query) for index in self._window(params, "h", "f")]
+        return {"result": {"hits": {"@total": str(self.total_hits), "hit": hits}}}
+
+    def _s2_search(self, params: dict[str, str]) -> dict[str, Any]:
+        query = params.get("query", "")
+        seed = _query_seed(query)
+        window = self._window(params, "limit", "offset")
+        return {
+            "total": self.total_hits,
+            "offset": window.start,
+            "data": [_paper(seed + index, query) for index in window],
+        }
+
+    def _s2_links(self, paper_id: str, direction: str, params: dict[str, str]) -> dict[str, Any]:
+        limit = min(int(params.get("limit") or 100), self.links)
+        seed = _query_seed(f"{paper_id}/{direction}")
+        field = "citedPaper" if direction == "references" else "citingPaper"
+        return {"data": [{field: _paper((seed + index) % 100000)} for index in range(limit)]}
+
+    def _reply(self, handler: BaseHTTPRequestHandler, status: int, data: Any) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if "gzip" in (handler.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        handler.send_response(status)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Mock r.jina.ai / svip.jina.ai / DBLP / Semantic Scholar")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniformly random delay, up to this")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--page-bytes", type=int, default=DEFAULT_PAGE_BYTES, help="read-url content size")
+    parser.add_argument("--total-hits", type=int, default=DEFAULT_TOTAL_HITS, help="Search results per query")
+    parser.add_argument("--links", type=int, default=DEFAULT_LINKS, help="Links per page and per paper")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mock = MockUpstream(
+        host=args.host,
+        port=args.port,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        page_bytes=args.page_bytes,
+        total_hits=args.total_hits,
+        links=args.links,
+        seed=args.seed,
+    )
+    print(json.dumps({"url": mock.url, "env": mock.env()}), flush=True)
+    try:
+        mock.server.serve_forever(poll_interval=0.05)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
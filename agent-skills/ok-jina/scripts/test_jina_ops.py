@@ -3,20 +3,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import importlib.util
+import gzip
+import json
+import os
 import pathlib
+import socket
+import subprocess
 import sys
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
 
-def _load_module():
+def _load_module(name: str = "jina_ops"):
     here = pathlib.Path(__file__).resolve().parent
-    target = here / "jina_ops.py"
-    spec = importlib.util.spec_from_file_location("jina_ops", target)
+    target = here / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, target)
     assert spec and spec.loader
     module = importlib.util.module_from_spec(spec)
-    sys.modules["jina_ops"] = module
+    sys.modules[name] = module
     spec.loader.exec_module(module)  # type: ignore[attr-defined]
     return module
 
@@ -24,6 +35,63 @@ def _load_module():
 jina_ops = _load_module()
 
 
+class _StubUpstream:
+    """Local HTTP stub. `respond(handler)` returns (status, headers, body)."""
+
+    def __init__(self, respond, protocol_version: str = "HTTP/1.0") -> None:
+        self.requests: list[dict[str, str]] = []
+        self.client_ports: list[int] = []
+        self.bodies: list[bytes] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                self.body = self.rfile.read(length)
+                stub.bodies.append(self.body)
+                self._reply()
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._reply()
+
+            def _reply(self) -> None:
+                stub.requests.append({key.lower(): value for key, value in self.headers.items()})
+                stub.client_ports.append(self.client_address[1])
+                status, headers, body = respond(self)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                return
+
+        Handler.protocol_version = protocol_version
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    def __enter__(self) -> "_StubUpstream":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _page_body(content: str) -> bytes:
+    return json.dumps(
+        {"data": {"url": "https://example.com/", "title": "Example", "content": content}}
+    ).encode("utf-8")
+
+
 class JinaOpsUnitTest(unittest.TestCase):
     def test_normalize_url_adds_scheme(self) -> None:
         self.assertEqual(
@@ -31,6 +99,37 @@ class JinaOpsUnitTest(unittest.TestCase):
             "https://example.com/path",
         )
 
+    def test_canonical_url_drops_tracking_params(self) -> None:
+        self.assertEqual(
+            jina_ops._canonical_url("HTTPS://Example.COM:443/a/b?utm_source=x&id=2&fbclid=y#top"),
+            "https://example.com/a/b?id=2",
+        )
+        # A scheme embedded in the path must survive canonicalization.
+        archived = "https://web.archive.org/web/2020/https://example.com/a"
+        self.assertEqual(jina_ops._canonical_url(archived), archived)
+        self.assertEqual(
+            jina_ops._mirror_key(jina_ops._canonical_url("https://example.com//a//b")),
+            jina_ops._mirror_key(jina_ops._canonical_url("https://example.com/a/b")),
+        )
+        self.assertEqual(
+            jina_ops._mirror_key(jina_ops._canonical_url("http://www.example.com/a/?b=1&a=2")),
+            jina_ops._mirror_key(jina_ops._canonical_url("https://example.com/a?a=2&b=1")),
+        )
+
+    def test_chunks_follow_headings_and_keep_content(self) -> None:
+        content = (
+            "# Intro\n" + "word " * 30 + "\n\n"
+            "## Setup\n```\n# not a heading\n```\n" + "x" * 250 + "\n"
+            "## Results\nshort\n"
+        )
+        chunks = jina_ops._chunk_markdown(content, 100)
+
+        self.assertEqual("".join(body for _heading, body in chunks), content)
+        self.assertTrue(all(len(body) <= 100 for _heading, body in chunks))
+        self.assertEqual(chunks[0][0], "Intro")
+        self.assertTrue(chunks[-1][1].endswith("## Results\nshort\n"))
+        self.assertNotIn("not a heading", [heading for heading, _body in chunks])
+
     def test_normalize_doi(self) -> None:
         self.assertEqual(
             jina_ops._normalize_doi("https://doi.org/10.1000/xyz"),
@@ -72,6 +171,20 @@ class JinaOpsUnitTest(unittest.TestCase):
         self.assertEqual(len(merged), 1)
         self.assertEqual(merged[0]["citations"], 100)
 
+    def test_bib_entry_renders_bibtex_lazily(self) -> None:
+        first = jina_ops.BibEntry(title="A paper", year=2020, doi="10.1000/xyz", source="dblp")
+        second = jina_ops.BibEntry(title="A paper", year=2020, arxiv_id="2001.00001", source="semanticscholar")
+        with mock.patch.object(jina_ops, "_make_bibtex", wraps=jina_ops._make_bibtex) as render:
+            merged = jina_ops._deduplicate_bibtex([first, second])
+            self.assertEqual(render.call_count, 0)
+            record = merged[0].to_dict()
+            self.assertEqual(merged[0]["bibtex"], record["bibtex"])
+            self.assertEqual(render.call_count, 1)
+        self.assertEqual(record["key"], "a2020")
+        self.assertNotIn("volume", record)
+        self.assertIn("eprint = {2001.00001}", record["bibtex"])
+        self.assertEqual(merged[0].get("arxiv_id"), "2001.00001")
+
     def test_default_user_agent_added(self) -> None:
         headers = jina_ops._with_default_headers({"Accept": "application/json"})
         self.assertEqual(headers["User-Agent"], jina_ops.DEFAULT_USER_AGENT)
@@ -81,6 +194,1040 @@ class JinaOpsUnitTest(unittest.TestCase):
             headers = jina_ops._with_default_headers({})
         self.assertEqual(headers["User-Agent"], "my-agent/1.0")
 
+    def test_concurrent_identical_reads_share_one_fetch(self) -> None:
+        calls: list[str] = []
+        start = threading.Barrier(5)
+
+        def fake_http_json_response(url: str, **kwargs: object) -> object:
+            calls.append(url)
+            time.sleep(0.2)
+            return jina_ops.HttpResponse(
+                status=200,
+                headers={},
+                data={"data": {"url": "https://example.com", "title": "t", "content": "c"}},
+            )
+
+        results: list[dict] = []
+
+        def worker() -> None:
+            start.wait()
+            results.append(
+                jina_ops._read_url(
+                    "example.com",
+                    with_all_links=False,
+                    with_all_images=False,
+                    timeout=5.0,
+                )
+            )
+
+        with mock.patch.object(jina_ops, "_http_json_response", side_effect=fake_http_json_response):
+            threads = [threading.Thread(target=worker) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(len({id(result) for result in results}), 5)
+
+    def test_single_flight_waiters_get_their_own_entries(self) -> None:
+        gate = threading.Event()
+        runs: list[int] = []
+        entries = [jina_ops.BibEntry(title="Shared", authors=["A. Author"], year=2024, source="dblp")]
+
+        def fetch(*args: object, **kwargs: object) -> object:
+            runs.append(1)
+            gate.wait(1.0)
+            return jina_ops.SearchResults(entries, True)
+
+        results: list[list] = []
+
+        def worker() -> None:
+            results.append(jina_ops._search_dblp("shared", num=1, year=None, author=None, timeout=5.0).entries)
+
+        with mock.patch.object(jina_ops, "_fetch_dblp", side_effect=fetch):
+            threads = [threading.Thread(target=worker) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.05)
+            gate.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(runs), 1)
+        waiters = [result for result in results if result is not entries]
+        self.assertEqual(len(waiters), 2)
+        waiters[0][0].title = "Changed"
+        waiters[0][0].authors.append("B. Author")
+        waiters[0].clear()
+        self.assertEqual(entries[0].title, "Shared")
+        self.assertEqual(waiters[1][0].title, "Shared")
+        self.assertEqual(waiters[1][0].authors, ["A. Author"])
+
+    def test_single_flight_propagates_errors_to_waiters(self) -> None:
+        flight = jina_ops._SingleFlight()
+        gate = threading.Event()
+        errors: list[BaseException] = []
+        runs: list[int] = []
+
+        def failing() -> None:
+            runs.append(1)
+            gate.wait(1.0)
+            raise jina_ops.JinaOpsError("boom")
+
+        def worker() -> None:
+            try:
+                flight.do("key", failing)
+            except jina_ops.JinaOpsError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        gate.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(len(errors), 3)
+
+
+
+class HttpTransportTest(unittest.TestCase):
+    def test_gzip_body_is_decoded_and_encoding_negotiated(self) -> None:
+        payload = {"data": {"content": "x" * 100_000}}
+
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            body = gzip.compress(json.dumps(payload).encode("utf-8"))
+            return 200, {"Content-Encoding": "gzip"}, body
+
+        with _StubUpstream(respond) as stub:
+            data = jina_ops._http_json(stub.url, method="GET", timeout=5.0)
+        self.assertEqual(data, payload)
+        self.assertIn("gzip", stub.requests[0]["accept-encoding"])
+
+    def test_max_bytes_aborts_oversized_compressed_body(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            body = gzip.compress(json.dumps({"content": "x" * 200_000}).encode("utf-8"))
+            return 200, {"Content-Encoding": "gzip"}, body
+
+        with _StubUpstream(respond) as stub:
+            with self.assertRaisesRegex(jina_ops.JinaOpsError, "max-bytes"):
+                jina_ops._http_json(stub.url, method="GET", timeout=5.0, max_bytes=10_000)
+
+    def test_max_bytes_rejects_declared_length_early(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {}, json.dumps({"content": "x" * 5000}).encode("utf-8")
+
+        with _StubUpstream(respond) as stub:
+            with self.assertRaisesRegex(jina_ops.JinaOpsError, "max-bytes"):
+                jina_ops._http_json(stub.url, method="GET", timeout=5.0, max_bytes=100)
+
+
+class TraceTest(unittest.TestCase):
+    def test_request_phases_are_recorded(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body("hello")
+
+        tracer = jina_ops._Tracer()
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "_TRACER", tracer), \
+                mock.patch.object(jina_ops, "R_JINA_API", stub.url):
+            jina_ops._read_url(
+                "https://example.com/trace",
+                with_all_links=False,
+                with_all_images=False,
+                timeout=5.0,
+            )
+
+        summary = tracer.summary()
+        self.assertEqual(len(summary["requests"]), 1)
+        request = summary["requests"][0]
+        self.assertEqual(request["status"], 200)
+        for phase in ("dns", "connect", "ttfb", "body", "json_decode"):
+            self.assertIn(phase, request["phasesMs"])
+        self.assertEqual([span["name"] for span in summary["local"]], ["structure_read_result"])
+
+        events = tracer.chrome_events()["traceEvents"]
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        self.assertIn("ttfb", {event["name"] for event in events})
+
+
+class ReadCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        store = jina_ops._CacheStore(pathlib.Path(self.tmp.name) / "cache.sqlite3")
+        self.addCleanup(store.close)
+        self.cache = jina_ops._ReadCache(store, ttl=0.0, negative_ttl=60.0)
+
+    def _read(self, max_bytes: int | None = None) -> dict:
+        return jina_ops._read_url(
+            "https://example.com/",
+            with_all_links=False,
+            with_all_images=False,
+            timeout=5.0,
+            cache=self.cache,
+            max_bytes=max_bytes,
+        )
+
+    def test_expired_entry_is_revalidated_and_reused_on_304(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            if handler.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"ETag": '"v1"', "Content-Type": "application/json"}, _page_body("hello")
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url):
+            first = self._read()
+            second = self._read()
+
+        self.assertEqual(first["content"], "hello")
+        self.assertEqual(second, first)
+        self.assertNotIn("if-none-match", stub.requests[0])
+        self.assertEqual(stub.requests[1]["if-none-match"], '"v1"')
+
+    def test_fresh_entry_skips_upstream(self) -> None:
+        self.cache.ttl = 60.0
+
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body("hello")
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url):
+            self._read()
+            self._read()
+        self.assertEqual(len(stub.requests), 1)
+
+    def test_repeated_failures_are_negatively_cached(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 502, {}, b"bad gateway"
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url):
+            for _ in range(jina_ops.NEGATIVE_CACHE_THRESHOLD):
+                with self.assertRaises(jina_ops.JinaOpsError):
+                    self._read()
+            with self.assertRaisesRegex(jina_ops.JinaOpsError, "negative cache"):
+                self._read()
+        self.assertEqual(len(stub.requests), jina_ops.NEGATIVE_CACHE_THRESHOLD)
+
+    def test_network_errors_are_not_negatively_cached(self) -> None:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with mock.patch.object(jina_ops, "R_JINA_API", f"http://127.0.0.1:{port}/"):
+            for _ in range(jina_ops.NEGATIVE_CACHE_THRESHOLD + 1):
+                with self.assertRaisesRegex(jina_ops.JinaOpsError, "Network error"):
+                    self._read()
+
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body("back")
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url):
+            self.assertEqual(self._read()["content"], "back")
+
+    def test_max_bytes_aborts_are_not_negatively_cached(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body("x" * 1000)
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url):
+            for _ in range(jina_ops.NEGATIVE_CACHE_THRESHOLD + 1):
+                with self.assertRaisesRegex(jina_ops.JinaOpsError, "max-bytes"):
+                    self._read(max_bytes=100)
+            self.assertEqual(self._read()["content"], "x" * 1000)
+        self.assertEqual(len(stub.requests), jina_ops.NEGATIVE_CACHE_THRESHOLD + 2)
+
+    def test_old_and_excess_entries_are_pruned_on_write(self) -> None:
+        self.cache.max_entries = 3
+        self.cache.max_age = 3600.0
+        store = self.cache.store
+        store.execute(
+            "INSERT INTO pages (key, stored_at, body) VALUES ('stale', ?, '{}')",
+            (time.time() - 7200,),
+        )
+        store.execute(
+            "INSERT INTO failures (key, count, last_failure) VALUES ('stale', 1, ?)",
+            (time.time() - 7200,),
+        )
+        for index in range(5):
+            self.cache.put(f"page{index}", {"content": str(index)}, {})
+        self.cache.record_failure("fresh", jina_ops.JinaOpsError("boom", status=502))
+
+        keys = sorted(row[0] for row in store.execute("SELECT key FROM pages"))
+        self.assertEqual(keys, ["page2", "page3", "page4"])
+        self.assertEqual(store.execute("SELECT key FROM failures"), [("fresh",)])
+
+
+class SearchCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = jina_ops._CacheStore(pathlib.Path(self.tmp.name) / "cache.sqlite3")
+        self.addCleanup(self.store.close)
+
+    def test_key_normalizes_query_and_drops_unset_params(self) -> None:
+        key = jina_ops._SearchCache.key
+        self.assertEqual(
+            key("arxiv", query="  Graph   Neural Nets ", num=10, tbs=None),
+            key("arxiv", query="graph neural nets", num=10),
+        )
+        self.assertNotEqual(key("arxiv", query="q", num=10), key("ssrn", query="q", num=10))
+        self.assertNotEqual(key("bibtex", query="q", num=10, year=2020), key("bibtex", query="q", num=10))
+
+    def test_ttl_and_size_cap(self) -> None:
+        cache = jina_ops._SearchCache(self.store, ttl=60.0, max_bytes=4000)
+        cache.put("a", {"results": ["x" * 100]})
+        self.assertEqual(cache.get("a"), {"results": ["x" * 100]})
+        cache.ttl = 0.0
+        self.assertIsNone(cache.get("a"))
+
+        cache.ttl = 60.0
+        noise = os.urandom(3000).hex()  # random hex: ~3 KB after compression
+        cache.put("b", noise)
+        cache.put("c", noise)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), noise)
+
+    def test_client_serves_repeated_search_from_cache(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            body = json.dumps({"results": [{"url": "https://arxiv.org/abs/2101.00001", "title": "Hit"}]})
+            return 200, {"Content-Type": "application/json"}, body.encode("utf-8")
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "SVIP_JINA_API", stub.url), \
+                mock.patch.dict("os.environ", {"JINA_API_KEY": "test", jina_ops.CACHE_DIR_ENV: self.tmp.name}), \
+                jina_ops.JinaClient() as client:
+            first = client.search_arxiv("Transformers", num=5)
+            second = client.search_arxiv("transformers ", num=5)
+            client.search_arxiv("transformers", num=6)
+            for _ in range(2):
+                client.search_arxiv("transformers", num=5, tbs="qdr:d")
+            for _ in range(2):
+                client.search_arxiv("transformers", num=5, tbs="cdr:1,cd_min:1/1/2020,cd_max:12/31/2020")
+
+        self.assertEqual(second, first)
+        self.assertEqual(len(stub.requests), 5)  # "past day" is never cached, a fixed range is
+
+    def test_incomplete_bibtex_results_are_not_cached(self) -> None:
+        entry = jina_ops.BibEntry(title="Partial hit", authors=["A. Author"], year=2024, source="dblp")
+        complete = [False, True]
+        calls: list[int] = []
+
+        def search_dblp(*args: object, **kwargs: object) -> object:
+            calls.append(1)
+            return jina_ops.SearchResults([entry.copy()], complete[len(calls) - 1])
+
+        empty = jina_ops.SearchResults([], True)
+        with mock.patch.object(jina_ops, "_search_dblp", side_effect=search_dblp), \
+                mock.patch.object(jina_ops, "_search_semantic_scholar", return_value=empty), \
+                mock.patch.dict("os.environ", {jina_ops.CACHE_DIR_ENV: self.tmp.name}), \
+                jina_ops.JinaClient() as client:
+            for _ in range(3):
+                results = client.search_bibtex("partial", num=5)
+                self.assertEqual([result["title"] for result in results], ["Partial hit"])
+
+        self.assertEqual(len(calls), 2)  # the partial first answer was retried, the complete one cached
+
+
+class MetricsTest(unittest.TestCase):
+    def test_requests_cache_and_latency_are_counted(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            if handler.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"ETag": '"v1"', "Content-Type": "application/json"}, _page_body("hello")
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = jina_ops._CacheStore(pathlib.Path(tmp.name) / "cache.sqlite3")
+        self.addCleanup(store.close)
+        cache = jina_ops._ReadCache(store, ttl=0.0, negative_ttl=60.0)
+        metrics = jina_ops._Metrics()
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "_METRICS", metrics), \
+                mock.patch.object(jina_ops, "R_JINA_API", stub.url):
+            for _ in range(2):
+                jina_ops._read_url(
+                    "https://example.com/",
+                    with_all_links=False,
+                    with_all_images=False,
+                    timeout=5.0,
+                    cache=cache,
+                )
+
+        endpoint = f"127.0.0.1:{stub.server.server_address[1]}"
+        text = metrics.render_prometheus()
+        self.assertIn(f'jina_ops_requests_total{{endpoint="{endpoint}"}} 2', text)
+        self.assertIn('jina_ops_cache_lookups_total{cache="read",result="miss"} 1', text)
+        self.assertIn('jina_ops_cache_lookups_total{cache="read",result="revalidated"} 1', text)
+        self.assertIn("jina_ops_cache_hit_ratio 0.500000", text)
+        self.assertIn(
+            'jina_ops_operation_duration_seconds_count{operation="read_url",outcome="ok"} 2',
+            text,
+        )
+        self.assertIn("# TYPE jina_ops_operation_duration_seconds histogram", text)
+        self.assertEqual(metrics.to_json()["cacheHitRatio"], 0.5)
+
+
+class DeadlineTest(unittest.TestCase):
+    def test_cli_exits_at_batch_deadline_with_slow_upstream(self) -> None:
+        release = threading.Event()
+
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            release.wait(6)
+            return 200, {"Content-Type": "application/json"}, _page_body("late")
+
+        with tempfile.TemporaryDirectory() as tmp, _StubUpstream(respond) as stub:
+            self.addCleanup(release.set)
+            env = {**os.environ, jina_ops.CACHE_DIR_ENV: tmp, "JINA_OPS_R_JINA_API": stub.url}
+            start = time.monotonic()
+            proc = subprocess.run(
+                [
+                    sys.executable, jina_ops.__file__, "--no-server", "parallel-read-url",
+                    "--url", "https://example.com/slow", "--batch-timeout", "1", "--timeout", "20",
+                ],
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            elapsed = time.monotonic() - start
+            release.set()
+
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertTrue(json.loads(proc.stdout)["results"][0]["timedOut"])
+        self.assertLess(elapsed, 4.0)
+
+    def test_stragglers_time_out_without_losing_finished_urls(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fetch(url: str, hedge: bool) -> dict:
+            if url.endswith("slow"):
+                release.wait(5)
+            return {"url": url}
+
+        start = time.monotonic()
+        results = jina_ops._read_urls_with_deadlines(
+            ["https://a/fast", "https://a/slow"],
+            fetch,
+            url_timeout=0.2,
+            batch_timeout=None,
+            hedge_after=None,
+            max_workers=2,
+        )
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(results[0], {"url": "https://a/fast", "success": True, "result": {"url": "https://a/fast"}})
+        self.assertFalse(results[1]["success"])
+        self.assertTrue(results[1]["timedOut"])
+
+    def test_batch_deadline_returns_partial_results(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fetch(url: str, hedge: bool) -> dict:
+            if url.endswith("slow"):
+                release.wait(5)
+            return {"url": url}
+
+        results = jina_ops._read_urls_with_deadlines(
+            ["https://a/fast", "https://a/slow"],
+            fetch,
+            url_timeout=30.0,
+            batch_timeout=0.2,
+            hedge_after=None,
+            max_workers=2,
+        )
+        self.assertTrue(results[0]["success"])
+        self.assertIn("batch deadline", results[1]["error"])
+
+    def test_hedge_wins_over_stuck_primary(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls: list[bool] = []
+
+        def fetch(url: str, hedge: bool) -> dict:
+            calls.append(hedge)
+            if not hedge:
+                release.wait(5)
+            return {"url": url, "hedge": hedge}
+
+        results = jina_ops._read_urls_with_deadlines(
+            ["https://a/slow"],
+            fetch,
+            url_timeout=5.0,
+            batch_timeout=None,
+            hedge_after=0.1,
+            max_workers=1,
+        )
+        self.assertEqual(calls, [False, True])
+        self.assertTrue(results[0]["success"])
+        self.assertTrue(results[0]["hedgeWon"])
+        self.assertTrue(results[0]["result"]["hedge"])
+
+
+class JinaClientTest(unittest.TestCase):
+    def test_client_reuses_keep_alive_connection(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body(handler.path)
+
+        with _StubUpstream(respond, protocol_version="HTTP/1.1") as stub, \
+                mock.patch.object(jina_ops, "R_JINA_API", stub.url), \
+                jina_ops.JinaClient(cache=False) as client:
+            client.read_url("https://example.com/a")
+            client.read_url("https://example.com/b")
+
+        self.assertEqual(len(stub.requests), 2)
+        self.assertEqual(len(set(stub.client_ports)), 1)
+        self.assertNotEqual(stub.requests[0].get("connection"), "close")
+
+    def test_async_methods_and_rate_limit(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body("hello")
+
+        async def read_three(client) -> list[dict]:
+            return await asyncio.gather(
+                *(client.aread_url(f"https://example.com/{index}") for index in range(3))
+            )
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url), \
+                jina_ops.JinaClient(cache=False, rate_limit=20.0) as client:
+            start = time.monotonic()
+            results = asyncio.run(read_three(client))
+            elapsed = time.monotonic() - start
+
+        self.assertEqual([result["content"] for result in results], ["hello"] * 3)
+        # burst=1 at 20 req/s: the third request waits for two refills.
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    def test_parallel_read_collapses_mirrors(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            content = "other" if json.loads(handler.body)["url"].endswith("/b") else "same page"
+            return 200, {"Content-Type": "application/json"}, _page_body(content)
+
+        urls = [
+            "http://www.example.com/a/?utm_source=feed",
+            "https://example.com/a",
+            "https://mirror.example.org/a",
+            "https://example.com/b",
+        ]
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url), \
+                jina_ops.JinaClient(cache=False) as client:
+            results = client.parallel_read_url(urls)
+            fetched = len(stub.requests)
+            separate = client.parallel_read_url(urls, keep_duplicates=True)
+
+        # The first two are variants of one URL and are fetched once, over https.
+        self.assertEqual(fetched, 3)
+        self.assertEqual([result["url"] for result in results], ["https://example.com/a", "https://example.com/b"])
+        self.assertEqual(results[0]["urls"], urls[:3])
+        self.assertEqual(results[1]["urls"], urls[3:])
+        self.assertEqual(len(separate), 4)
+
+
+    def test_max_chars_stores_chunks_for_read_chunk(self) -> None:
+        content = "".join(f"## Part {index}\n" + "text " * 20 + "\n" for index in range(5))
+
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body(content)
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.dict(os.environ, {jina_ops.CACHE_DIR_ENV: tmp}), \
+                _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url), \
+                jina_ops.JinaClient(cache=False) as client:
+            result = client.read_url("https://example.com/long", max_chars=250)
+            chunks = [client.read_chunk(item["id"]) for item in result["chunks"]]
+            with self.assertRaises(jina_ops.JinaOpsError):
+                client.read_chunk(result["chunks"][0]["id"].split(":")[0] + ":99")
+
+        self.assertEqual(len(stub.requests), 1)
+        self.assertEqual(result["contentChars"], len(content))
+        self.assertEqual(result["content"], chunks[0]["content"])
+        self.assertEqual("".join(chunk["content"] for chunk in chunks), content)
+        self.assertEqual([chunk["heading"] for chunk in chunks], [item["heading"] for item in result["chunks"]])
+        self.assertEqual(chunks[0]["next"], chunks[1]["id"])
+        self.assertIsNone(chunks[-1]["next"])
+
+
+class ServeTest(unittest.TestCase):
+    def test_remote_client_forwards_to_daemon(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "application/json"}, _page_body("served")
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "R_JINA_API", stub.url), \
+                mock.patch.dict("os.environ", {jina_ops.CACHE_DIR_ENV: tmp.name}), \
+                jina_ops.JinaClient(cache=False) as client:
+            server = jina_ops._make_rpc_server(client, "127.0.0.1", 0, "secret")
+            thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+            thread.start()
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+            host, port = server.server_address[:2]
+            path = jina_ops._server_file()
+            jina_ops._write_server_file(path, {"host": host, "port": port, "pid": os.getpid(), "token": "secret"})
+
+            self.assertEqual(path.stat().st_mode & 0o777, 0o600)
+            remote = jina_ops._connect_server()
+            self.assertIsNotNone(remote)
+            with remote:
+                result = remote.read_url("https://example.com/", timeout=5.0)
+                with self.assertRaisesRegex(jina_ops.JinaOpsError, "Method not found"):
+                    remote.call("shutdown", {})
+            self.assertEqual(result["content"], "served")
+
+            with jina_ops._RemoteClient(host, port, "wrong") as intruder:
+                with self.assertRaisesRegex(jina_ops.JinaOpsError, "Unauthorized"):
+                    intruder.read_url("https://example.com/")
+        self.assertEqual(len(stub.requests), 1)
+
+    def test_dispatch_separates_bad_params_from_internal_errors(self) -> None:
+        with jina_ops.JinaClient(cache=False) as client:
+            reply = jina_ops._dispatch_rpc(
+                client, {"id": 1, "method": "read_url", "params": {"url": "https://a.test/", "bogus": 1}}
+            )
+            self.assertEqual(reply["error"]["code"], -32602)
+            with mock.patch.object(
+                jina_ops.JinaClient, "read_url", autospec=True, side_effect=TypeError("bug inside read_url")
+            ):
+                reply = jina_ops._dispatch_rpc(
+                    client, {"id": 2, "method": "read_url", "params": {"url": "https://a.test/"}}
+                )
+            self.assertEqual(reply["error"]["code"], -32603)
+            self.assertIn("bug inside read_url", reply["error"]["message"])
+
+    def test_chunk_store_is_created_once_across_threads(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        opened: list[object] = []
+        real_open = jina_ops._open_cache_store
+
+        def slow_open() -> object:
+            time.sleep(0.05)
+            store = real_open()
+            opened.append(store)
+            return store
+
+        stores: list[object] = []
+        with mock.patch.dict("os.environ", {jina_ops.CACHE_DIR_ENV: tmp.name}), \
+                mock.patch.object(jina_ops, "_open_cache_store", side_effect=slow_open), \
+                jina_ops.JinaClient(cache=False) as client:
+            threads = [threading.Thread(target=lambda: stores.append(client._chunks())) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(all(store is stores[0] for store in stores))
+
+    def test_missing_or_stale_server_file_falls_back(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with mock.patch.dict("os.environ", {jina_ops.CACHE_DIR_ENV: tmp.name}):
+            self.assertIsNone(jina_ops._connect_server())
+            jina_ops._write_server_file(
+                jina_ops._server_file(),
+                {"host": "127.0.0.1", "port": 9, "pid": os.getpid(), "token": "x"},
+            )
+            self.assertIsNone(jina_ops._connect_server())
+
+    def test_live_pid_with_foreign_port_falls_back(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            return 200, {"Content-Type": "text/html"}, b"<html>not jina_ops</html>"
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with _StubUpstream(respond) as stub, mock.patch.dict("os.environ", {jina_ops.CACHE_DIR_ENV: tmp.name}):
+            host, port = stub.server.server_address[:2]
+            jina_ops._write_server_file(
+                jina_ops._server_file(),
+                {"host": host, "port": port, "pid": os.getpid(), "token": "x"},
+            )
+            self.assertIsNone(jina_ops._connect_server())
+            self.assertEqual(len(stub.requests), 1)
+
+    def test_local_cache_and_rate_settings_are_not_forwarded(self) -> None:
+        parser = jina_ops._build_parser()
+        self.assertTrue(jina_ops._should_forward(parser.parse_args(["read-url", "--url", "https://a.test/"])))
+        for extra in (
+            ["--cache-ttl", "60"],
+            ["--negative-ttl", "0"],
+            ["--cache-max-entries", "10"],
+            ["--cache-max-age", "60"],
+        ):
+            args = parser.parse_args(["read-url", "--url", "https://a.test/", *extra])
+            self.assertFalse(jina_ops._should_forward(args), extra)
+        args = parser.parse_args(["search-bibtex", "--query", "q", "--search-cache-ttl", "0"])
+        self.assertFalse(jina_ops._should_forward(args))
+        args = parser.parse_args(["--rate-limit", "2", "read-url", "--url", "https://a.test/"])
+        self.assertFalse(jina_ops._should_forward(args))
+
+
+class StartupBudgetTest(unittest.TestCase):
+    def test_import_stays_lazy(self) -> None:
+        bench = _load_module("bench_jina_ops")
+        report = bench.measure_startup(runs=1)
+        self.assertEqual(report["heavyModules"], [])
+
+    # Wall-clock budgets are flaky on loaded machines; `bench_jina_ops.py startup` enforces them.
+    @unittest.skipUnless(os.environ.get("JINA_OPS_TIMING_TESTS"), "set JINA_OPS_TIMING_TESTS=1 to check the ms budget")
+    def test_import_within_budget(self) -> None:
+        bench = _load_module("bench_jina_ops")
+        report = bench.measure_startup(runs=3)
+        self.assertLessEqual(report["importMs"]["min"], bench.STARTUP_BUDGET_MS)
+
+
+class CrawlTest(unittest.TestCase):
+    SITE = {
+        "https://a.test/": ["/x", "https://a.test/y#top", "https://b.test/", "mailto:me@a.test"],
+        "https://a.test/x": ["https://a.test/y", "https://a.test/deep"],
+        "https://a.test/y": ["https://a.test/"],
+        "https://a.test/deep": ["https://a.test/deeper"],
+    }
+
+    def _fetch(self, url: str) -> dict:
+        if url not in self.SITE:
+            raise jina_ops.JinaOpsError(f"HTTP 404 for {url}", status=404)
+        return {"url": url, "links": [{"anchorText": "", "url": link} for link in self.SITE[url]]}
+
+    def _crawl(self, **kwargs) -> list[dict]:
+        options = {"max_depth": 1, "max_pages": 20, "same_origin": True}
+        options.update(kwargs)
+        return list(jina_ops._crawl(["a.test"], self._fetch, **options))
+
+    def test_breadth_first_within_depth_and_origin(self) -> None:
+        records = self._crawl()
+        pages = {record["url"]: record for record in records if record["type"] == "page"}
+        self.assertEqual(set(pages), {"https://a.test/", "https://a.test/x", "https://a.test/y"})
+        self.assertEqual(pages["https://a.test/x"]["depth"], 1)
+        self.assertEqual(pages["https://a.test/x"]["parent"], "https://a.test/")
+        self.assertEqual(records[-1], {"type": "summary", "pages": 3, "succeeded": 3, "failed": 0})
+
+    def test_page_budget_and_globs(self) -> None:
+        records = self._crawl(max_depth=5, max_pages=3, exclude=["*/y"])
+        urls = [record["url"] for record in records if record["type"] == "page"]
+        self.assertEqual(len(urls), 3)
+        self.assertNotIn("https://a.test/y", urls)
+
+    def test_failed_pages_are_reported_not_raised(self) -> None:
+        records = self._crawl(max_depth=3, same_origin=False)
+        failures = [record["url"] for record in records if record["type"] == "page" and not record["success"]]
+        self.assertEqual(sorted(failures), ["https://a.test/deeper", "https://b.test/"])
+
+
+class MultiQuerySearchTest(unittest.TestCase):
+    def test_hits_are_merged_across_queries(self) -> None:
+        outcomes = [
+            ("q1", {"results": [
+                {"url": "https://arxiv.org/abs/1706.03762v5", "title": "Attention"},
+                {"url": "https://example.com/a/", "title": "A"},
+            ]}),
+            ("q2", {"results": [
+                {"url": "https://arxiv.org/pdf/1706.03762", "title": "Attention (pdf)"},
+            ]}),
+            ("q3", jina_ops.JinaOpsError("HTTP 429 Too Many Requests", status=429)),
+        ]
+        merged = jina_ops._merge_search_results("arxiv", outcomes)
+        self.assertEqual(len(merged["results"]), 2)
+        self.assertEqual(merged["results"][0]["matchedQueries"], ["q1", "q2"])
+        self.assertEqual(merged["queries"]["q1"], {"count": 2, "results": [0, 1]})
+        self.assertEqual(merged["queries"]["q2"], {"count": 1, "results": [0]})
+        self.assertIn("429", merged["queries"]["q3"]["error"])
+
+    def test_search_many_runs_queries_concurrently(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            body = json.dumps({"results": [{"url": "https://arxiv.org/abs/2101.00001", "title": "Shared"}]})
+            return 200, {"Content-Type": "application/json"}, body.encode("utf-8")
+
+        with _StubUpstream(respond) as stub, mock.patch.object(jina_ops, "SVIP_JINA_API", stub.url), \
+                mock.patch.dict("os.environ", {"JINA_API_KEY": "test"}), \
+                jina_ops.JinaClient(cache=False) as client:
+            merged = client.search_many(["a", "b", "a"], domain="arxiv", num=5)
+
+        self.assertEqual(len(stub.requests), 2)
+        self.assertEqual(len(merged["results"]), 1)
+        self.assertEqual(merged["results"][0]["matchedQueries"], ["a", "b"])
+
+
+class PaginationTest(unittest.TestCase):
+    @staticmethod
+    def _entry(index: int) -> dict:
+        title = f"Paper{index} on topic {index}"
+        return {"title": title, "year": 2020, "key": f"paper{index}2020", "doi": f"10.1/{index}"}
+
+    def test_small_requests_stay_single_page(self) -> None:
+        calls: list[tuple[int, int]] = []
+
+        def fetch_page(offset: int, limit: int) -> tuple[list[dict], int, int | None]:
+            calls.append((offset, limit))
+            return [self._entry(i) for i in range(limit)], limit, 5000
+
+        entries, complete = jina_ops._collect_pages(fetch_page, num=10, max_results=1000)
+        self.assertEqual(calls, [(0, 20)])
+        self.assertEqual(len(entries), 10)
+
+    def test_pages_are_fetched_concurrently_and_stop_early(self) -> None:
+        calls: list[tuple[int, int]] = []
+        lock = threading.Lock()
+
+        def fetch_page(offset: int, limit: int) -> tuple[list[dict], int, int | None]:
+            with lock:
+                calls.append((offset, limit))
+            # Every other hit duplicates the previous one (same DOI).
+            return [self._entry((offset + i) // 2) for i in range(limit)], limit, 5000
+
+        entries, complete = jina_ops._collect_pages(fetch_page, num=250, max_results=1000)
+        self.assertEqual(len(jina_ops._deduplicate_bibtex(entries)), 250)
+        offsets = sorted(offset for offset, _limit in calls)
+        self.assertEqual(offsets[:5], [0, 100, 200, 300, 400])
+        # 500 candidates hold the 250 unique entries; the window never goes past 4 pages ahead.
+        self.assertLessEqual(max(offsets), 800)
+
+    def test_total_caps_page_requests(self) -> None:
+        calls: list[tuple[int, int]] = []
+
+        def fetch_page(offset: int, limit: int) -> tuple[list[dict], int, int | None]:
+            calls.append((offset, limit))
+            hits = min(limit, 150 - offset)
+            return [self._entry(offset + i) for i in range(hits)], hits, 150
+
+        entries, complete = jina_ops._collect_pages(fetch_page, num=200, max_results=1000)
+        self.assertEqual(sorted(calls), [(0, 100), (100, 50)])
+        self.assertEqual(len(entries), 150)
+        self.assertTrue(complete)
+
+    def test_fully_filtered_page_does_not_end_the_search(self) -> None:
+        calls: list[int] = []
+        lock = threading.Lock()
+
+        def fetch_page(offset: int, limit: int) -> tuple[list[dict], int, int | None]:
+            with lock:
+                calls.append(offset)
+            # The --year filter dropped every hit of the page at offset 100.
+            entries = [] if offset == 100 else [self._entry(offset + i) for i in range(limit)]
+            return entries, limit, 1000
+
+        entries, complete = jina_ops._collect_pages(fetch_page, num=300, max_results=1000)
+        self.assertEqual(len(entries), 300)
+        self.assertIn(300, calls)
+        self.assertTrue(complete)
+
+    def test_failed_later_page_returns_incomplete_prefix(self) -> None:
+        def fetch_page(offset: int, limit: int) -> tuple[list[dict], int, int | None]:
+            if offset == 200:
+                raise jina_ops.JinaOpsError("page failed", status=503)
+            return [self._entry(offset + i) for i in range(limit)], limit, 1000
+
+        entries, complete = jina_ops._collect_pages(fetch_page, num=300, max_results=1000)
+        self.assertEqual(len(entries), 200)
+        self.assertFalse(complete)
+
+
+class EnrichBibtexTest(unittest.TestCase):
+    def test_paper_ids_are_normalized(self) -> None:
+        cases = {
+            "10.1145/3065386": "DOI:10.1145/3065386",
+            "https://doi.org/10.1145/ABC": "DOI:10.1145/abc",
+            "arXiv:1706.03762v5": "ARXIV:1706.03762",
+            "https://arxiv.org/pdf/2101.00001v2.pdf": "ARXIV:2101.00001",
+            "hep-th/9901001": "ARXIV:hep-th/9901001",
+            "not an id": None,
+        }
+        for text, expected in cases.items():
+            self.assertEqual(jina_ops._semantic_scholar_paper_id(text), expected, text)
+
+    def test_ids_are_resolved_in_batches(self) -> None:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            ids = json.loads(stub.bodies[-1])["ids"]
+            papers = [
+                None if paper_id.endswith("missing") else {
+                    "paperId": paper_id,
+                    "title": f"Paper {paper_id}",
+                    "year": 2020,
+                    "externalIds": {"DOI": paper_id[4:]} if paper_id.startswith("DOI:") else {},
+                }
+                for paper_id in ids
+            ]
+            return 200, {"Content-Type": "application/json"}, json.dumps(papers).encode("utf-8")
+
+        ids = [f"10.1000/{index}" for index in range(5)] + [
+            "10.1000/missing",
+            "arXiv:1706.03762",
+            "https://arxiv.org/abs/1706.03762v5",
+            "bogus",
+        ]
+        with _StubUpstream(respond) as stub, \
+                mock.patch.object(jina_ops, "SEMANTIC_SCHOLAR_BATCH_API", stub.url):
+            payload = jina_ops._enrich_bibtex(ids, timeout=5, batch_size=3)
+
+        self.assertEqual([len(json.loads(body)["ids"]) for body in stub.bodies], [3, 3, 1])
+        self.assertEqual(payload["count"], 6)
+        self.assertEqual(payload["results"][0]["id"], "10.1000/0")
+        self.assertIn("doi = {10.1000/0}", payload["results"][0]["bibtex"])
+        self.assertEqual(payload["notFound"], ["10.1000/missing"])
+        self.assertEqual(payload["invalid"], ["bogus"])
+
+
+class BibExportTest(unittest.TestCase):
+    def test_colliding_keys_get_suffixes(self) -> None:
+        entries = [
+            jina_ops.BibEntry(title="Attention is all you need", year=2017, doi="10.1/a"),
+            {"title": "Attention maps", "year": 2017, "doi": "10.1/b", "key": "attention2017"},
+            jina_ops.BibEntry(title="Attention again", year=2017),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "refs.bib"
+            with jina_ops._BibExporter(path) as exporter:
+                for entry in entries:
+                    exporter.add(entry)
+            text = path.read_text(encoding="utf-8")
+        self.assertEqual(exporter.written, ["attention2017", "attention2017a", "attention2017b"])
+        self.assertIn("@misc{attention2017a,", text)
+        self.assertEqual(text.count("@misc{"), 3)
+
+    def test_append_indexes_existing_keys_and_ids_once(self) -> None:
+        existing = (
+            "@string{nips = {NeurIPS}}\n"
+            "@article{attention2017,\n  title = {Old},\n  doi = {10.1/A}\n}\n"
+            "@misc{bert2019,\n  title = {BERT},\n  eprint = {1810.04805}\n}"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "refs.bib"
+            path.write_text(existing, encoding="utf-8")
+            with jina_ops._BibExporter(path, append=True) as exporter:
+                known_doi = jina_ops.BibEntry(title="Attention", year=2017, doi="https://doi.org/10.1/a")
+                known_eprint = jina_ops.BibEntry(title="BERT", year=2019, arxiv_id="1810.04805v2")
+                self.assertFalse(exporter.add(known_doi))
+                self.assertFalse(exporter.add(known_eprint))
+                self.assertTrue(exporter.add(jina_ops.BibEntry(title="Attention heads", year=2017, doi="10.1/c")))
+            text = path.read_text(encoding="utf-8")
+        self.assertEqual(exporter.written, ["attention2017a"])
+        self.assertEqual(exporter.skipped, ["attention2017", "bert2019"])
+        self.assertTrue(text.startswith(existing + "\n@misc{attention2017a,"))
+
+
+class CitationGraphTest(unittest.TestCase):
+    @staticmethod
+    def _paper(paper_id: str, doi: str | None = None, title: str | None = None) -> dict:
+        return {
+            "paperId": paper_id,
+            "title": title or f"{paper_id} study",
+            "year": 2020,
+            "externalIds": {"DOI": doi} if doi else {},
+        }
+
+    def test_expansion_merges_nodes_and_orients_edges(self) -> None:
+        links = {
+            ("A", "references"): [self._paper("B", "10.1/b"), self._paper("C")],
+            ("A", "citations"): [self._paper("D")],
+            # Same DOI as B under another paperId: one node.
+            ("B", "references"): [self._paper("B2", "10.1/B", "B other"), self._paper("A", "10.1/a")],
+        }
+        calls: list[tuple[str, str]] = []
+
+        def fetch(paper_id: str, direction: str) -> list:
+            calls.append((paper_id, direction))
+            return links.get((paper_id, direction), [])
+
+        graph = jina_ops._expand_citation_graph(
+            [self._paper("A", "10.1/a")],
+            fetch,
+            max_depth=2,
+            max_nodes=10,
+        )
+        self.assertEqual([node["id"] for node in graph["nodes"]], ["A", "B", "C", "D"])
+        self.assertEqual([node["depth"] for node in graph["nodes"]], [0, 1, 1, 1])
+        self.assertIn("@article{a2020,", graph["nodes"][0]["bibtex"])
+        self.assertEqual(
+            graph["edges"],
+            [{"citing": "A", "cited": "B"}, {"citing": "A", "cited": "C"}, {"citing": "B", "cited": "A"},
+             {"citing": "D", "cited": "A"}],
+        )
+        self.assertEqual(len(calls), 8)  # A plus its three neighbours, both directions
+        self.assertFalse(graph["truncated"])
+
+    def test_node_budget_truncates_and_errors_are_reported(self) -> None:
+        def fetch(paper_id: str, direction: str) -> list:
+            if direction == "citations":
+                raise jina_ops.JinaOpsError("HTTP 429 Too Many Requests", status=429)
+            return [self._paper(f"{paper_id}{index}", title=f"Survey {paper_id}{index}") for index in range(5)]
+
+        graph = jina_ops._expand_citation_graph(
+            [self._paper("S")],
+            fetch,
+            max_depth=3,
+            max_nodes=4,
+            concurrency=2,
+        )
+        self.assertEqual(len(graph["nodes"]), 4)
+        self.assertTrue(graph["truncated"])
+        self.assertEqual(
+            sorted(node["key"] for node in graph["nodes"]),
+            ["s2020", "survey2020", "survey2020a", "survey2020b"],
+        )
+        self.assertTrue(all("429" in error["error"] for error in graph["errors"]))
+
+
+
+class MockUpstreamTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mock_upstream = _load_module("mock_upstream")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, {jina_ops.CACHE_DIR_ENV: tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _patched(self, mock_server) -> contextlib.ExitStack:
+        stack = contextlib.ExitStack()
+        for name, value in {
+            "R_JINA_API": f"{mock_server.url}r/",
+            "DBLP_API": f"{mock_server.url}dblp/search/publ/api",
+            "SEMANTIC_SCHOLAR_API": f"{mock_server.url}s2/graph/v1/paper/search",
+        }.items():
+            stack.enter_context(mock.patch.object(jina_ops, name, value))
+        return stack
+
+    def test_read_and_search_bibtex_against_mock(self) -> None:
+        with self.mock_upstream.MockUpstream(page_bytes=5000) as server, self._patched(server), \
+                jina_ops.JinaClient(cache=False) as client:
+            page = client.read_url("https://example.com/doc", max_chars=2000)
+            entries = client.search_bibtex("graph", num=150)
+
+        self.assertEqual(page["contentChars"], 5000)
+        self.assertTrue(page["content"].startswith("# https://example.com/doc"))
+        self.assertEqual(len(entries), 150)
+        self.assertEqual(server.counts["read"], 1)
+        # 150 results need more than one 100-hit page from each source.
+        self.assertGreaterEqual(server.counts["dblp"], 2)
+        self.assertGreaterEqual(server.counts["s2_search"], 2)
+
+    def test_error_rate_and_endpoint_overrides(self) -> None:
+        with self.mock_upstream.MockUpstream(error_rate=1.0) as server:
+            env = server.env()
+            with self._patched(server), jina_ops.JinaClient(cache=False) as client, \
+                    self.assertRaises(jina_ops.JinaOpsError) as caught:
+                client.read_url("https://example.com/")
+        self.assertEqual(caught.exception.status, 503)
+
+        # Endpoints are resolved at import time.
+        spec = importlib.util.spec_from_file_location("jina_ops_env", jina_ops.__file__)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(os.environ, env):
+            spec.loader.exec_module(module)  # type: ignore[attr-defined]
+        self.assertEqual(module.R_JINA_API, env["JINA_OPS_R_JINA_API"])
+        self.assertEqual(module.SEMANTIC_SCHOLAR_BATCH_API, f"{server.url}s2/graph/v1/paper/batch")
+
+    def test_run_load_reports_percentiles_and_errors(self) -> None:
+        bench = _load_module("bench_jina_ops")
+
+        def call(index: int) -> None:
+            if index % 10 == 0:
+                raise jina_ops.JinaOpsError("boom")
+
+        report = bench.run_load(call, requests=50, concurrency=4)
+        self.assertEqual(report["errors"], 5)
+        self.assertEqual(set(report["latencyMs"]), {"p50", "p95", "p99", "max"})
+        self.assertLessEqual(report["latencyMs"]["p50"], report["latencyMs"]["p99"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Shared SKILL.md frontmatter reader/writer for ok-skill-creator scripts.
+
+Also parses agents/openai.yaml, which uses the same flat YAML subset.
+
+- Reads only up to the closing `---` when the body is not needed
+- Reports parse errors with 1-based line numbers
+- `dump_frontmatter` output parses back to the same mapping
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+SKILL_MD_NAMES = ("SKILL.md", "skill.md")
+FRONTMATTER_DELIMITER = "---"
+NESTED_MAPPING_KEYS = frozenset({"metadata"})
+OPENAI_YAML_PATH = "agents/openai.yaml"
+OPENAI_YAML_SECTIONS = frozenset({"interface", "policy"})
+
+
+class FrontmatterError(ValueError):
+    """Frontmatter parse error with an optional 1-based line number."""
+
+    def __init__(self, message: str, line: int | None = None) -> None:
+        self.line = line
+        super().__init__(f"line {line}: {message}" if line is not None else message)
+
+
+def find_skill_md(skill_dir: Path) -> Path | None:
+    for name in SKILL_MD_NAMES:
+        candidate = skill_dir / name
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def unescape_double_quoted(text: str) -> str:
+    out: list[str] = []
+    chars = iter(text)
+    for ch in chars:
+        if ch != "\\":
+            out.append(ch)
+            continue
+        nxt = next(chars, "")
+        if nxt == "n":
+            out.append("\n")
+        elif nxt in ('"', "\\"):
+            out.append(nxt)
+        else:
+            out.append("\\" + nxt)
+    return "".join(out)
+
+
+def parse_scalar(value: str) -> object:
+    v = value.strip()
+    if not v:
+        return ""
+
+    if len(v) >= 2 and v.startswith('"') and v.endswith('"'):
+        return unescape_double_quoted(v[1:-1])
+    if len(v) >= 2 and v.startswith("'") and v.endswith("'"):
+        return v[1:-1]
+
+    lower = v.lower()
+    if lower == "true":
+        return True
+    if lower == "false":
+        return False
+
+    try:
+        if "." in v:
+            return float(v)
+        return int(v)
+    except ValueError:
+        return v
+
+
+def parse_mapping_lines(
+    lines: Iterable[tuple[int, str]],
+    nested_keys: set[str] | frozenset[str] = NESTED_MAPPING_KEYS,
+) -> dict:
+    """Parse numbered frontmatter lines into a mapping (one nesting level)."""
+    data: dict[str, object] = {}
+    current_parent: str | None = None
+
+    for lineno, raw_line in lines:
+        line = raw_line.rstrip()
+        if not line or line.lstrip().startswith("#"):
+            continue
+
+        if line.startswith("  "):
+            if current_parent not in nested_keys:
+                raise FrontmatterError(f"Unsupported nested field format: {raw_line}", lineno)
+            nested = line[2:]
+            if ":" not in nested:
+                raise FrontmatterError(f"Invalid nested mapping line: {raw_line}", lineno)
+            key, value = nested.split(":", 1)
+            key = key.strip()
+            if not key:
+                raise FrontmatterError(f"Empty nested key in line: {raw_line}", lineno)
+            parent = data.setdefault(current_parent, {})
+            if not isinstance(parent, dict):
+                raise FrontmatterError(f"{current_parent} must be a mapping", lineno)
+            parent[key] = parse_scalar(value)
+            continue
+
+        if ":" not in line:
+            raise FrontmatterError(f"Invalid frontmatter line: {raw_line}", lineno)
+
+        key, value = line.split(":", 1)
+        key = key.strip()
+        if not key:
+            raise FrontmatterError(f"Empty key in line: {raw_line}", lineno)
+
+        parsed_value = parse_scalar(value)
+        data[key] = parsed_value
+        current_parent = key if parsed_value == "" else None
+        if key in nested_keys and parsed_value == "":
+            data[key] = {}
+
+    return data
+
+
+def parse_simple_yaml_mapping(
+    text: str,
+    nested_keys: set[str] | frozenset[str] = NESTED_MAPPING_KEYS,
+) -> dict:
+    return parse_mapping_lines(enumerate(text.splitlines(), start=1), nested_keys)
+
+
+def parse_openai_yaml(text: str) -> dict:
+    return parse_simple_yaml_mapping(text, OPENAI_YAML_SECTIONS)
+
+
+def collect_frontmatter_lines(lines: Iterator[str]) -> tuple[list[tuple[int, str]], int]:
+    """Consume lines up to the closing delimiter.
+
+    Returns the numbered frontmatter lines and the line number of the closing
+    `---`. The iterator is left positioned at the first body line.
+    """
+    first = next(lines, None)
+    if first is None or first.rstrip("\r\n") != FRONTMATTER_DELIMITER:
+        raise FrontmatterError("SKILL.md must start with YAML frontmatter (---)", 1)
+
+    collected: list[tuple[int, str]] = []
+    for lineno, raw_line in enumerate(lines, start=2):
+        stripped = raw_line.rstrip("\r\n")
+        if stripped.rstrip() == FRONTMATTER_DELIMITER:
+            return collected, lineno
+        collected.append((lineno, stripped))
+
+    raise FrontmatterError(
+        "YAML frontmatter is not properly closed with ---",
+        collected[-1][0] if collected else 1,
+    )
+
+
+def parse_frontmatter(content: str) -> tuple[dict, str]:
+    lines = iter(content.splitlines(keepends=True))
+    numbered, _closing_line = collect_frontmatter_lines(lines)
+    metadata = parse_mapping_lines(numbered)
+    body = "".join(lines).strip()
+    return metadata, body
+
+
+def read_frontmatter(skill_md: Path) -> dict:
+    """Parse frontmatter without reading the SKILL.md body."""
+    with skill_md.open(encoding="utf-8") as handle:
+        numbered, _closing_line = collect_frontmatter_lines(iter(handle))
+    return parse_mapping_lines(numbered)
+
+
+def read_skill_frontmatter(skill_dir: Path) -> dict:
+    skill_md = find_skill_md(skill_dir)
+    if skill_md is None:
+        raise FrontmatterError(f"Missing SKILL.md (or skill.md) in {skill_dir}")
+    return read_frontmatter(skill_md)
+
+
+def yaml_scalar(value: object) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    text = str(value)
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f"\"{escaped}\""
+
+
+def dump_frontmatter(frontmatter: dict) -> str:
+    lines: list[str] = []
+
+    for key, value in frontmatter.items():
+        if isinstance(value, dict):
+            lines.append(f"{key}:")
+            for nested_key, nested_value in value.items():
+                lines.append(f"  {nested_key}: {yaml_scalar(nested_value)}")
+        else:
+            lines.append(f"{key}: {yaml_scalar(value)}")
+
+    return "\n".join(lines)
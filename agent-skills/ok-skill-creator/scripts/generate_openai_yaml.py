@@ -4,9 +4,16 @@
 from __future__ import annotations
 
 import argparse
-import re
 from pathlib import Path
 
+from frontmatter import (
+    OPENAI_YAML_PATH,
+    find_skill_md,
+    parse_openai_yaml,
+    read_skill_frontmatter,
+)
+from skill_index import default_skills_root, refresh_root_index, refresh_skill_index
+
 ALLOWED_INTERFACE_KEYS = {
     "display_name",
     "short_description",
@@ -43,25 +50,9 @@ def default_prompt(skill_name: str, display_name: str) -> str:
 
 
 def read_frontmatter_name(skill_dir: Path) -> str:
-    for name in ("SKILL.md", "skill.md"):
-        skill_md = skill_dir / name
-        if not skill_md.exists():
-            continue
-
-        content = skill_md.read_text(encoding="utf-8")
-        match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-        if not match:
-            continue
-
-        for line in match.group(1).splitlines():
-            raw = line.rstrip()
-            if not raw or raw.startswith("#") or raw.startswith(" "):
-                continue
-            if not raw.startswith("name:"):
-                continue
-            skill_name = raw.split(":", 1)[1].strip().strip('"').strip("'")
-            if skill_name:
-                return skill_name
+    skill_name = read_skill_frontmatter(skill_dir).get("name")
+    if isinstance(skill_name, str) and skill_name.strip():
+        return skill_name.strip()
 
     raise ValueError(f"Failed to read skill name from {skill_dir}")
 
@@ -81,14 +72,11 @@ def parse_interface_overrides(raw_overrides: list[str]) -> dict[str, str]:
     return overrides
 
 
-def write_openai_yaml(
-    skill_dir: Path,
+def render_openai_yaml(
     skill_name: str,
-    raw_overrides: list[str],
+    overrides: dict[str, str],
     allow_implicit_invocation: str | None = None,
-) -> Path:
-    overrides = parse_interface_overrides(raw_overrides)
-
+) -> str:
     display_name = overrides.get("display_name") or format_display_name(skill_name)
     short_description = overrides.get("short_description") or default_short_description(display_name)
     prompt = overrides.get("default_prompt") or default_prompt(skill_name, display_name)
@@ -119,16 +107,125 @@ def write_openai_yaml(
         lines.append("policy:")
         lines.append(f"  allow_implicit_invocation: {flag}")
 
-    agents_dir = skill_dir / "agents"
-    agents_dir.mkdir(parents=True, exist_ok=True)
-    output = agents_dir / "openai.yaml"
-    output.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return "\n".join(lines) + "\n"
+
+
+def write_if_changed(output: Path, content: str) -> bool:
+    """Write content unless the file already holds the same bytes."""
+    encoded = content.encode("utf-8")
+    try:
+        if output.read_bytes() == encoded:
+            return False
+    except FileNotFoundError:
+        pass
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(encoded)
+    return True
+
+
+def sync_openai_yaml(
+    skill_dir: Path,
+    skill_name: str,
+    overrides: dict[str, str],
+    allow_implicit_invocation: str | None = None,
+) -> tuple[Path, bool]:
+    content = render_openai_yaml(skill_name, overrides, allow_implicit_invocation)
+    output = skill_dir / OPENAI_YAML_PATH
+    return output, write_if_changed(output, content)
+
+
+def write_openai_yaml(
+    skill_dir: Path,
+    skill_name: str,
+    raw_overrides: list[str],
+    allow_implicit_invocation: str | None = None,
+) -> Path:
+    overrides = parse_interface_overrides(raw_overrides)
+    output, _changed = sync_openai_yaml(
+        skill_dir,
+        skill_name,
+        overrides,
+        allow_implicit_invocation=allow_implicit_invocation,
+    )
     return output
 
 
+def read_existing_settings(skill_dir: Path) -> tuple[dict[str, str], str | None]:
+    """Return (interface overrides, allow_implicit_invocation) from openai.yaml."""
+    path = skill_dir / OPENAI_YAML_PATH
+    if not path.is_file():
+        return {}, None
+
+    parsed = parse_openai_yaml(path.read_text(encoding="utf-8"))
+    interface = parsed.get("interface")
+    overrides: dict[str, str] = {}
+    if isinstance(interface, dict):
+        for key, value in interface.items():
+            if key in ALLOWED_INTERFACE_KEYS and isinstance(value, str):
+                overrides[key] = value
+
+    allow_implicit_invocation: str | None = None
+    policy = parsed.get("policy")
+    if isinstance(policy, dict) and "allow_implicit_invocation" in policy:
+        allow_implicit_invocation = "true" if policy["allow_implicit_invocation"] is True else "false"
+    return overrides, allow_implicit_invocation
+
+
+def regenerate_all(
+    skills_root: Path,
+    raw_overrides: list[str],
+    allow_implicit_invocation: str | None = None,
+) -> tuple[int, int, int]:
+    """Regenerate openai.yaml for every skill under skills_root.
+
+    Existing interface/policy values are kept; CLI overrides win over them.
+    Returns (changed, unchanged, failed).
+    """
+    cli_overrides = parse_interface_overrides(raw_overrides)
+    changed = unchanged = failed = 0
+
+    for skill_dir in sorted(skills_root.iterdir(), key=lambda p: p.name):
+        if skill_dir.name.startswith(".") or not skill_dir.is_dir():
+            continue
+        if find_skill_md(skill_dir) is None:
+            continue
+
+        try:
+            skill_name = read_frontmatter_name(skill_dir)
+            overrides, existing_policy = read_existing_settings(skill_dir)
+            overrides.update(cli_overrides)
+            output, was_written = sync_openai_yaml(
+                skill_dir,
+                skill_name,
+                overrides,
+                allow_implicit_invocation=allow_implicit_invocation or existing_policy,
+            )
+        except Exception as exc:  # noqa: BLE001
+            failed += 1
+            print(f"[ERROR] {skill_dir.name}: {exc}")
+            continue
+
+        if was_written:
+            changed += 1
+            print(f"[OK] Updated {output}")
+        else:
+            unchanged += 1
+
+    return changed, unchanged, failed
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate agents/openai.yaml")
-    parser.add_argument("skill_dir", help="Skill directory")
+    parser.add_argument(
+        "skill_dir",
+        nargs="?",
+        help="Skill directory (with --all: skills root, default $NIX_HOME_AGENT_SKILLS_DIR)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Regenerate openai.yaml for every skill under the skills root",
+    )
     parser.add_argument("--name", help="Skill name override")
     parser.add_argument(
         "--interface",
@@ -144,21 +241,50 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    if args.all:
+        if args.name:
+            raise SystemExit("[ERROR] --name cannot be combined with --all")
+        skills_root = (
+            Path(args.skill_dir).expanduser().resolve() if args.skill_dir else default_skills_root()
+        )
+        if not skills_root.is_dir():
+            raise SystemExit(f"[ERROR] Skills root not found: {skills_root}")
+        try:
+            changed, unchanged, failed = regenerate_all(
+                skills_root,
+                args.interface,
+                allow_implicit_invocation=args.allow_implicit_invocation,
+            )
+        except ValueError as exc:
+            raise SystemExit(f"[ERROR] {exc}") from exc
+        if changed:
+            refresh_root_index(skills_root)
+        print(f"[OK] changed={changed} unchanged={unchanged} failed={failed}")
+        return 1 if failed else 0
+
+    if not args.skill_dir:
+        raise SystemExit("[ERROR] skill_dir is required unless --all is given")
+
     skill_dir = Path(args.skill_dir).expanduser().resolve()
     if not skill_dir.exists() or not skill_dir.is_dir():
         raise SystemExit(f"[ERROR] Skill directory not found: {skill_dir}")
 
     try:
         skill_name = args.name or read_frontmatter_name(skill_dir)
-        output = write_openai_yaml(
+        output, was_written = sync_openai_yaml(
             skill_dir,
             skill_name,
-            args.interface,
+            parse_interface_overrides(args.interface),
             allow_implicit_invocation=args.allow_implicit_invocation,
         )
     except Exception as exc:  # noqa: BLE001
         raise SystemExit(f"[ERROR] {exc}") from exc
 
+    if not was_written:
+        print(f"[OK] Unchanged {output}")
+        return 0
+
+    refresh_skill_index(skill_dir)
     print(f"[OK] Created {output}")
     return 0
 
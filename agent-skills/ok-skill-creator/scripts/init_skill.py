@@ -12,7 +12,9 @@ import unicodedata
 from datetime import date
 from pathlib import Path
 
+from frontmatter import dump_frontmatter
 from generate_openai_yaml import write_openai_yaml
+from skill_index import refresh_skill_index
 
 MAX_SKILL_NAME_LENGTH = 64
 ALLOWED_RESOURCES = {"scripts", "references", "assets"}
@@ -195,31 +197,6 @@ def create_frontmatter(
     return frontmatter
 
 
-def yaml_scalar(value: object) -> str:
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if isinstance(value, (int, float)):
-        return str(value)
-
-    text = str(value)
-    escaped = text.replace("\\", "\\\\").replace('"', '\\"')
-    return f"\"{escaped}\""
-
-
-def dump_frontmatter(frontmatter: dict) -> str:
-    lines: list[str] = []
-
-    for key, value in frontmatter.items():
-        if isinstance(value, dict):
-            lines.append(f"{key}:")
-            for nested_key, nested_value in value.items():
-                lines.append(f"  {nested_key}: {yaml_scalar(nested_value)}")
-        else:
-            lines.append(f"{key}: {yaml_scalar(value)}")
-
-    return "\n".join(lines)
-
-
 def write_skill_md(skill_dir: Path, frontmatter: dict, title: str) -> Path:
     fm_text = dump_frontmatter(frontmatter).rstrip()
     body = BODY_TEMPLATE.format(title=title)
@@ -301,7 +278,7 @@ def run_quick_validate(skill_dir: Path) -> bool:
         return True
 
     result = subprocess.run(
-        [sys.executable, str(validator), str(skill_dir)],
+        [sys.executable, str(validator), "--no-index", str(skill_dir)],
         check=False,
     )
     return result.returncode == 0
@@ -429,6 +406,7 @@ def main() -> int:
     print(f"[OK] Created {skill_md}")
 
     valid = run_quick_validate(skill_dir)
+    refresh_skill_index(skill_dir, valid=valid)
     if not valid:
         print("[WARN] Validation failed. Fix issues before using this skill.")
         return 1
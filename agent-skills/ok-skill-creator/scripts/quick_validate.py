@@ -22,6 +22,9 @@ import unicodedata
 from datetime import date
 from pathlib import Path
 
+from frontmatter import find_skill_md, parse_frontmatter
+from skill_index import refresh_skill_index
+
 MAX_SKILL_NAME_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 1024
 MAX_COMPATIBILITY_LENGTH = 500
@@ -44,94 +47,6 @@ REQUIRED_BODY_HEADING_GROUPS = (
 )
 
 
-def find_skill_md(skill_dir: Path) -> Path | None:
-    for name in ("SKILL.md", "skill.md"):
-        candidate = skill_dir / name
-        if candidate.exists():
-            return candidate
-    return None
-
-
-def parse_scalar(value: str) -> object:
-    v = value.strip()
-    if not v:
-        return ""
-
-    if (v.startswith('"') and v.endswith('"')) or (v.startswith("'") and v.endswith("'")):
-        return v[1:-1]
-
-    lower = v.lower()
-    if lower == "true":
-        return True
-    if lower == "false":
-        return False
-
-    try:
-        if "." in v:
-            return float(v)
-        return int(v)
-    except ValueError:
-        return v
-
-
-def parse_simple_yaml_mapping(text: str) -> dict:
-    data: dict[str, object] = {}
-    current_parent: str | None = None
-
-    for raw_line in text.splitlines():
-        line = raw_line.rstrip()
-        if not line or line.lstrip().startswith("#"):
-            continue
-
-        if line.startswith("  "):
-            if current_parent != "metadata":
-                raise ValueError(f"Unsupported nested field format: {raw_line}")
-            nested = line[2:]
-            if ":" not in nested:
-                raise ValueError(f"Invalid nested mapping line: {raw_line}")
-            key, value = nested.split(":", 1)
-            key = key.strip()
-            if not key:
-                raise ValueError(f"Empty nested key in line: {raw_line}")
-            metadata = data.setdefault("metadata", {})
-            if not isinstance(metadata, dict):
-                raise ValueError("metadata must be a mapping")
-            metadata[key] = parse_scalar(value)
-            continue
-
-        if ":" not in line:
-            raise ValueError(f"Invalid frontmatter line: {raw_line}")
-
-        key, value = line.split(":", 1)
-        key = key.strip()
-        if not key:
-            raise ValueError(f"Empty key in line: {raw_line}")
-
-        parsed_value = parse_scalar(value)
-        data[key] = parsed_value
-        current_parent = key if parsed_value == "" else None
-        if key == "metadata" and parsed_value == "":
-            data[key] = {}
-            current_parent = "metadata"
-
-    return data
-
-
-def parse_frontmatter(content: str) -> tuple[dict, str]:
-    if not content.startswith("---"):
-        raise ValueError("SKILL.md must start with YAML frontmatter (---)")
-
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        raise ValueError("YAML frontmatter is not properly closed with ---")
-
-    frontmatter_text = parts[1]
-    body = parts[2].strip()
-
-    metadata = parse_simple_yaml_mapping(frontmatter_text)
-    return metadata, body
-
-
 def validate_name(name: object, skill_dir: Path) -> list[str]:
     errors: list[str] = []
     if not isinstance(name, str) or not name.strip():
@@ -503,6 +418,11 @@ def main() -> int:
         action="store_true",
         help="Skip optional skills-ref validation",
     )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Do not record results in the skills root index.json",
+    )
     args = parser.parse_args()
 
     had_errors = False
@@ -518,6 +438,9 @@ def main() -> int:
         else:
             print(f"[PASS] {skill_dir}")
 
+        if not args.no_index and skill_dir.is_dir():
+            refresh_skill_index(skill_dir, valid=not errors)
+
     return 1 if had_errors else 0
 
 
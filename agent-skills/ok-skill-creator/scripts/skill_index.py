@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Maintain agent-skills/index.json, a metadata index of every skill.
+
+Each entry holds parsed frontmatter, agents/openai.yaml fields, and the
+sha256/mtime/size of the files they came from. Updates are incremental:
+files whose mtime and size are unchanged are not re-read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from frontmatter import OPENAI_YAML_PATH, find_skill_md, parse_frontmatter, parse_openai_yaml
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+
+def default_skills_root() -> Path:
+    return Path(
+        os.environ.get("NIX_HOME_AGENT_SKILLS_DIR", "~/nix-home/agent-skills")
+    ).expanduser().resolve()
+
+
+def index_path(skills_root: Path) -> Path:
+    return skills_root / INDEX_FILENAME
+
+
+def load_index(skills_root: Path) -> dict:
+    path = index_path(skills_root)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        data = {"version": INDEX_VERSION, "skills": {}}
+    if not isinstance(data.get("skills"), dict):
+        data["skills"] = {}
+    return data
+
+
+def save_index(skills_root: Path, index: dict) -> bool:
+    """Write the index atomically. Returns False when the content is unchanged."""
+    path = index_path(skills_root)
+    rendered = json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    try:
+        if path.read_text(encoding="utf-8") == rendered:
+            return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(rendered, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return True
+
+
+def file_record(path: Path, previous: dict | None) -> tuple[dict, str | None]:
+    """Return (record, text). text is None when the cached record was reused."""
+    stat = path.stat()
+    if (
+        isinstance(previous, dict)
+        and previous.get("mtime_ns") == stat.st_mtime_ns
+        and previous.get("size") == stat.st_size
+    ):
+        return previous, None
+
+    raw = path.read_bytes()
+    record = {
+        "file": path.name,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+    return record, raw.decode("utf-8")
+
+
+def build_skill_entry(skill_dir: Path, previous: dict | None) -> dict | None:
+    skill_md = find_skill_md(skill_dir)
+    if skill_md is None:
+        return None
+
+    prev = previous if isinstance(previous, dict) else {}
+    entry: dict = {"path": skill_dir.name}
+
+    skill_record, skill_text = file_record(skill_md, prev.get("skill_md"))
+    entry["skill_md"] = skill_record
+    if skill_text is None:
+        for key in ("name", "description", "compatibility", "frontmatter", "error", "valid"):
+            if key in prev:
+                entry[key] = prev[key]
+    else:
+        try:
+            frontmatter, _body = parse_frontmatter(skill_text)
+        except ValueError as exc:
+            entry["error"] = str(exc)
+        else:
+            entry["frontmatter"] = frontmatter
+            for key in ("name", "description", "compatibility"):
+                if key in frontmatter:
+                    entry[key] = frontmatter[key]
+        entry["valid"] = None
+
+    openai_yaml = skill_dir / OPENAI_YAML_PATH
+    if openai_yaml.is_file():
+        yaml_record, yaml_text = file_record(openai_yaml, prev.get("openai_yaml"))
+        entry["openai_yaml"] = yaml_record
+        if yaml_text is None:
+            for key in ("interface", "policy", "openai_yaml_error"):
+                if key in prev:
+                    entry[key] = prev[key]
+        else:
+            try:
+                parsed = parse_openai_yaml(yaml_text)
+            except ValueError as exc:
+                entry["openai_yaml_error"] = str(exc)
+            else:
+                for key in ("interface", "policy"):
+                    if isinstance(parsed.get(key), dict):
+                        entry[key] = parsed[key]
+
+    return entry
+
+
+def update_skill(skill_dir: Path, valid: bool | None = None) -> bool:
+    """Refresh one skill entry in <skill_dir.parent>/index.json."""
+    skills_root = skill_dir.parent
+    index = load_index(skills_root)
+    skills = index["skills"]
+
+    entry = build_skill_entry(skill_dir, skills.get(skill_dir.name))
+    if entry is None:
+        skills.pop(skill_dir.name, None)
+    else:
+        if valid is not None:
+            entry["valid"] = valid
+        skills[skill_dir.name] = entry
+    return save_index(skills_root, index)
+
+
+def is_indexed_root(skills_root: Path) -> bool:
+    """Only the configured skills root, or a root that already has an index,
+    is recorded, so working on a scratch directory leaves no index.json behind.
+    """
+    return skills_root == default_skills_root() or index_path(skills_root).exists()
+
+
+def refresh_skill_index(skill_dir: Path, valid: bool | None = None) -> None:
+    """Best-effort single-skill index update used by the other skill tools."""
+    skills_root = skill_dir.parent
+    if not is_indexed_root(skills_root):
+        return
+    try:
+        update_skill(skill_dir, valid=valid)
+    except (OSError, UnicodeDecodeError) as exc:
+        print(f"[WARN] Failed to update {index_path(skills_root)}: {exc}")
+
+
+def refresh_root_index(skills_root: Path) -> None:
+    """Best-effort whole-root index update used after batch operations."""
+    if not is_indexed_root(skills_root):
+        return
+    try:
+        rebuild_index(skills_root)
+    except (OSError, UnicodeDecodeError) as exc:
+        print(f"[WARN] Failed to update {index_path(skills_root)}: {exc}")
+
+
+def rebuild_index(skills_root: Path) -> tuple[dict, bool]:
+    index = load_index(skills_root)
+    previous = index["skills"]
+    skills: dict[str, dict] = {}
+
+    with os.scandir(skills_root) as entries:
+        for item in sorted(entries, key=lambda e: e.name):
+            if item.name.startswith(".") or not item.is_dir():
+                continue
+            entry = build_skill_entry(Path(item.path), previous.get(item.name))
+            if entry is not None:
+                skills[item.name] = entry
+
+    index["skills"] = skills
+    return index, save_index(skills_root, index)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build or refresh agent-skills/index.json")
+    parser.add_argument(
+        "--root",
+        default=None,
+        help="Skills root (default: $NIX_HOME_AGENT_SKILLS_DIR or ~/nix-home/agent-skills)",
+    )
+    args = parser.parse_args()
+
+    skills_root = Path(args.root).expanduser().resolve() if args.root else default_skills_root()
+    if not skills_root.is_dir():
+        raise SystemExit(f"[ERROR] Skills root not found: {skills_root}")
+
+    index, changed = rebuild_index(skills_root)
+    state = "Updated" if changed else "Unchanged"
+    print(f"[OK] {state} {index_path(skills_root)} ({len(index['skills'])} skills)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,117 +1,290 @@
 #!/usr/bin/env python3
-"""Sync skills from source root into Claude/Codex/Gemini skill directories.
+"""Sync skills from source root into every registered agent skill directory.
 
 Safe behavior:
 - Link only valid skills (directory containing SKILL.md or skill.md)
 - Skip existing non-symlink targets
 - Skip symlinks that point outside source root
 - Remove stale symlinks that point inside source root but no longer exist in source
+
+Target directories come from config/sync-targets.json (override with
+$NIX_HOME_SKILL_SYNC_TARGETS or --targets). Each target root is read once
+with os.scandir and diffed against the source skills; only symlinks that
+need to be created, repointed or removed are touched. Targets are synced
+concurrently. `--dry-run` prints the plan without changing anything.
 """
 
 from __future__ import annotations
 
+import argparse
+import concurrent.futures
+import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
+from frontmatter import find_skill_md
+
+TARGETS_ENV = "NIX_HOME_SKILL_SYNC_TARGETS"
+DEFAULT_TARGETS_FILE = Path(__file__).resolve().parent.parent / "config" / "sync-targets.json"
+MAX_SYNC_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class LinkAction:
+    op: str  # create | update | remove
+    dst: str
+    src: str | None = None
+
+
+@dataclass
+class SyncPlan:
+    actions: list[LinkAction]
+    skipped: list[str]
+    unchanged: int = 0
+
 
 def resolve_dir(path: str) -> Path:
     return Path(path).expanduser().resolve()
 
 
+def load_target_roots(config_path: Path) -> list[tuple[str, Path]]:
+    """Resolve the registry into (name, root) pairs, dropping duplicate roots.
+
+    Each target is `<override_env>` if set, else `<home_env or home_default>/<subdir>`.
+    """
+    try:
+        data = json.loads(config_path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ValueError(f"sync target registry not found: {config_path}") from exc
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"sync target registry is not valid JSON: {exc}") from exc
+
+    targets = data.get("targets") if isinstance(data, dict) else None
+    if not isinstance(targets, list):
+        raise ValueError("sync target registry must contain a 'targets' list")
+
+    roots: list[tuple[str, Path]] = []
+    seen: set[Path] = set()
+    for index, target in enumerate(targets):
+        if not isinstance(target, dict):
+            raise ValueError(f"targets[{index}] must be an object")
+        name = target.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"targets[{index}].name must be a non-empty string")
+
+        override_env = target.get("override_env")
+        override = os.environ.get(override_env) if isinstance(override_env, str) else None
+        if override:
+            root = resolve_dir(override)
+        else:
+            home_default = target.get("home_default")
+            if not isinstance(home_default, str) or not home_default.strip():
+                raise ValueError(f"targets[{index}].home_default must be a non-empty string")
+            home_env = target.get("home_env")
+            home = (os.environ.get(home_env) if isinstance(home_env, str) else None) or home_default
+            subdir = target.get("subdir", "")
+            if not isinstance(subdir, str):
+                raise ValueError(f"targets[{index}].subdir must be a string")
+            root = resolve_dir(os.path.join(home, subdir))
+
+        if root in seen:
+            continue
+        seen.add(root)
+        roots.append((name.strip(), root))
+    return roots
+
+
 def has_skill_md(path: Path) -> bool:
-    return (path / "SKILL.md").exists() or (path / "skill.md").exists()
+    return find_skill_md(path) is not None
 
 
 def list_valid_skills(source_root: Path) -> dict[str, Path]:
     skills: dict[str, Path] = {}
-    if not source_root.exists():
+    try:
+        with os.scandir(source_root) as entries:
+            items = sorted(entries, key=lambda e: e.name)
+    except FileNotFoundError:
         return skills
 
-    for item in sorted(source_root.iterdir(), key=lambda p: p.name):
-        if not item.is_dir():
-            continue
+    for item in items:
         if item.name.startswith("."):
             continue
-        if not has_skill_md(item):
+        if not item.is_dir():
+            continue
+        path = Path(item.path)
+        if not has_skill_md(path):
             print(f"[skip] invalid skill (SKILL.md missing): {item.name}")
             continue
-        skills[item.name] = item.resolve()
+        skills[item.name] = path.resolve() if item.is_symlink() else path
 
     return skills
 
 
-def safe_link(src: Path, dst: Path, source_root: Path) -> None:
-    if dst.exists() and not dst.is_symlink():
-        print(f"[skip] non-symlink target exists: {dst}")
-        return
+def is_within(path: str, root: str) -> bool:
+    return path == root or path.startswith(root + os.sep)
 
-    if dst.is_symlink():
-        current_target = dst.resolve(strict=False)
-        if current_target != src and source_root not in current_target.parents and current_target != source_root:
-            print(f"[skip] external symlink: {dst} -> {current_target}")
-            return
 
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    if dst.is_symlink() or dst.exists():
-        dst.unlink()
-    dst.symlink_to(src)
-    print(f"[link] {dst} -> {src}")
+def points_into(link_target: str, root: str) -> bool:
+    """Whether a link target lies inside the (resolved) source root.
 
+    The target is checked as written and with its directories resolved, so a
+    link that reaches the source root through a symlinked path (e.g. a
+    ~/.config that points into a dotfiles checkout) is not taken for external.
+    """
+    return is_within(link_target, root) or is_within(os.path.realpath(link_target), root)
 
-def cleanup_stale_links(target_root: Path, source_root: Path, valid_names: set[str]) -> None:
-    if not target_root.exists():
-        return
 
-    for candidate in target_root.iterdir():
-        if not candidate.is_symlink():
+def scan_target(target_root: Path) -> dict[str, str | None]:
+    """Map entry name -> absolute symlink target (None for non-symlinks)."""
+    entries: dict[str, str | None] = {}
+    try:
+        with os.scandir(target_root) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    link = os.readlink(entry.path)
+                    entries[entry.name] = os.path.normpath(os.path.join(target_root, link))
+                else:
+                    entries[entry.name] = None
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def plan_target(
+    target_root: Path,
+    source_root: Path,
+    valid_skills: dict[str, Path],
+) -> SyncPlan:
+    plan = SyncPlan(actions=[], skipped=[])
+    current = scan_target(target_root)
+    root = str(source_root)
+
+    for name, src in valid_skills.items():
+        dst = str(target_root / name)
+        src_text = str(src)
+        if name not in current:
+            plan.actions.append(LinkAction("create", dst, src_text))
             continue
 
-        target = candidate.resolve(strict=False)
-        if source_root not in target.parents and target != source_root:
+        link_target = current[name]
+        if link_target is None:
+            plan.skipped.append(f"[skip] non-symlink target exists: {dst}")
+        elif link_target == src_text or os.path.realpath(link_target) == src_text:
+            plan.unchanged += 1
+        elif points_into(link_target, root):
+            plan.actions.append(LinkAction("update", dst, src_text))
+        else:
+            plan.skipped.append(f"[skip] external symlink: {dst} -> {link_target}")
+
+    for name, link_target in sorted(current.items()):
+        if link_target is None or name in valid_skills:
             continue
+        if points_into(link_target, root):
+            plan.actions.append(LinkAction("remove", str(target_root / name)))
+
+    return plan
+
+
+def apply_action(action: LinkAction) -> str:
+    if action.op == "create":
+        os.symlink(action.src, action.dst)
+        return f"[link] {action.dst} -> {action.src}"
+    if action.op == "update":
+        tmp = f"{action.dst}.sync-tmp"
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        os.symlink(action.src, tmp)
+        os.replace(tmp, action.dst)
+        return f"[link] {action.dst} -> {action.src}"
+    try:
+        os.unlink(action.dst)
+    except FileNotFoundError:
+        pass
+    return f"[cleanup] removed stale link: {action.dst}"
+
+
+def describe_action(action: LinkAction) -> str:
+    if action.op == "remove":
+        return f"[plan] remove {action.dst}"
+    return f"[plan] {action.op} {action.dst} -> {action.src}"
 
-        if candidate.name not in valid_names:
-            candidate.unlink(missing_ok=True)
-            print(f"[cleanup] removed stale link: {candidate}")
+
+def sync_target(
+    target_root: Path,
+    source_root: Path,
+    valid_skills: dict[str, Path],
+    dry_run: bool,
+) -> tuple[SyncPlan, list[str]]:
+    if not dry_run:
+        target_root.mkdir(parents=True, exist_ok=True)
+    plan = plan_target(target_root, source_root, valid_skills)
+    messages = list(plan.skipped)
+    for action in plan.actions:
+        messages.append(describe_action(action) if dry_run else apply_action(action))
+    return plan, messages
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Sync agent skills into agent skill directories")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the create/update/remove plan without touching the filesystem",
+    )
+    parser.add_argument(
+        "--targets",
+        default=os.environ.get(TARGETS_ENV, str(DEFAULT_TARGETS_FILE)),
+        help=f"Sync target registry JSON (default: ${TARGETS_ENV} or config/sync-targets.json)",
+    )
+    args = parser.parse_args()
+
     source_root = resolve_dir(
         os.environ.get("NIX_HOME_AGENT_SKILLS_DIR", "~/nix-home/agent-skills")
     )
 
-    claude_root = resolve_dir(
-        os.environ.get("CLAUDE_SKILLS_DIR", os.path.join(os.environ.get("CLAUDE_CONFIG_DIR", "~/.config/claude"), "skills"))
-    )
-    codex_root = resolve_dir(
-        os.environ.get("CODEX_SKILLS_DIR", os.path.join(os.environ.get("CODEX_HOME", "~/.config/codex"), "skills"))
-    )
-    gemini_root = resolve_dir(
-        os.environ.get(
-            "GEMINI_SKILLS_DIR",
-            os.path.join(os.environ.get("GEMINI_CLI_HOME", "~/.config/gemini"), ".gemini", "skills"),
-        )
-    )
+    try:
+        target_roots = load_target_roots(Path(args.targets).expanduser())
+    except ValueError as exc:
+        print(f"[error] {exc}")
+        return 1
 
-    source_root.mkdir(parents=True, exist_ok=True)
-    claude_root.mkdir(parents=True, exist_ok=True)
-    codex_root.mkdir(parents=True, exist_ok=True)
-    gemini_root.mkdir(parents=True, exist_ok=True)
+    if not args.dry_run:
+        source_root.mkdir(parents=True, exist_ok=True)
 
     valid_skills = list_valid_skills(source_root)
-    valid_names = set(valid_skills.keys())
-
-    for name, src in valid_skills.items():
-        safe_link(src, claude_root / name, source_root)
-        safe_link(src, codex_root / name, source_root)
-        safe_link(src, gemini_root / name, source_root)
 
-    cleanup_stale_links(claude_root, source_root, valid_names)
-    cleanup_stale_links(codex_root, source_root, valid_names)
-    cleanup_stale_links(gemini_root, source_root, valid_names)
+    totals = {"create": 0, "update": 0, "remove": 0, "unchanged": 0}
+    failed = False
+    if target_roots:
+        max_workers = min(len(target_roots), MAX_SYNC_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(sync_target, root, source_root, valid_skills, args.dry_run)
+                for _name, root in target_roots
+            ]
+            # Report in registry order so output stays deterministic.
+            for (name, root), future in zip(target_roots, futures):
+                try:
+                    plan, messages = future.result()
+                except OSError as exc:
+                    failed = True
+                    print(f"[error] {name}: {root}: {exc}")
+                    continue
+                for message in messages:
+                    print(message)
+                for action in plan.actions:
+                    totals[action.op] += 1
+                totals["unchanged"] += plan.unchanged
 
-    print("[ok] sync completed")
-    return 0
+    summary = " ".join(f"{key}={value}" for key, value in totals.items())
+    if args.dry_run:
+        print(f"[ok] dry-run plan: {summary}")
+    elif failed:
+        print(f"[error] sync finished with errors: {summary}")
+    else:
+        print(f"[ok] sync completed: {summary}")
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":